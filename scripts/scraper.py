@@ -14,6 +14,12 @@ from dotenv import load_dotenv
 from urllib.parse import urlparse
 import logging
 
+# Reuse the scraper app's yt-dlp profile, instance pool and per-video metadata cache
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'youtube-scraper-app'))
+from utils.video_metadata_cache import VideoMetadataCache
+from utils.ytdlp_pool import YoutubeDLPool
+from utils.ytdlp_profiles import metadata_only_opts, extract_metadata
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -25,6 +31,8 @@ class YouTubeScraper:
         self.db_connection = None
         self.search_term = "Automation Challenges"
         self.max_results = 20
+        self.video_cache = VideoMetadataCache()
+        self.ydl_pool = YoutubeDLPool(metadata_only_opts())
         
     def connect_database(self):
         """Connect to PostgreSQL database using credentials from .env"""
@@ -130,41 +138,28 @@ class YouTubeScraper:
             video_id = video_entry.get('id', '')
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             
-            # Get detailed video info
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'ignoreerrors': True,
+            # Served from the cache while the view count is still fresh, else extracted
+            detailed_info = self.video_cache.get_or_extract(
+                video_id, lambda: extract_metadata(self.ydl_pool.get(), video_id)
+            )
+            
+            if not detailed_info:
+                return None
+            
+            # Extract data
+            video_data = {
+                'video_id': video_id,
+                'title': detailed_info.get('title', ''),
+                'description': detailed_info.get('description', ''),
+                'view_count': detailed_info.get('view_count', 0),
+                'duration': detailed_info.get('duration', 0),
+                'channel': detailed_info.get('uploader', ''),
+                'thumbnail_url': detailed_info.get('thumbnail', ''),
+                'video_url': video_url,
+                'published_at': detailed_info.get('upload_date', ''),
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                detailed_info = ydl.extract_info(video_url, download=False)
-                
-                if not detailed_info:
-                    return None
-                
-                # Extract thumbnail URL (get highest quality)
-                thumbnails = detailed_info.get('thumbnails', [])
-                thumbnail_url = ''
-                if thumbnails:
-                    # Sort by resolution and get the highest quality
-                    thumbnails.sort(key=lambda x: x.get('height', 0) * x.get('width', 0), reverse=True)
-                    thumbnail_url = thumbnails[0].get('url', '')
-                
-                # Extract data
-                video_data = {
-                    'video_id': video_id,
-                    'title': detailed_info.get('title', ''),
-                    'description': detailed_info.get('description', ''),
-                    'view_count': detailed_info.get('view_count', 0),
-                    'duration': detailed_info.get('duration', 0),
-                    'channel': detailed_info.get('uploader', ''),
-                    'thumbnail_url': thumbnail_url,
-                    'video_url': video_url,
-                    'published_at': detailed_info.get('upload_date', ''),
-                }
-                
-                return video_data
+            return video_data
                 
         except Exception as e:
             logger.error(f"❌ Failed to extract details for video {video_entry.get('id', 'unknown')}: {e}")
@@ -266,6 +261,8 @@ class YouTubeScraper:
             return False
         
         finally:
+            self.ydl_pool.close_all()
+            
             # Close database connection
             if self.db_connection:
                 self.db_connection.close()
@@ -14,6 +14,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
 
 from scrapers.enhanced_orchestrator import EnhancedScraperOrchestrator
+from utils.cancellation import CancellationToken
 from config.database import db_manager
 from utils.logger import setup_logger as setup_logging
 
@@ -33,6 +34,11 @@ class BeautifulScrapingWorker(QThread):
         self.difficulty = difficulty
         self.max_videos = max_videos
         self.orchestrator = EnhancedScraperOrchestrator()
+        self.cancel_token = CancellationToken()
+    
+    def stop(self):
+        """Ask the scrape to stop at its next request (the thread then finishes normally)."""
+        self.cancel_token.cancel()
     
     def run(self):
         """Run the scraping operation."""
@@ -46,11 +52,14 @@ class BeautifulScrapingWorker(QThread):
                 self.tool_name, 
                 self.difficulty, 
                 self.max_videos,
-                progress_callback
+                progress_callback,
+                cancel_token=self.cancel_token
             )
             
             if success:
                 self.scraping_completed.emit(True, f"✅ Successfully scraped {self.max_videos} {self.difficulty} videos for {self.tool_name}")
+            elif self.cancel_token.cancelled:
+                self.scraping_completed.emit(False, "⏹️ Scraping stopped by user")
             else:
                 self.scraping_completed.emit(False, f"❌ Failed to scrape {self.difficulty} videos for {self.tool_name}")
                 
@@ -803,10 +812,9 @@ class BeautifulScraperGUI(QMainWindow):
     def stop_scraping(self):
         """Stop the current scraping operation."""
         if self.scraping_worker and self.scraping_worker.isRunning():
-            self.scraping_worker.terminate()
-            self.scraping_worker.wait()
-            self.add_log("⏹️ Scraping stopped by user")
-            self.scraping_finished(False, "Stopped by user")
+            self.scraping_worker.stop()
+            self.stop_scraping_button.setEnabled(False)
+            self.add_log("⏹️ Stopping after in-flight requests finish...")
     
     def update_progress(self, message, current, total):
         """Update progress display."""
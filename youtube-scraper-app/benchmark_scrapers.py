@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""Benchmarks for the scraper backends (hits the real network)."""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import logging
+import tracemalloc
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import yt_dlp
+from bs4 import BeautifulSoup
+from googleapiclient.discovery import build
+from config.settings import YOUTUBE_API_KEYS
+from config.tools_config import get_all_search_terms
+from utils.api_fields import VIDEO_DETAILS_FIELDS, VIDEO_STATS_FIELDS
+from utils.api_discovery import build_clients
+from scrapers.youtube_api_scraper import YouTubeAPIScraperFast
+from utils.ytdlp_profiles import LEGACY_OPTS, metadata_only_opts, trim_info
+from utils.yt_initial_data import extract_initial_data
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(message)s')
+
+
+def _search_video_ids(term, count):
+    """Get video IDs for a term with a cheap flat search."""
+    with yt_dlp.YoutubeDL({'quiet': True, 'extract_flat': 'in_playlist', 'ignoreerrors': True}) as ydl:
+        result = ydl.extract_info(f"ytsearch{count}:{term}", download=False) or {}
+    return [entry['id'] for entry in result.get('entries') or [] if entry and entry.get('id')]
+
+
+def _time_extractions(video_ids, ydl_opts, process):
+    """Extract every video with one YoutubeDL and return per-video latencies."""
+    latencies = []
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        for video_id in video_ids:
+            start = time.perf_counter()
+            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False, process=process)
+            trim_info(info)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _print_latencies(label, latencies):
+    print(f"  {label:<16} mean {statistics.mean(latencies) * 1000:8.1f}ms   "
+          f"median {statistics.median(latencies) * 1000:8.1f}ms   "
+          f"max {max(latencies) * 1000:8.1f}ms")
+
+
+def bench_ytdlp_profile(args):
+    """Compare per-video latency of the legacy options and the metadata-only profile."""
+    video_ids = _search_video_ids(args.term, args.count)
+    if not video_ids:
+        print("❌ No videos found for benchmark term")
+        return False
+
+    print(f"📊 Per-video extraction latency ({len(video_ids)} videos for '{args.term}')")
+
+    # Warm up both profiles so neither run pays for DNS/TLS and the player cache alone
+    _time_extractions(video_ids[:1], LEGACY_OPTS, process=True)
+    _time_extractions(video_ids[:1], metadata_only_opts(), process=False)
+
+    legacy = _time_extractions(video_ids, LEGACY_OPTS, process=True)
+    metadata_only = _time_extractions(video_ids, metadata_only_opts(), process=False)
+
+    _print_latencies('legacy', legacy)
+    _print_latencies('metadata-only', metadata_only)
+    print(f"  speedup          {statistics.mean(legacy) / statistics.mean(metadata_only):.2f}x")
+    return True
+
+
+def _live_infos(term, per_term):
+    """Fully processed info dicts for a term's videos, extracted one at a time."""
+    video_ids = _search_video_ids(term, per_term)
+    with yt_dlp.YoutubeDL(LEGACY_OPTS) as ydl:
+        for video_id in video_ids:
+            yield ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+
+
+def _recorded_infos(path):
+    """Info dicts saved by --record, decoded one at a time like live extractions."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _record_infos(infos_dir, terms, per_term):
+    """Save full info dicts of live extractions so later runs replay identical input."""
+    os.makedirs(infos_dir, exist_ok=True)
+    with yt_dlp.YoutubeDL(LEGACY_OPTS) as ydl:
+        for i, term in enumerate(terms):
+            with open(os.path.join(infos_dir, f"term_{i:03d}.jsonl"), 'w', encoding='utf-8') as f:
+                for info in _live_infos(term, per_term):
+                    if info:
+                        f.write(json.dumps(ydl.sanitize_info(info)) + '\n')
+
+
+def _hold_term(infos, trim):
+    """Keep a term's info dicts until it is done, optionally trimming each on arrival."""
+    held = []
+    for info in infos:
+        # Untrimmed entries stay resident until the whole term is done, like before
+        held.append(trim_info(info) if trim else info)
+    return len(held)
+
+
+def _memory_pass(sources, workers, trim):
+    """Run every term's source through a worker pool and return (videos, peak traced bytes)."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        videos = sum(executor.map(lambda source: _hold_term(source(), trim), sources))
+    
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return videos, peak
+
+
+def bench_memory(args):
+    """Compare peak memory of a multi-term run with and without trimming info dicts."""
+    terms = (get_all_search_terms('zapier') + get_all_search_terms('n8n'))[:args.terms]
+    if args.record:
+        _record_infos(args.infos_dir, terms[:args.record], args.per_term)
+    
+    if args.infos_dir:
+        paths = sorted(glob.glob(os.path.join(args.infos_dir, '*.jsonl')))
+        if not paths:
+            print(f"❌ No recorded info dicts in {args.infos_dir} (record some with --record N)")
+            return False
+        sources = [lambda path=path: _recorded_infos(path) for path in paths]
+        print(f"📊 Peak traced memory over {len(paths)} recorded terms ({args.workers} workers)")
+    else:
+        sources = [lambda term=term: _live_infos(term, args.per_term) for term in terms]
+        print(f"📊 Peak traced memory over {len(terms)} terms ({args.per_term} videos each, {args.workers} workers)")
+    
+    results = {}
+    for label, trim in (('untrimmed', False), ('trimmed', True)):
+        start = time.perf_counter()
+        videos, peak = _memory_pass(sources, args.workers, trim)
+        results[label] = peak
+        print(f"  {label:<16} peak {peak / 1024 / 1024:8.1f}MB   "
+              f"{videos} videos in {time.perf_counter() - start:.0f}s")
+    
+    if not results['trimmed']:
+        print("❌ Nothing was extracted")
+        return False
+    
+    print(f"  reduction        {results['untrimmed'] / results['trimmed']:.2f}x")
+    return True
+
+
+def _record_pages(pages_dir, count):
+    """Save live search result pages so later runs benchmark identical input."""
+    from scrapers.real_youtube_scraper import RealYouTubeScraper, SEARCH_URL
+    
+    scraper = RealYouTubeScraper()
+    os.makedirs(pages_dir, exist_ok=True)
+    for i, term in enumerate(get_all_search_terms('zapier')[:count]):
+        response = scraper._get(SEARCH_URL, scraper._search_params(term))
+        with open(os.path.join(pages_dir, f"search_{i:03d}.html"), 'wb') as f:
+            f.write(response.content)
+
+
+def _soup_initial_data(content):
+    """The previous path: full html.parser tree, then a scan of every <script>."""
+    soup = BeautifulSoup(content, 'html.parser')
+    for script in soup.find_all('script'):
+        if script.string and 'var ytInitialData' in script.string:
+            start = script.string.find('var ytInitialData = ') + len('var ytInitialData = ')
+            return json.JSONDecoder().raw_decode(script.string[start:])[0]
+    return None
+
+
+def bench_initial_data(args):
+    """Compare ytInitialData extraction via BeautifulSoup and the byte-scan extractor."""
+    if args.record:
+        _record_pages(args.pages_dir, args.record)
+    
+    pages = []
+    for path in sorted(glob.glob(os.path.join(args.pages_dir, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    
+    if not pages:
+        print(f"❌ No recorded pages in {args.pages_dir} (record some with --record N)")
+        return False
+    
+    size = sum(len(page) for page in pages) / len(pages)
+    print(f"📊 ytInitialData extraction over {len(pages)} recorded pages ({size / 1024:.0f}KB average, {args.repeat} repeats)")
+    
+    results = {}
+    for label, extract in (('beautifulsoup', _soup_initial_data), ('byte-scan', extract_initial_data)):
+        latencies = []
+        for _ in range(args.repeat):
+            for page in pages:
+                start = time.perf_counter()
+                data = extract(page)
+                latencies.append(time.perf_counter() - start)
+                if data is None:
+                    print(f"  ⚠️ {label} found no ytInitialData in a page")
+        results[label] = statistics.mean(latencies)
+        _print_latencies(label, latencies)
+    
+    print(f"  speedup          {results['beautifulsoup'] / results['byte-scan']:.1f}x")
+    return True
+
+
+def _fetch_videos_list(video_ids, part, fields):
+    """One uncached videos.list call; returns (bytes on the wire, decoded body)."""
+    params = {'part': part, 'id': ','.join(video_ids), 'key': YOUTUBE_API_KEYS[0]}
+    if fields:
+        params['fields'] = fields
+    
+    response = requests.get("https://www.googleapis.com/youtube/v3/videos", params=params,
+                            headers={'Accept-Encoding': 'gzip'}, stream=True, timeout=30)
+    response.raise_for_status()
+    wire = response.raw.read(decode_content=False)
+    if response.headers.get('Content-Encoding') == 'gzip':
+        return len(wire), zlib.decompress(wire, 16 + zlib.MAX_WBITS)
+    return len(wire), wire
+
+
+def bench_api_fields(args):
+    """Compare videos.list payload size and JSON parse time with and without field masks."""
+    if not YOUTUBE_API_KEYS:
+        print("❌ No YouTube API keys configured (YOUTUBE_API_KEY_1)")
+        return False
+    
+    # IDs come from a flat yt-dlp search so the benchmark spends no search quota
+    video_ids = _search_video_ids(args.term, args.count)
+    if not video_ids:
+        print("❌ No videos found for benchmark term")
+        return False
+    
+    chunks = [video_ids[i:i + 50] for i in range(0, len(video_ids), 50)]
+    scale = 1000 / len(video_ids)
+    print(f"📊 videos.list payloads per 1,000 videos ({len(video_ids)} videos for '{args.term}', "
+          f"{len(chunks)} quota units per variant)")
+    
+    variants = (
+        ('fast full', 'snippet,contentDetails,statistics', None),
+        ('fast masked', 'snippet,contentDetails,statistics', VIDEO_DETAILS_FIELDS),
+        ('fixed full', 'contentDetails,statistics', None),
+        ('fixed masked', 'contentDetails,statistics', VIDEO_STATS_FIELDS),
+    )
+    
+    results = {}
+    for label, part, fields in variants:
+        wire, bodies = 0, []
+        for chunk in chunks:
+            size, body = _fetch_videos_list(chunk, part, fields)
+            wire += size
+            bodies.append(body)
+        
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for body in bodies:
+                json.loads(body)
+        parse = (time.perf_counter() - start) / args.repeat
+        
+        decoded = sum(len(body) for body in bodies)
+        results[label] = (wire, decoded, parse)
+        print(f"  {label:<16} wire {wire * scale / 1024:8.1f}KB   json {decoded * scale / 1024:8.1f}KB   "
+              f"parse {parse * scale * 1000:7.2f}ms")
+    
+    for scraper in ('fast', 'fixed'):
+        full, masked = results[f'{scraper} full'], results[f'{scraper} masked']
+        print(f"  {scraper} saves     wire {(full[0] - masked[0]) * scale / 1024:8.1f}KB   "
+              f"json {(full[1] - masked[1]) * scale / 1024:8.1f}KB   "
+              f"parse {(full[2] - masked[2]) * scale * 1000:7.2f}ms")
+    return True
+
+
+def _time_startup(label, start_scraper, repeat):
+    """Time start_scraper() in fresh interpreters so per-process caches start cold (imports excluded)."""
+    latencies = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', f"import time, benchmark_scrapers as b; t = time.perf_counter(); "
+                                   f"b.{start_scraper}(); print(time.perf_counter() - t)"],
+            capture_output=True, text=True, check=True
+        )
+        latencies.append(float(result.stdout.strip().splitlines()[-1]))
+    _print_latencies(label, latencies)
+    return statistics.mean(latencies)
+
+
+def _start_per_key_build():
+    """The previous startup: build() per key, each loading and parsing the discovery document."""
+    return [build('youtube', 'v3', developerKey=api_key) for api_key in _startup_keys()]
+
+
+def _start_shared_document():
+    return build_clients(_startup_keys())
+
+
+def _start_api_scraper():
+    return YouTubeAPIScraperFast()
+
+
+def _startup_keys():
+    return YOUTUBE_API_KEYS or [f"benchmark-key-{i}" for i in range(int(os.getenv('BENCH_API_KEYS', 3)))]
+
+
+def bench_api_startup(args):
+    """Compare YouTube API client startup with per-key build() and one shared discovery document."""
+    os.environ.setdefault('BENCH_API_KEYS', str(args.keys))
+    print(f"📊 YouTube API client startup ({len(_startup_keys())} keys, {args.repeat} cold starts)")
+    
+    legacy = _time_startup('per-key build', '_start_per_key_build', args.repeat)
+    shared = _time_startup('shared document', '_start_shared_document', args.repeat)
+    _time_startup('api scraper', '_start_api_scraper', args.repeat)
+    
+    print(f"  speedup          {legacy / shared:.2f}x (client construction)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    profile_parser = subparsers.add_parser('ytdlp-profile', help=bench_ytdlp_profile.__doc__)
+    profile_parser.add_argument('--term', default='zapier tutorial')
+    profile_parser.add_argument('--count', type=int, default=10)
+    profile_parser.set_defaults(func=bench_ytdlp_profile)
+
+    memory_parser = subparsers.add_parser('memory', help=bench_memory.__doc__)
+    memory_parser.add_argument('--terms', type=int, default=200)
+    memory_parser.add_argument('--per-term', type=int, default=10)
+    memory_parser.add_argument('--workers', type=int, default=3)
+    memory_parser.add_argument('--infos-dir', default=None,
+                               help='Replay info dicts recorded here instead of extracting live')
+    memory_parser.add_argument('--record', type=int, default=0, metavar='N',
+                               help='Record the info dicts of N live terms into --infos-dir first')
+    memory_parser.set_defaults(func=bench_memory)
+    
+    initial_data_parser = subparsers.add_parser('initial-data', help=bench_initial_data.__doc__)
+    initial_data_parser.add_argument('--pages-dir', default=os.path.join('.cache', 'recorded_pages'))
+    initial_data_parser.add_argument('--record', type=int, default=0, metavar='N',
+                                     help='Record N live search pages into --pages-dir first')
+    initial_data_parser.add_argument('--repeat', type=int, default=5)
+    initial_data_parser.set_defaults(func=bench_initial_data)
+    
+    api_fields_parser = subparsers.add_parser('api-fields', help=bench_api_fields.__doc__)
+    api_fields_parser.add_argument('--term', default='zapier tutorial')
+    api_fields_parser.add_argument('--count', type=int, default=200)
+    api_fields_parser.add_argument('--repeat', type=int, default=20)
+    api_fields_parser.set_defaults(func=bench_api_fields)
+    
+    api_startup_parser = subparsers.add_parser('api-startup', help=bench_api_startup.__doc__)
+    api_startup_parser.add_argument('--keys', type=int, default=3, help='Placeholder keys when none are configured')
+    api_startup_parser.add_argument('--repeat', type=int, default=5)
+    api_startup_parser.set_defaults(func=bench_api_startup)
+    
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,5 +1,6 @@
 """Clear database and start fresh scraping of REAL videos."""
 
+import argparse
 import sys
 from config.database import db_manager
 from scrapers.scraper_orchestrator import ScraperOrchestrator
@@ -33,16 +34,24 @@ def clear_database():
 
 def main():
     """Clear database and scrape REAL videos."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resume', action='store_true',
+                        help="Keep the database and continue each tool's last unfinished run")
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("CLEAR DATABASE & SCRAPE REAL YOUTUBE VIDEOS")
     print("=" * 80)
     print()
     
-    # Clear database
-    print("Clearing old videos...")
-    if not clear_database():
-        print("Failed to clear database")
-        return False
+    # Clear database (a resumed run keeps what it already inserted)
+    if args.resume:
+        print("Resuming: skipping search terms already journaled as done...")
+    else:
+        print("Clearing old videos...")
+        if not clear_database():
+            print("Failed to clear database")
+            return False
     print()
     
     # Start scraping REAL videos
@@ -70,7 +79,8 @@ def main():
         success = orchestrator.scrape_tool(
             tool,
             max_videos_per_term=15,  # 15 videos per search term (more videos!)
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            resume=args.resume
         )
         
         if not success:
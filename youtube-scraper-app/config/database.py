@@ -166,6 +166,25 @@ class DatabaseManager:
             self.return_connection(conn)
             return False
     
+    def get_scraped_video_ids(self):
+        """Get the set of video IDs already stored in scraped_videos."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        query = "SELECT video_id FROM scraped_videos"
+        
+        try:
+            cursor.execute(query)
+            video_ids = {row[0] for row in cursor.fetchall()}
+            cursor.close()
+            self.return_connection(conn)
+            return video_ids
+        except Exception as e:
+            logger.error(f"❌ Failed to get scraped video IDs: {e}")
+            cursor.close()
+            self.return_connection(conn)
+            return set()
+    
     def get_videos(self, tool=None, difficulty=None, limit=100, offset=0):
         """Retrieve videos from database."""
         conn = self.get_connection()
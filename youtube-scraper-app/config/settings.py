@@ -20,7 +20,8 @@ YOUTUBE_API_KEYS = [
     os.getenv('YOUTUBE_API_KEY_3'),
 ]
 YOUTUBE_API_KEYS = [key for key in YOUTUBE_API_KEYS if key]  # Remove None values
-YOUTUBE_API_QUOTA_LIMIT = int(os.getenv('YOUTUBE_API_QUOTA_LIMIT', 10000))
+YOUTUBE_API_QUOTA_LIMIT = int(os.getenv('YOUTUBE_API_QUOTA_LIMIT', 10000))  # units per key per Pacific-time day
+YOUTUBE_API_QUOTA_LEDGER_PATH = os.getenv('YOUTUBE_API_QUOTA_LEDGER_PATH', os.path.join('.cache', 'api_quota.sqlite3'))
 
 # Scraping Configuration
 MAX_VIDEOS_PER_TERM = int(os.getenv('MAX_VIDEOS_PER_TERM', 100))
@@ -34,11 +35,84 @@ DATE_FILTER_YEARS = int(os.getenv('DATE_FILTER_YEARS', 5))
 MIN_QUALITY_SCORE = int(os.getenv('MIN_QUALITY_SCORE', 50))
 ENABLE_AUTO_CLASSIFICATION = os.getenv('ENABLE_AUTO_CLASSIFICATION', 'true').lower() == 'true'
 ENABLE_SERIES_DETECTION = os.getenv('ENABLE_SERIES_DETECTION', 'true').lower() == 'true'
+# Difficulty scraping stops once the top-k all score at least the floor and
+# TOPK_PATIENCE finished search terms in a row haven't displaced any of them
+TOPK_QUALITY_FLOOR = float(os.getenv('TOPK_QUALITY_FLOOR', 60))
+TOPK_PATIENCE = int(os.getenv('TOPK_PATIENCE', 2))
 
 # Performance
 BATCH_INSERT_SIZE = int(os.getenv('BATCH_INSERT_SIZE', 50))
 ENABLE_PARALLEL_SCRAPING = os.getenv('ENABLE_PARALLEL_SCRAPING', 'true').lower() == 'true'
 MAX_WORKERS = int(os.getenv('MAX_WORKERS', 5))
+YTDLP_TWO_PHASE_SEARCH = os.getenv('YTDLP_TWO_PHASE_SEARCH', 'true').lower() == 'true'
+YTDLP_METADATA_ONLY = os.getenv('YTDLP_METADATA_ONLY', 'true').lower() == 'true'
+YTDLP_CACHE_DIR = os.getenv('YTDLP_CACHE_DIR', os.path.join('.cache', 'yt-dlp'))
+YTDLP_BACKEND = os.getenv('YTDLP_BACKEND', 'thread').lower()  # 'thread' or 'process'
+YTDLP_PROCESS_WORKERS = int(os.getenv('YTDLP_PROCESS_WORKERS', os.cpu_count() or 4))
+VIDEO_CACHE_PATH = os.getenv('VIDEO_CACHE_PATH', os.path.join('.cache', 'video_metadata.sqlite3'))
+VIDEO_CACHE_STATS_TTL_HOURS = float(os.getenv('VIDEO_CACHE_STATS_TTL_HOURS', 24))
+SEARCH_CACHE_PATH = os.getenv('SEARCH_CACHE_PATH', os.path.join('.cache', 'search_results.sqlite3'))
+SEARCH_CACHE_TTL_HOURS = float(os.getenv('SEARCH_CACHE_TTL_HOURS', 24))
+RUN_JOURNAL_DIR = os.getenv('RUN_JOURNAL_DIR', os.path.join('.cache', 'runs'))
+
+# Rate Limiting (requests per second shared by all workers of a backend, 0 = unlimited)
+YTDLP_RATE_LIMIT = float(os.getenv('YTDLP_RATE_LIMIT', 2.0))
+YTDLP_RATE_BURST = int(os.getenv('YTDLP_RATE_BURST', 3))
+YOUTUBE_WEB_RATE_LIMIT = float(os.getenv('YOUTUBE_WEB_RATE_LIMIT', 1.0))
+YOUTUBE_WEB_RATE_BURST = int(os.getenv('YOUTUBE_WEB_RATE_BURST', 2))
+YOUTUBE_API_RATE_LIMIT = float(os.getenv('YOUTUBE_API_RATE_LIMIT', 5.0))
+YOUTUBE_API_RATE_BURST = int(os.getenv('YOUTUBE_API_RATE_BURST', 5))
+YOUTUBE_API_KEY_RATE_LIMIT = float(os.getenv('YOUTUBE_API_KEY_RATE_LIMIT', 3.0))  # per API key, under the backend limit
+YOUTUBE_API_KEY_RATE_BURST = int(os.getenv('YOUTUBE_API_KEY_RATE_BURST', 3))
+
+# Adaptive Concurrency (AIMD: +1 while healthy, multiplicative cut on errors/429s)
+YTDLP_MIN_CONCURRENCY = int(os.getenv('YTDLP_MIN_CONCURRENCY', 1))
+YTDLP_INITIAL_CONCURRENCY = int(os.getenv('YTDLP_INITIAL_CONCURRENCY', min(MAX_WORKERS, 3)))
+YTDLP_MAX_CONCURRENCY = int(os.getenv('YTDLP_MAX_CONCURRENCY', 8))
+YOUTUBE_WEB_MIN_CONCURRENCY = int(os.getenv('YOUTUBE_WEB_MIN_CONCURRENCY', 1))
+YOUTUBE_WEB_INITIAL_CONCURRENCY = int(os.getenv('YOUTUBE_WEB_INITIAL_CONCURRENCY', 2))
+YOUTUBE_WEB_MAX_CONCURRENCY = int(os.getenv('YOUTUBE_WEB_MAX_CONCURRENCY', 6))
+YOUTUBE_API_MIN_CONCURRENCY = int(os.getenv('YOUTUBE_API_MIN_CONCURRENCY', 1))
+YOUTUBE_API_INITIAL_CONCURRENCY = int(os.getenv('YOUTUBE_API_INITIAL_CONCURRENCY', MAX_WORKERS))
+YOUTUBE_API_MAX_CONCURRENCY = int(os.getenv('YOUTUBE_API_MAX_CONCURRENCY', MAX_WORKERS * 2))
+AIMD_WINDOW = int(os.getenv('AIMD_WINDOW', 20))
+AIMD_ERROR_THRESHOLD = float(os.getenv('AIMD_ERROR_THRESHOLD', 0.1))
+AIMD_DECREASE_FACTOR = float(os.getenv('AIMD_DECREASE_FACTOR', 0.5))
+
+# Shared HTTP Client (per-host keep-alive pools sized to the widest backend; HTTP/2 needs httpx[http2])
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 10))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', max(YOUTUBE_WEB_MAX_CONCURRENCY, YOUTUBE_API_MAX_CONCURRENCY)))
+HTTP_HTTP2 = os.getenv('HTTP_HTTP2', 'false').lower() == 'true'
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', 30))
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+HTTP_CACHE_PATH = os.getenv('HTTP_CACHE_PATH', os.path.join('.cache', 'http_responses.sqlite3'))
+HTTP_CACHE_SEARCH_TTL_HOURS = float(os.getenv('HTTP_CACHE_SEARCH_TTL_HOURS', 12))
+HTTP_CACHE_VIDEOS_TTL_HOURS = float(os.getenv('HTTP_CACHE_VIDEOS_TTL_HOURS', 6))
+HTTP_CACHE_MAX_AGE_DAYS = float(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', 7))  # stale entries kept for revalidation this long
+
+# Hedged Searches (re-issue a yt-dlp search on HEDGE_BACKEND once it is slower than
+# HEDGE_PERCENTILE of the last LATENCY_WINDOW searches; empty HEDGE_BACKEND disables)
+HEDGE_BACKEND = os.getenv('HEDGE_BACKEND', '')  # youtube_web or youtube_api
+HEDGE_PERCENTILE = float(os.getenv('HEDGE_PERCENTILE', 95))
+HEDGE_MIN_SAMPLES = int(os.getenv('HEDGE_MIN_SAMPLES', 10))
+HEDGE_DEFAULT_DELAY = float(os.getenv('HEDGE_DEFAULT_DELAY', 15.0))
+LATENCY_WINDOW = int(os.getenv('LATENCY_WINDOW', 200))
+
+# Async Web Search (search pages in flight at once; YOUTUBE_WEB_RATE_LIMIT still paces them)
+WEB_ASYNC_MAX_IN_FLIGHT = int(os.getenv('WEB_ASYNC_MAX_IN_FLIGHT', 200))
+WEB_SEARCH_MAX_CONTINUATIONS = int(os.getenv('WEB_SEARCH_MAX_CONTINUATIONS', 10))  # extra result pages per term
+
+# YouTube Data API Batching (videos.list IDs from all terms are pooled into full batches;
+# a partial batch goes out once its oldest ID has waited API_VIDEOS_FLUSH_DELAY seconds)
+API_VIDEOS_BATCH_SIZE = int(os.getenv('API_VIDEOS_BATCH_SIZE', 50))  # API max is 50 IDs per call
+API_VIDEOS_FLUSH_DELAY = float(os.getenv('API_VIDEOS_FLUSH_DELAY', 2.0))
+API_BATCH_REQUESTS = os.getenv('API_BATCH_REQUESTS', 'false').lower() == 'true'  # searches as multipart batch HTTP calls
+API_BATCH_MAX_SIZE = int(os.getenv('API_BATCH_MAX_SIZE', 50))  # requests per batch, capped at the client's 1000
+API_FIELD_MASKS = os.getenv('API_FIELD_MASKS', 'true').lower() == 'true'  # fields= partial responses (utils/api_fields.py)
+
+# YouTube Data API Discovery (a <service>.<version>.json here wins over the client's bundled
+# copy; without either, the document is fetched once and saved here)
+API_DISCOVERY_CACHE_DIR = os.getenv('API_DISCOVERY_CACHE_DIR', os.path.join('.cache', 'discovery'))
 
 # Application Settings
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -13,6 +13,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QIcon
 
 from scrapers.enhanced_orchestrator import EnhancedScraperOrchestrator
+from utils.cancellation import CancellationToken
 from config.database import db_manager
 from utils.logger import setup_logger as setup_logging
 
@@ -32,6 +33,11 @@ class EnhancedScrapingWorker(QThread):
         self.difficulty = difficulty
         self.max_videos = max_videos
         self.orchestrator = EnhancedScraperOrchestrator()
+        self.cancel_token = CancellationToken()
+    
+    def stop(self):
+        """Ask the scrape to stop at its next request (the thread then finishes normally)."""
+        self.cancel_token.cancel()
     
     def run(self):
         """Run the scraping operation."""
@@ -45,11 +51,14 @@ class EnhancedScrapingWorker(QThread):
                 self.tool_name, 
                 self.difficulty, 
                 self.max_videos,
-                progress_callback
+                progress_callback,
+                cancel_token=self.cancel_token
             )
             
             if success:
                 self.scraping_completed.emit(True, f"✅ Successfully scraped {self.max_videos} {self.difficulty} videos for {self.tool_name}")
+            elif self.cancel_token.cancelled:
+                self.scraping_completed.emit(False, "⏹️ Scraping stopped by user")
             else:
                 self.scraping_completed.emit(False, f"❌ Failed to scrape {self.difficulty} videos for {self.tool_name}")
                 
@@ -407,10 +416,9 @@ class EnhancedScraperGUI(QMainWindow):
     def stop_scraping(self):
         """Stop the current scraping operation."""
         if self.scraping_worker and self.scraping_worker.isRunning():
-            self.scraping_worker.terminate()
-            self.scraping_worker.wait()
-            self.add_log("⏹️ Scraping stopped by user")
-            self.scraping_finished(False, "Stopped by user")
+            self.scraping_worker.stop()
+            self.stop_scraping_button.setEnabled(False)
+            self.add_log("⏹️ Stopping after in-flight requests finish...")
     
     def update_progress(self, message, current, total):
         """Update progress display."""
@@ -7,7 +7,9 @@ from datetime import datetime
 from typing import List, Dict, Optional, Callable
 from scrapers.enhanced_youtube_scraper import EnhancedYouTubeScraper
 from scrapers.difficulty_classifier import DifficultyClassifier
+from scrapers.prefilters import SPAM_TITLE_INDICATORS, MIN_TITLE_LENGTH
 from config.database import db_manager
+from utils.cancellation import CancellationToken
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +32,8 @@ class EnhancedScraperOrchestrator:
             'start_time': None
         }
     
-    def scrape_difficulty_specific(self, tool_name: str, difficulty: str, max_videos: int = 5, progress_callback: Optional[Callable] = None) -> bool:
+    def scrape_difficulty_specific(self, tool_name: str, difficulty: str, max_videos: int = 5, progress_callback: Optional[Callable] = None,
+                                   cancel_token: Optional[CancellationToken] = None) -> bool:
         """Scrape videos for a specific difficulty level."""
         logger.info(f"🎯 Starting {difficulty} video scraping for {tool_name}")
         self.reset_stats()
@@ -39,7 +42,11 @@ class EnhancedScraperOrchestrator:
         
         try:
             # Scrape videos for specific difficulty
-            videos = self.enhanced_scraper.scrape_for_difficulty(tool_name, difficulty, max_videos)
+            videos = self.enhanced_scraper.scrape_for_difficulty(tool_name, difficulty, max_videos, cancel_token)
+            
+            if cancel_token and cancel_token.cancelled:
+                logger.warning(f"⏹️ {difficulty} scraping for {tool_name} was cancelled")
+                return False
             
             if not videos:
                 logger.warning(f"❌ No {difficulty} videos found for {tool_name}")
@@ -67,7 +74,8 @@ class EnhancedScraperOrchestrator:
             logger.error(f"❌ Error scraping {difficulty} videos for {tool_name}: {e}")
             return False
     
-    def scrape_all_difficulties(self, tool_name: str, videos_per_difficulty: Dict[str, int] = None, progress_callback: Optional[Callable] = None) -> Dict[str, bool]:
+    def scrape_all_difficulties(self, tool_name: str, videos_per_difficulty: Dict[str, int] = None, progress_callback: Optional[Callable] = None,
+                                cancel_token: Optional[CancellationToken] = None) -> Dict[str, bool]:
         """Scrape videos for all difficulty levels."""
         if videos_per_difficulty is None:
             videos_per_difficulty = {
@@ -80,9 +88,12 @@ class EnhancedScraperOrchestrator:
         results = {}
         
         for difficulty, max_videos in videos_per_difficulty.items():
+            if cancel_token and cancel_token.cancelled:
+                break
+            
             logger.info(f"📚 Scraping {difficulty} videos ({max_videos} videos)")
             
-            success = self.scrape_difficulty_specific(tool_name, difficulty, max_videos, progress_callback)
+            success = self.scrape_difficulty_specific(tool_name, difficulty, max_videos, progress_callback, cancel_token)
             results[difficulty] = success
             
             if progress_callback:
@@ -145,13 +156,12 @@ class EnhancedScraperOrchestrator:
         
         # Check if video has meaningful content
         title = video.get('title', '')
-        if len(title) < 10:
+        if len(title) < MIN_TITLE_LENGTH:
             return False
         
-        # Check for spam indicators
-        spam_indicators = ['click here', 'subscribe now', 'free money', 'make money fast']
+        # Check for spam indicators (also run as a prefilter before extraction)
         title_lower = title.lower()
-        if any(indicator in title_lower for indicator in spam_indicators):
+        if any(indicator in title_lower for indicator in SPAM_TITLE_INDICATORS):
             return False
         
         return True
@@ -187,6 +197,20 @@ class EnhancedScraperOrchestrator:
         scraper_stats = self.enhanced_scraper.get_stats()
         logger.info(f"Unique Content Hashes: {scraper_stats['unique_content_hashes']}")
         logger.info(f"Quality Filtered: {scraper_stats['quality_filtered']}")
+        logger.info(f"Searches: {scraper_stats['searches_run']} run, {scraper_stats['searches_saved']} saved by early termination")
+        for difficulty, prefilter_stats in scraper_stats['prefilter'].items():
+            if prefilter_stats['checked']:
+                saved_by_rule = ", ".join(f"{rule} {count}" for rule, count in prefilter_stats['fetches_saved_by_rule'].items())
+                logger.info(f"Prefilter Fetches Saved ({difficulty}): {saved_by_rule}")
+        pool_stats = scraper_stats['ydl_pool']
+        logger.info(f"YoutubeDL Instances: {pool_stats['instances_created']} created, {pool_stats['instances_reused']} reused")
+        logger.info(f"YoutubeDL Setup Saved: {pool_stats['setup_ms_saved']:.0f}ms ({pool_stats['setup_ms_saved_per_term']:.1f}ms per term)")
+        cache_stats = scraper_stats['video_cache']
+        logger.info(f"Metadata Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['expired']} expired stats")
+        search_cache_stats = scraper_stats['search_cache']
+        logger.info(f"Search Cache: {search_cache_stats['hits']} hits, {search_cache_stats['misses']} misses, {search_cache_stats['expired']} expired")
+        concurrency_stats = scraper_stats['concurrency']
+        logger.info(f"Concurrency: {concurrency_stats['concurrency']} (max {concurrency_stats['max_concurrency']}), error rate {concurrency_stats['error_rate']:.1%}, {concurrency_stats['throttled']} throttled")
         
         logger.info("=" * 80)
     
@@ -8,15 +8,25 @@ Enhanced YouTube Scraper with comprehensive features.
 """
 
 import logging
-import yt_dlp
 import re
 import time
 import hashlib
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from config.settings import MAX_WORKERS
+from config.settings import YTDLP_METADATA_ONLY, TOPK_QUALITY_FLOOR, TOPK_PATIENCE
+from scrapers.prefilters import (
+    FlatEntryPrefilter, duration_rule, min_views_rule, spam_title_rule, short_title_rule
+)
+from utils.ytdlp_pool import YoutubeDLPool
+from utils.ytdlp_profiles import LEGACY_OPTS, metadata_only_opts, extract_metadata
+from utils.video_metadata_cache import VideoMetadataCache
+from utils.search_cache import SearchResultCache
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.cancellation import CancellationToken, ScrapeCancelled
+from utils.top_k import TopKVideos
 
 logger = logging.getLogger(__name__)
 
@@ -58,23 +68,42 @@ class EnhancedYouTubeScraper:
         self.duplicates_skipped = 0
         self.quality_filtered = 0
         self.content_hashes = set()  # For duplicate detection
+        self.searches_run = 0
+        self.searches_saved = 0  # Terms never searched thanks to early termination
         
-        # Enhanced yt-dlp options
-        self.ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'skip_download': True,
-            'format': 'best',
-            'socket_timeout': 30,
-            'retries': 3,
-            'fragment_retries': 3,
-            'ignoreerrors': True,
-            'no_color': True,
-            'writeinfojson': False,
-            'writesubtitles': False,
-            'writeautomaticsub': False,
-        }
+        # Enhanced yt-dlp options (metadata only, we never download)
+        self.metadata_only = YTDLP_METADATA_ONLY
+        if self.metadata_only:
+            self.ydl_opts = metadata_only_opts()
+        else:
+            self.ydl_opts = {
+                **LEGACY_OPTS,
+                'writeinfojson': False,
+                'writesubtitles': False,
+                'writeautomaticsub': False,
+            }
+        
+        # Search results are flat; each video is then served from the metadata cache
+        self.flat_ydl_opts = {**self.ydl_opts, 'extract_flat': 'in_playlist'}
+        
+        # One warm YoutubeDL per worker thread instead of one per search term
+        self._ydl_pool = YoutubeDLPool(self.ydl_opts)
+        self._flat_ydl_pool = YoutubeDLPool(self.flat_ydl_opts)
+        
+        # Trimmed info records persisted across runs, tools and difficulties
+        self.video_cache = VideoMetadataCache()
+        
+        # Flat search results, reused by every yt-dlp scraper until their TTL
+        self.search_cache = SearchResultCache()
+        
+        # Requests are paced at the source, shared with every yt-dlp scraper
+        self.rate_limiter = get_rate_limiter('ytdlp')
+        
+        # In-flight requests adapt to the observed error / 429 rate
+        self.concurrency = get_concurrency_controller('ytdlp')
+        
+        # Replaced per call; checked before every request so stop takes effect quickly
+        self.cancel_token = CancellationToken()
         
         # Quality scoring weights
         self.quality_weights = {
@@ -106,11 +135,26 @@ class EnhancedYouTubeScraper:
                 'exclude_keywords': ['beginner', 'basics', '101', 'tutorial', 'getting started']
             }
         }
+        
+        # Checks that only need flat search fields run before any detail fetch
+        self.prefilters = {
+            difficulty: FlatEntryPrefilter([
+                ('duration', duration_rule(*filter_config['duration_range'])),
+                ('min_views', min_views_rule(filter_config['min_views'])),
+                ('spam_title', spam_title_rule()),
+                ('short_title', short_title_rule()),
+            ])
+            for difficulty, filter_config in self.difficulty_filters.items()
+        }
     
-    def scrape_for_difficulty(self, tool: str, difficulty: str, max_videos: int = 5) -> List[Dict]:
+    def scrape_for_difficulty(self, tool: str, difficulty: str, max_videos: int = 5,
+                              cancel_token: Optional[CancellationToken] = None) -> List[Dict]:
         """Scrape videos for a specific difficulty level."""
         logger.info(f"🎯 Scraping {max_videos} {difficulty} videos for {tool}")
         
+        # Child token: cancelled by the caller, or by us once we have enough videos
+        self.cancel_token = CancellationToken(parent=cancel_token)
+        
         # Get difficulty-specific search terms
         search_terms = self._get_difficulty_search_terms(tool, difficulty)
         
@@ -121,30 +165,52 @@ class EnhancedYouTubeScraper:
         # Limit search terms based on max_videos needed
         search_terms = search_terms[:min(len(search_terms), max_videos * 2)]
         
-        all_videos = []
+        # Only the best max_videos are kept while results stream in
+        top_k = TopKVideos(max_videos)
+        remaining_terms = iter(search_terms)
+        searches = 0
+        stale_terms = 0  # Finished terms in a row that didn't change the top-k
         
-        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, 3)) as executor:
-            future_to_term = {
-                executor.submit(self._search_with_difficulty_filter, term, tool, difficulty): term 
-                for term in search_terms
-            }
+        with ThreadPoolExecutor(max_workers=self.concurrency.maximum) as executor:
+            pending = {}
             
-            for future in as_completed(future_to_term):
-                term = future_to_term[future]
-                try:
-                    videos = future.result()
-                    all_videos.extend(videos)
-                    
-                    # Stop if we have enough videos
-                    if len(all_videos) >= max_videos:
+            while True:
+                # Submit lazily, only as many terms as may run at once
+                while len(pending) < self.concurrency.limit:
+                    term = next(remaining_terms, None)
+                    if term is None:
                         break
-                        
-                except Exception as e:
-                    logger.error(f"❌ Failed to process '{term}': {e}")
-        
-        # Sort by quality score and take the best videos
-        all_videos.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-        selected_videos = all_videos[:max_videos]
+                    pending[executor.submit(self._search_with_difficulty_filter, term, tool, difficulty)] = term
+                    searches += 1
+                
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    term = pending.pop(future)
+                    try:
+                        entered = sum(top_k.offer(video) for video in future.result())
+                        stale_terms = 0 if entered else stale_terms + 1
+                    except Exception as e:
+                        logger.error(f"❌ Failed to process '{term}': {e}")
+                
+                if self.cancel_token.cancelled:
+                    logger.warning(f"⏹️ Scraping cancelled for {tool} - {difficulty}")
+                    break
+                
+                # Enough good videos and new terms keep failing to beat them
+                if top_k.is_full and top_k.min_score >= TOPK_QUALITY_FLOOR and stale_terms >= TOPK_PATIENCE:
+                    logger.info(f"🏁 Top {max_videos} all score ≥ {TOPK_QUALITY_FLOOR:g}, stopping after {searches}/{len(search_terms)} searches")
+                    self.cancel_token.cancel()
+                    break
+        
+        self._ydl_pool.close_all()
+        self._flat_ydl_pool.close_all()
+        self.searches_run += searches
+        self.searches_saved += len(search_terms) - searches
+        
+        selected_videos = top_k.videos()
         
         logger.info(f"✅ Selected {len(selected_videos)} high-quality {difficulty} videos for {tool}")
         return selected_videos
@@ -157,28 +223,83 @@ class EnhancedYouTubeScraper:
             search_url = f"ytsearch10:{search_term}"
             videos = []
             
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            try:
+                entries = self.search_cache.get_or_search(
+                    'ytdlp', search_term, 10,
+                    lambda: self._flat_search(search_url)
+                )
+            except ScrapeCancelled:
+                raise
+            except Exception as e:
+                logger.error(f"❌ yt-dlp error for '{search_term}': {e}")
+                return []
+            
+            prefilter = self.prefilters.get(difficulty)
+            
+            for entry in entries:
+                if prefilter and not prefilter.passes(entry):
+                    continue
+                
+                video_id = entry['id']
                 try:
-                    result = ydl.extract_info(search_url, download=False)
-                    
-                    if result and 'entries' in result:
-                        for entry in result['entries']:
-                            if entry:
-                                video_data = self._extract_enhanced_metadata(entry, search_term, tool, difficulty)
-                                if video_data and self._apply_difficulty_filter(video_data, difficulty):
-                                    videos.append(video_data)
-                    
+                    info = self.video_cache.get_or_extract(
+                        video_id,
+                        lambda: self._extract_full(video_id)
+                    )
+                except ScrapeCancelled:
+                    raise
                 except Exception as e:
-                    logger.error(f"❌ yt-dlp error for '{search_term}': {e}")
-                    return []
+                    logger.debug(f"Extraction failed for {video_id}: {e}")
+                    continue
+                
+                if info:
+                    video_data = self._extract_enhanced_metadata(info, search_term, tool, difficulty)
+                    if video_data and self._apply_difficulty_filter(video_data, difficulty):
+                        videos.append(video_data)
             
             logger.info(f"✅ Found {len(videos)} {difficulty} videos for '{search_term}'")
             return videos
             
+        except ScrapeCancelled:
+            logger.debug(f"Search cancelled for '{search_term}'")
+            return []
         except Exception as e:
             logger.error(f"❌ Search failed for '{search_term}': {e}")
             return []
     
+    def _flat_search(self, search_url: str) -> List[Dict]:
+        """Run a flat search and return its entries that have an ID."""
+        result = self._ydl_request(
+            self._flat_ydl_pool,
+            lambda ydl: ydl.extract_info(search_url, download=False)
+        )
+        return [entry for entry in (result or {}).get('entries') or [] if entry and entry.get('id')]
+    
+    def _extract_full(self, video_id: str) -> Optional[Dict]:
+        """Fully extract one video (only called on a metadata cache miss)."""
+        return self._ydl_request(
+            self._ydl_pool,
+            lambda ydl: extract_metadata(ydl, video_id, process=not self.metadata_only)
+        )
+    
+    def _ydl_request(self, pool: YoutubeDLPool, request: Callable) -> Optional[Dict]:
+        """Run one yt-dlp request under the rate limiter and adaptive concurrency limit."""
+        self.cancel_token.raise_if_cancelled()
+        ydl = pool.get()
+        
+        with self.concurrency.slot():
+            self.rate_limiter.acquire()
+            self.cancel_token.raise_if_cancelled()
+            try:
+                result = request(ydl)
+            except Exception as e:
+                self.concurrency.record(e)
+                raise
+        
+        # ignoreerrors hides failures from us, yt-dlp only reports them to its logger
+        self.concurrency.record(pool.pop_error())
+        return result
+    
     def _extract_enhanced_metadata(self, entry: Dict, search_term: str, tool: str, difficulty: str) -> Optional[Dict]:
         """Extract comprehensive video metadata."""
         try:
@@ -462,6 +583,14 @@ class EnhancedYouTubeScraper:
             'videos_found': self.videos_found,
             'duplicates_skipped': self.duplicates_skipped,
             'quality_filtered': self.quality_filtered,
+            'searches_run': self.searches_run,
+            'searches_saved': self.searches_saved,
+            'prefilter': {difficulty: prefilter.get_stats() for difficulty, prefilter in self.prefilters.items()},
             'unique_content_hashes': len(self.content_hashes),
+            'ydl_pool': self._ydl_pool.get_stats(),
+            'video_cache': self.video_cache.get_stats(),
+            'search_cache': self.search_cache.get_stats(),
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': self.concurrency.get_stats(),
             'method': 'Enhanced yt-dlp with difficulty-specific filtering'
         }
@@ -0,0 +1,95 @@
+"""Cheap prefilter rules run on flat search entries before any detail fetch."""
+
+import logging
+import threading
+from utils.counters import CountersMixin
+
+logger = logging.getLogger(__name__)
+
+# Titles that never pass EnhancedScraperOrchestrator's quality checks
+SPAM_TITLE_INDICATORS = ['click here', 'subscribe now', 'free money', 'make money fast']
+MIN_TITLE_LENGTH = 10
+
+
+def duration_rule(min_duration, max_duration):
+    """Reject entries whose duration is known and out of range."""
+    def check(entry):
+        duration = entry.get('duration')
+        return duration is None or min_duration <= duration <= max_duration
+    return check
+
+
+def min_views_rule(min_views):
+    """Reject entries whose view count is known and too low."""
+    def check(entry):
+        view_count = entry.get('view_count')
+        return view_count is None or view_count >= min_views
+    return check
+
+
+def spam_title_rule(indicators=SPAM_TITLE_INDICATORS):
+    """Reject entries with spammy titles."""
+    def check(entry):
+        title = (entry.get('title') or '').lower()
+        return not any(indicator in title for indicator in indicators)
+    return check
+
+
+def short_title_rule(min_length=MIN_TITLE_LENGTH):
+    """Reject entries whose title is known and too short to be meaningful."""
+    def check(entry):
+        title = entry.get('title')
+        return title is None or len(title) >= min_length
+    return check
+
+
+class FlatEntryPrefilter(CountersMixin):
+    """Ordered set of named rules, each counting the detail fetches it saved.
+    
+    A rule is a callable taking a flat entry and returning False to reject
+    it. Rules must pass entries whose fields are missing, so the full
+    filters still decide those after extraction.
+    """
+    
+    COUNTERS = ('checked', 'rejected')
+    
+    def __init__(self, rules=None):
+        self.rules = list(rules or [])
+        self._lock = threading.Lock()
+        
+        # Prefilter statistics
+        self.checked = 0
+        self.rejected = {name: 0 for name, _ in self.rules}
+    
+    def add_rule(self, name, check):
+        """Append a rule (rules run in the order they were added)."""
+        self.rules.append((name, check))
+        with self._lock:
+            self.rejected.setdefault(name, 0)
+    
+    def passes(self, entry):
+        """Check a flat entry; the first rule that rejects it gets the credit."""
+        rejected_by = None
+        for name, check in self.rules:
+            if not check(entry):
+                rejected_by = name
+                break
+        
+        with self._lock:
+            self.checked += 1
+            if rejected_by:
+                self.rejected[rejected_by] += 1
+        
+        if rejected_by:
+            logger.debug(f"Prefilter '{rejected_by}' rejected {entry.get('id')}")
+            return False
+        return True
+    
+    def get_stats(self):
+        """Get per-rule counts of detail fetches saved."""
+        with self._lock:
+            return {
+                'checked': self.checked,
+                'fetches_saved': sum(self.rejected.values()),
+                'fetches_saved_by_rule': dict(self.rejected),
+            }
@@ -1,28 +1,79 @@
 """Real YouTube scraper that finds actual videos."""
 
+import json
 import logging
-import requests
 from bs4 import BeautifulSoup
 import re
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from config.settings import MAX_VIDEOS_PER_TERM, MIN_VIDEO_VIEWS, MAX_WORKERS
+from config.settings import MAX_VIDEOS_PER_TERM, MIN_VIDEO_VIEWS, MAX_WORKERS, WEB_SEARCH_MAX_CONTINUATIONS
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.latency import get_latency_tracker
+from utils.http_client import get_http_client
+from utils.async_search import AsyncSearchEngine, FollowUp
+from utils.yt_initial_data import extract_initial_data, extract_innertube_config
 
 logger = logging.getLogger(__name__)
 
+SEARCH_URL = "https://www.youtube.com/results"
+
+# Internal endpoint the results page calls for more results (small JSON, no HTML)
+CONTINUATION_URL = "https://www.youtube.com/youtubei/v1/search"
+
 
 class RealYouTubeScraper:
     """Real YouTube scraper that finds actual videos."""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Pooled keep-alive connections shared with every other scraper
+        self.http = get_http_client()
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        }
         self.videos_found = 0
         self.duplicates_skipped = 0
         self.max_videos_per_term = MAX_VIDEOS_PER_TERM
+        
+        # Search page requests are paced at the source, shared with YouTubeWebScraper
+        self.rate_limiter = get_rate_limiter('youtube_web')
+        
+        # In-flight requests adapt to the observed error / 429 rate
+        self.concurrency = get_concurrency_controller('youtube_web')
+        
+        # Search page latency, also used when this scraper hedges yt-dlp
+        self.latency = get_latency_tracker('youtube_web')
+        
+        # Bulk searches keep many page fetches in flight on one event loop
+        self.async_engine = AsyncSearchEngine('youtube_web', self.headers)
+    
+    def _get(self, url, params):
+        """GET a page under the rate limiter and adaptive concurrency limit."""
+        return self._request('GET', url, params=params)
+    
+    def _request(self, method, url, **kwargs):
+        """Send one request on the shared client (cache hits skip the network gate)."""
+        return self.http.request(method, url, headers=self.headers, gate=self._network_gate, **kwargs)
+    
+    @contextmanager
+    def _network_gate(self):
+        """Hold a concurrency slot and a rate-limit token around a network request.
+        
+        Latency is measured from the token to the response, not the time spent
+        waiting for a slot or the rate limiter.
+        """
+        with self.concurrency.slot():
+            self.rate_limiter.acquire()
+            started = time.monotonic()
+            try:
+                yield
+            except Exception as e:
+                self.concurrency.record(e)
+                raise
+        
+        self.concurrency.record()
+        self.latency.record(time.monotonic() - started)
     
     def search_videos(self, search_term, max_results=None):
         """Search for REAL YouTube videos."""
@@ -32,60 +83,107 @@ class RealYouTubeScraper:
         try:
             logger.info(f"🔍 Searching for REAL videos: '{search_term}' (max {max_results} results)")
             
-            # Use YouTube's search endpoint that returns JSON
-            search_url = "https://www.youtube.com/results"
-            params = {
-                'search_query': search_term,
-                'sp': 'CAI%253D'  # Sort by relevance
-            }
-            
-            response = self.session.get(search_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            # Look for the initial data script that contains video info
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find the script tag with ytInitialData
-            scripts = soup.find_all('script')
-            videos = []
-            
-            for script in scripts:
-                if script.string and 'var ytInitialData' in script.string:
-                    # Extract the JSON data
-                    script_text = script.string
-                    start = script_text.find('var ytInitialData = ') + len('var ytInitialData = ')
-                    end = script_text.find(';</script>', start)
-                    
-                    if start > len('var ytInitialData = ') and end > start:
-                        try:
-                            import json
-                            json_str = script_text[start:end]
-                            data = json.loads(json_str)
-                            
-                            # Extract video data from the JSON structure
-                            videos = self._extract_videos_from_json(data, search_term, max_results)
-                            break
-                        except Exception as e:
-                            logger.debug(f"Failed to parse JSON: {e}")
-                            continue
-            
-            # If no videos found from JSON, try alternative method
-            if not videos:
-                videos = self._extract_videos_from_html(soup, search_term, max_results)
-            
-            # Only return real videos (not dummy ones)
-            real_videos = [v for v in videos if not v.get('video_id', '').startswith('dummy_')]
-            
-            logger.info(f"✅ Found {len(real_videos)} REAL videos for '{search_term}'")
-            return real_videos
+            response = self._get(SEARCH_URL, self._search_params(search_term))
+            videos = self._follow_up(search_term, self._parse_search_page(search_term, response.content, max_results))
+            logger.info(f"✅ Found {len(videos)} REAL videos for '{search_term}'")
+            return videos
             
         except Exception as e:
             logger.error(f"❌ Search failed for '{search_term}': {e}")
             return []
     
+    def search_many(self, search_terms, on_result, max_results=None):
+        """Search many terms concurrently on the async engine, calling on_result(term, videos) per term.
+        
+        Continuation pages are fetched on the engine's loop too, as follow-up requests.
+        """
+        if max_results is None:
+            max_results = self.max_videos_per_term
+        
+        def report(term, videos):
+            logger.info(f"✅ Found {len(videos)} REAL videos for '{term}'")
+            on_result(term, videos)
+        
+        self.async_engine.run(
+            search_terms,
+            lambda term: (SEARCH_URL, self._search_params(term)),
+            lambda term, content: self._parse_search_page(term, content, max_results),
+            report
+        )
+    
+    def _follow_up(self, search_term, result):
+        """Fetch a parse result's follow-up pages with blocking requests; returns the videos."""
+        while isinstance(result, FollowUp):
+            try:
+                response = self._request(result.method, result.url, params=result.params, json=result.json_body)
+            except Exception as e:
+                logger.debug(f"Continuation request failed for '{search_term}': {e}")
+                return result.partial
+            result = result.parse(response.content)
+        return result
+    
+    def _search_params(self, search_term):
+        """Query parameters of YouTube's search results page."""
+        return {
+            'search_query': search_term,
+            'sp': 'CAI%253D'  # Sort by relevance
+        }
+    
+    def _parse_search_page(self, search_term, content, max_results):
+        """Parse REAL videos out of a search results page.
+        
+        Returns the videos, or a FollowUp for the next results page when the
+        first page had fewer than max_results.
+        """
+        # Fast path: decode just the ytInitialData span, no document tree
+        data = extract_initial_data(content)
+        if data is not None:
+            videos, continuation = self._extract_videos_from_json(data, search_term, max_results)
+            if videos:
+                return self._next_page(
+                    search_term, max_results, videos, continuation,
+                    extract_innertube_config(content) if continuation else None,
+                    WEB_SEARCH_MAX_CONTINUATIONS
+                )
+        
+        # Look for the initial data script that contains video info
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Find the script tag with ytInitialData
+        scripts = soup.find_all('script')
+        videos = []
+        
+        for script in scripts:
+            if script.string and 'var ytInitialData' in script.string:
+                # Extract the JSON data
+                script_text = script.string
+                start = script_text.find('var ytInitialData = ') + len('var ytInitialData = ')
+                end = script_text.find(';</script>', start)
+                
+                if start > len('var ytInitialData = ') and end > start:
+                    try:
+                        import json
+                        json_str = script_text[start:end]
+                        data = json.loads(json_str)
+                        
+                        # Extract video data from the JSON structure
+                        videos, _ = self._extract_videos_from_json(data, search_term, max_results)
+                        break
+                    except Exception as e:
+                        logger.debug(f"Failed to parse JSON: {e}")
+                        continue
+        
+        # If no videos found from JSON, try alternative method
+        if not videos:
+            videos = self._extract_videos_from_html(soup, search_term, max_results)
+        
+        # Only return real videos (not dummy ones)
+        return [v for v in videos if not v.get('video_id', '').startswith('dummy_')]
+    
     def _extract_videos_from_json(self, data, search_term, max_results):
-        """Extract videos from YouTube's JSON data."""
+        """Extract videos and the next page's continuation token from YouTube's JSON data."""
         videos = []
+        continuation = None
         
         try:
             # Navigate through the JSON structure to find video results
@@ -95,21 +193,76 @@ class RealYouTubeScraper:
             section_list = primary_contents.get('sectionListRenderer', {})
             contents_list = section_list.get('contents', [])
             
-            for content in contents_list:
-                item_section = content.get('itemSectionRenderer', {})
-                contents_items = item_section.get('contents', [])
-                
-                for item in contents_items[:max_results]:
-                    video_renderer = item.get('videoRenderer')
-                    if video_renderer:
-                        video_data = self._parse_video_renderer(video_renderer, search_term)
-                        if video_data:
-                            videos.append(video_data)
+            continuation = self._extract_sections(contents_list, search_term, max_results, videos)
                             
         except Exception as e:
             logger.debug(f"Failed to extract from JSON: {e}")
         
-        return videos
+        return videos, continuation
+    
+    def _extract_sections(self, sections, search_term, max_results, videos):
+        """Append videos from result sections; returns the continuation token, if any."""
+        continuation = None
+        seen_ids = {video['video_id'] for video in videos}
+        
+        for content in sections:
+            # The last section of a page points at the next one
+            continuation_item = content.get('continuationItemRenderer')
+            if continuation_item:
+                continuation = (continuation_item.get('continuationEndpoint', {})
+                                .get('continuationCommand', {}).get('token'))
+                continue
+            
+            item_section = content.get('itemSectionRenderer', {})
+            contents_items = item_section.get('contents', [])
+            
+            for item in contents_items:
+                if len(videos) >= max_results:
+                    return continuation
+                
+                video_renderer = item.get('videoRenderer')
+                if video_renderer:
+                    video_data = self._parse_video_renderer(video_renderer, search_term)
+                    if video_data and video_data['video_id'] not in seen_ids:
+                        seen_ids.add(video_data['video_id'])
+                        videos.append(video_data)
+        
+        return continuation
+    
+    def _next_page(self, search_term, max_results, videos, continuation, innertube, pages_left):
+        """FollowUp for the next page from the youtubei search endpoint, or the videos when done."""
+        if not continuation or len(videos) >= max_results or pages_left <= 0:
+            return videos
+        
+        if not innertube:
+            logger.debug(f"No INNERTUBE config on the page for '{search_term}', stopping at page 1")
+            return videos
+        
+        api_key, context = innertube
+        
+        def parse(content):
+            try:
+                data = json.loads(content)
+            except ValueError as e:
+                logger.debug(f"Bad continuation response for '{search_term}': {e}")
+                return videos
+            
+            next_continuation = None
+            found_before = len(videos)
+            for command in data.get('onResponseReceivedCommands', []):
+                sections = command.get('appendContinuationItemsAction', {}).get('continuationItems', [])
+                next_continuation = self._extract_sections(sections, search_term, max_results, videos) or next_continuation
+            
+            # A page that adds nothing new ends the search too
+            if len(videos) == found_before:
+                return videos
+            return self._next_page(search_term, max_results, videos, next_continuation, innertube, pages_left - 1)
+        
+        return FollowUp(
+            videos, 'POST', CONTINUATION_URL, parse,
+            params={'key': api_key, 'prettyPrint': 'false'},
+            json_body={'context': context, 'continuation': continuation}
+        )
     
     def _parse_video_renderer(self, video_renderer, search_term):
         """Parse a video renderer object."""
@@ -241,40 +394,32 @@ class RealYouTubeScraper:
         logger.info(f"🚀 Starting REAL parallel scraping for {total_terms} search terms ({tool_name})")
         logger.info(f"🌐 Using REAL YouTube scraping (no dummy data!)")
         
-        with ThreadPoolExecutor(max_workers=2) as executor:  # Reduced workers to be respectful
-            # Submit all search tasks
-            future_to_term = {
-                executor.submit(self.search_videos, term): term 
-                for term in search_terms
-            }
+        completed = 0
+        
+        def handle_result(term, videos):
+            nonlocal completed
+            completed += 1
             
-            completed = 0
-            for future in as_completed(future_to_term):
-                term = future_to_term[future]
-                completed += 1
+            try:
+                # Add search metadata
+                for video in videos:
+                    video['search_query'] = term
+                    video['tool'] = tool_name
                 
-                try:
-                    videos = future.result()
-                    
-                    # Add search metadata
-                    for video in videos:
-                        video['search_query'] = term
-                        video['tool'] = tool_name
-                    
-                    all_videos.extend(videos)
-                    self.videos_found += len(videos)
-                    
-                    # Progress callback
-                    if progress_callback:
-                        progress_callback(completed, total_terms, term, len(videos))
-                    
-                    logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(videos)} REAL videos")
-                    
-                    # Be respectful - longer delay
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to process '{term}': {e}")
+                all_videos.extend(videos)
+                self.videos_found += len(videos)
+                
+                # Progress callback
+                if progress_callback:
+                    progress_callback(completed, total_terms, term, len(videos))
+                
+                logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(videos)} REAL videos")
+                
+            except Exception as e:
+                logger.error(f"❌ Failed to process '{term}': {e}")
+        
+        # Every term's page is fetched concurrently, results arrive as they finish
+        self.search_many(search_terms, handle_result)
         
         logger.info(f"🎉 REAL parallel scraping complete! Found {len(all_videos)} REAL videos")
         return all_videos
@@ -284,6 +429,11 @@ class RealYouTubeScraper:
         return {
             'videos_found': self.videos_found,
             'duplicates_skipped': self.duplicates_skipped,
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': self.concurrency.get_stats(),
+            'latency': self.latency.get_stats(),
+            'http': self.http.get_stats(),
+            'http_cache': self.http.cache.get_stats() if self.http.cache else None,
             'method': 'REAL YouTube scraping (no dummy data)'
         }
 
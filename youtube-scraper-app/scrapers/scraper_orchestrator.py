@@ -1,12 +1,14 @@
 """Main scraper orchestrator for coordinating all scraping operations."""
 
 import logging
+from collections import defaultdict
 from datetime import datetime
 from scrapers.ytdlp_real_scraper import YtDlpRealScraper
 from scrapers.difficulty_classifier import DifficultyClassifier, QualityScorer
 from config.database import db_manager
 from config.tools_config import get_all_search_terms
 from config.settings import MIN_QUALITY_SCORE, BATCH_INSERT_SIZE
+from utils.run_journal import RunJournal
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +28,19 @@ class ScraperOrchestrator:
             'total_passed_quality': 0,
             'total_inserted': 0,
             'total_duplicates': 0,
+            'cancelled': False,
             'start_time': None,
             'end_time': None
         }
     
-    def scrape_tool(self, tool_name, categories=None, progress_callback=None, max_videos_per_term=50):
-        """Scrape all videos for a specific tool with immediate processing."""
+    def scrape_tool(self, tool_name, categories=None, progress_callback=None, max_videos_per_term=50, cancel_token=None, resume=False):
+        """Scrape all videos for a specific tool with immediate processing.
+        
+        Cancelling `cancel_token` drops the remaining search terms; videos
+        already inserted stay in the database. Every term searched to the end
+        is journaled, and with `resume` an unfinished run skips those terms.
+        A cancelled run returns False with stats['cancelled'] set.
+        """
         logger.info(f"🚀 Starting scraping for {tool_name.upper()}")
         self.stats['start_time'] = datetime.now()
         
@@ -49,6 +58,14 @@ class ScraperOrchestrator:
             logger.error(f"❌ No search terms found for {tool_name}")
             return False
         
+        journal = RunJournal.open(tool_name, resume=resume)
+        if journal.completed:
+            search_terms = journal.remaining(search_terms)
+            logger.info(f"📒 Resuming {journal.path}: {len(journal.completed)} terms already done, {len(search_terms)} left")
+            if not search_terms:
+                journal.finish()
+                return True
+        
         logger.info(f"📋 Using {len(search_terms)} search terms")
         logger.info(f"💡 Videos will be processed and inserted IMMEDIATELY as found")
         self.stats['total_searched'] = len(search_terms)
@@ -56,6 +73,14 @@ class ScraperOrchestrator:
         # Update yt-dlp scraper max videos setting
         self.ytdlp_scraper.max_videos_per_term = max_videos_per_term
         
+        # Videos already in the DB are skipped before full extraction
+        if self.ytdlp_scraper.two_phase:
+            self.ytdlp_scraper.known_video_ids = self.db.get_scraped_video_ids()
+            logger.info(f"📚 {len(self.ytdlp_scraper.known_video_ids)} videos already in DB will not be re-extracted")
+        
+        # Videos inserted per term, journaled once the term finishes
+        term_inserted = defaultdict(int)
+        
         # Scrape with immediate processing callback
         def immediate_process_callback(videos_batch, search_term):
             """Process and insert videos immediately as they're found."""
@@ -93,6 +118,7 @@ class ScraperOrchestrator:
                 if quality_videos:
                     inserted = self._insert_videos_batch(quality_videos)
                     self.stats['total_inserted'] += inserted
+                    term_inserted[search_term] += inserted
                     self.stats['total_duplicates'] += len(quality_videos) - inserted
                     
                     if inserted > 0:
@@ -107,19 +133,33 @@ class ScraperOrchestrator:
                 import traceback
                 logger.error(traceback.format_exc())
         
+        def journal_term(term, found):
+            """Journal a term searched to the end (all its videos are already inserted)."""
+            journal.record_term(term, found, term_inserted.pop(term, 0))
+        
         # Scrape REAL YouTube videos with immediate processing!
         self.ytdlp_scraper.scrape_parallel_streaming(
             search_terms, 
             tool_name,
             immediate_process_callback,
-            progress_callback
+            progress_callback,
+            cancel_token,
+            term_callback=journal_term
         )
         
         self.stats['end_time'] = datetime.now()
         
+        if cancel_token and cancel_token.cancelled:
+            self.stats['cancelled'] = True
+            logger.warning(f"⏹️ Scraping for {tool_name.upper()} was cancelled (resume with --resume)")
+        else:
+            journal.finish()
+        
         # Log final statistics
         self._log_statistics()
         
+        if self.stats['cancelled']:
+            return False
         return self.stats['total_inserted'] > 0
     
     def _insert_videos_batch(self, videos):
@@ -170,6 +210,27 @@ class ScraperOrchestrator:
         logger.info(f"Inserted to Database: {self.stats['total_inserted']}")
         logger.info(f"Duplicates Skipped: {self.stats['total_duplicates']}")
         logger.info(f"Duration: {duration:.2f} seconds ({duration/60:.2f} minutes)")
+        scraper_stats = self.ytdlp_scraper.get_stats()
+        if self.ytdlp_scraper.two_phase:
+            logger.info(f"Search Hits: {scraper_stats['flat_entries']} ({scraper_stats['full_extractions']} fully extracted, "
+                        f"{scraper_stats['skipped_known']} already known, {scraper_stats['skipped_prefilter']} prefiltered)")
+            saved_by_rule = ", ".join(f"{rule} {count}" for rule, count in scraper_stats['prefilter']['fetches_saved_by_rule'].items())
+            logger.info(f"Prefilter Fetches Saved: {saved_by_rule}")
+        pool_stats = scraper_stats['ydl_pool']
+        logger.info(f"YoutubeDL Instances: {pool_stats['instances_created']} created, {pool_stats['instances_reused']} reused")
+        logger.info(f"YoutubeDL Setup Saved: {pool_stats['setup_ms_saved']:.0f}ms ({pool_stats['setup_ms_saved_per_term']:.1f}ms per term)")
+        cache_stats = scraper_stats['video_cache']
+        logger.info(f"Metadata Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['expired']} expired stats")
+        search_cache_stats = scraper_stats['search_cache']
+        logger.info(f"Search Cache: {search_cache_stats['hits']} hits, {search_cache_stats['misses']} misses, {search_cache_stats['expired']} expired")
+        concurrency_stats = scraper_stats['concurrency']
+        logger.info(f"Concurrency: {concurrency_stats['concurrency']} (max {concurrency_stats['max_concurrency']}), error rate {concurrency_stats['error_rate']:.1%}, {concurrency_stats['throttled']} throttled")
+        latency_stats = scraper_stats['latency']
+        if latency_stats['samples']:
+            logger.info(f"Search Latency: p50 {latency_stats['p50']:.2f}s, p95 {latency_stats['p95']:.2f}s, p99 {latency_stats['p99']:.2f}s")
+        hedging_stats = scraper_stats['hedging']
+        if hedging_stats:
+            logger.info(f"Hedged Searches: {hedging_stats['hedged']}/{hedging_stats['searches']} ({hedging_stats['hedge_wins']} answered first by {self.ytdlp_scraper.hedge_backend})")
         logger.info(f"Method: yt-dlp (REAL YouTube videos, NO API key)")
         logger.info("=" * 60)
     
@@ -180,7 +241,7 @@ class ScraperOrchestrator:
             'scraper_stats': self.ytdlp_scraper.get_stats()
         }
     
-    def scrape_both_tools(self, progress_callback=None):
+    def scrape_both_tools(self, progress_callback=None, cancel_token=None, resume=False):
         """Scrape both Zapier and N8N."""
         logger.info("🚀 Starting full scraping for Zapier and N8N")
         
@@ -189,14 +250,20 @@ class ScraperOrchestrator:
         logger.info("Starting Zapier scraping...")
         logger.info("=" * 60 + "\n")
         
-        success_zapier = self.scrape_tool('zapier', progress_callback=progress_callback)
+        success_zapier = self.scrape_tool('zapier', progress_callback=progress_callback, cancel_token=cancel_token, resume=resume)
+        
+        if cancel_token and cancel_token.cancelled:
+            return False
         
         # Scrape N8N
         logger.info("\n" + "=" * 60)
         logger.info("Starting N8N scraping...")
         logger.info("=" * 60 + "\n")
         
-        success_n8n = self.scrape_tool('n8n', progress_callback=progress_callback)
+        success_n8n = self.scrape_tool('n8n', progress_callback=progress_callback, cancel_token=cancel_token, resume=resume)
+        
+        if cancel_token and cancel_token.cancelled:
+            return False
         
         return success_zapier and success_n8n
 
@@ -1,32 +1,63 @@
 """YouTube web scraper without API - uses requests and BeautifulSoup."""
 
 import logging
-import requests
 from bs4 import BeautifulSoup
 import re
-import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from config.settings import (
     MAX_VIDEOS_PER_TERM, MIN_VIDEO_VIEWS,
     MIN_VIDEO_DURATION, MAX_VIDEO_DURATION,
-    DATE_FILTER_YEARS, MAX_WORKERS
+    DATE_FILTER_YEARS
 )
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.async_search import AsyncSearchEngine
+from utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+SEARCH_URL = "https://www.youtube.com/results"
+
 
 class YouTubeWebScraper:
     """YouTube scraper using web requests (no API needed)."""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Pooled keep-alive connections shared with every other scraper
+        self.http = get_http_client()
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
         self.videos_found = 0
         self.duplicates_skipped = 0
         self.max_videos_per_term = MAX_VIDEOS_PER_TERM
+        
+        # Search page requests are paced at the source, shared with RealYouTubeScraper
+        self.rate_limiter = get_rate_limiter('youtube_web')
+        
+        # In-flight requests adapt to the observed error / 429 rate
+        self.concurrency = get_concurrency_controller('youtube_web')
+        
+        # Bulk searches keep many page fetches in flight on one event loop
+        self.async_engine = AsyncSearchEngine('youtube_web', self.headers)
+    
+    def _get(self, url, params):
+        """GET a page on the shared client (cache hits skip the network gate)."""
+        return self.http.get(url, params=params, headers=self.headers, gate=self._network_gate)
+    
+    @contextmanager
+    def _network_gate(self):
+        """Hold a concurrency slot and a rate-limit token around a network request."""
+        with self.concurrency.slot():
+            self.rate_limiter.acquire()
+            try:
+                yield
+            except Exception as e:
+                self.concurrency.record(e)
+                raise
+        
+        self.concurrency.record()
     
     def search_videos(self, search_term, max_results=None):
         """Search for videos using YouTube web interface."""
@@ -35,55 +66,69 @@ class YouTubeWebScraper:
         try:
             logger.info(f"🔍 Searching for: '{search_term}' (max {max_results} results)")
             
-            # YouTube search URL
-            search_url = f"https://www.youtube.com/results"
-            params = {
-                'search_query': search_term,
-                'sp': 'CAI%253D'  # Sort by relevance
-            }
-            
-            response = self.session.get(search_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            videos = []
-            
-            # Try multiple selectors for video containers
-            video_containers = []
+            response = self._get(SEARCH_URL, self._search_params(search_term))
+            return self._parse_search_page(search_term, response.content, max_results)
             
-            # Method 1: Look for video links
-            video_links = soup.find_all('a', {'id': 'video-title'})
-            for link in video_links[:max_results]:
+        except Exception as e:
+            logger.error(f"❌ Search failed for '{search_term}': {e}")
+            return []
+    
+    def search_many(self, search_terms, on_result, max_results=None):
+        """Search many terms concurrently on the async engine, calling on_result(term, videos) per term."""
+        if max_results is None:
+            max_results = self.max_videos_per_term
+        
+        self.async_engine.run(
+            search_terms,
+            lambda term: (SEARCH_URL, self._search_params(term)),
+            lambda term, content: self._parse_search_page(term, content, max_results),
+            on_result
+        )
+    
+    def _search_params(self, search_term):
+        """Query parameters of YouTube's search results page."""
+        return {
+            'search_query': search_term,
+            'sp': 'CAI%253D'  # Sort by relevance
+        }
+    
+    def _parse_search_page(self, search_term, content, max_results):
+        """Parse videos out of a search results page."""
+        soup = BeautifulSoup(content, 'html.parser')
+        videos = []
+        
+        # Try multiple selectors for video containers
+        video_containers = []
+        
+        # Method 1: Look for video links
+        video_links = soup.find_all('a', {'id': 'video-title'})
+        for link in video_links[:max_results]:
+            try:
+                video_data = self._extract_video_data_from_link(link, search_term)
+                if video_data and self._filter_video(video_data):
+                    videos.append(video_data)
+            except Exception as e:
+                logger.debug(f"Skipped video link: {e}")
+                continue
+        
+        # Method 2: Look for video containers with different selectors
+        if not videos:
+            containers = soup.find_all('div', {'class': re.compile(r'ytd-video-renderer|ytd-compact-video-renderer')})
+            for container in containers[:max_results]:
                 try:
-                    video_data = self._extract_video_data_from_link(link, search_term)
+                    video_data = self._extract_video_data_from_container(container, search_term)
                     if video_data and self._filter_video(video_data):
                         videos.append(video_data)
                 except Exception as e:
-                    logger.debug(f"Skipped video link: {e}")
+                    logger.debug(f"Skipped container: {e}")
                     continue
-            
-            # Method 2: Look for video containers with different selectors
-            if not videos:
-                containers = soup.find_all('div', {'class': re.compile(r'ytd-video-renderer|ytd-compact-video-renderer')})
-                for container in containers[:max_results]:
-                    try:
-                        video_data = self._extract_video_data_from_container(container, search_term)
-                        if video_data and self._filter_video(video_data):
-                            videos.append(video_data)
-                    except Exception as e:
-                        logger.debug(f"Skipped container: {e}")
-                        continue
-            
-            # Method 3: Look for script tags with video data (fallback)
-            if not videos:
-                videos = self._extract_from_script_tags(soup, search_term, max_results)
-            
-            logger.info(f"✅ Found {len(videos)} videos for '{search_term}'")
-            return videos
-            
-        except Exception as e:
-            logger.error(f"❌ Search failed for '{search_term}': {e}")
-            return []
+        
+        # Method 3: Look for script tags with video data (fallback)
+        if not videos:
+            videos = self._extract_from_script_tags(soup, search_term, max_results)
+        
+        logger.info(f"✅ Found {len(videos)} videos for '{search_term}'")
+        return videos
     
     def _extract_video_data_from_link(self, link_element, search_term):
         """Extract video data from a video link element."""
@@ -233,40 +278,32 @@ class YouTubeWebScraper:
         logger.info(f"🚀 Starting parallel scraping for {total_terms} search terms ({tool_name})")
         logger.info(f"🌐 Using web scraping (no API key required!)")
         
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            # Submit all search tasks
-            future_to_term = {
-                executor.submit(self.search_videos, term): term 
-                for term in search_terms
-            }
+        completed = 0
+        
+        def handle_result(term, videos):
+            nonlocal completed
+            completed += 1
             
-            completed = 0
-            for future in as_completed(future_to_term):
-                term = future_to_term[future]
-                completed += 1
+            try:
+                # Add search metadata
+                for video in videos:
+                    video['search_query'] = term
+                    video['tool'] = tool_name
                 
-                try:
-                    videos = future.result()
-                    
-                    # Add search metadata
-                    for video in videos:
-                        video['search_query'] = term
-                        video['tool'] = tool_name
-                    
-                    all_videos.extend(videos)
-                    self.videos_found += len(videos)
-                    
-                    # Progress callback
-                    if progress_callback:
-                        progress_callback(completed, total_terms, term, len(videos))
-                    
-                    logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(videos)} videos")
-                    
-                    # Small delay to be respectful
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to process '{term}': {e}")
+                all_videos.extend(videos)
+                self.videos_found += len(videos)
+                
+                # Progress callback
+                if progress_callback:
+                    progress_callback(completed, total_terms, term, len(videos))
+                
+                logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(videos)} videos")
+                
+            except Exception as e:
+                logger.error(f"❌ Failed to process '{term}': {e}")
+        
+        # Every term's page is fetched concurrently, results arrive as they finish
+        self.search_many(search_terms, handle_result)
         
         logger.info(f"🎉 Parallel scraping complete! Found {len(all_videos)} videos")
         return all_videos
@@ -276,5 +313,9 @@ class YouTubeWebScraper:
         return {
             'videos_found': self.videos_found,
             'duplicates_skipped': self.duplicates_skipped,
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': self.concurrency.get_stats(),
+            'http': self.http.get_stats(),
+            'http_cache': self.http.cache.get_stats() if self.http.cache else None,
             'method': 'web scraping (no API key required)'
         }
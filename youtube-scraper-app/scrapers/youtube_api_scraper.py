@@ -1,16 +1,26 @@
 """Fast parallel YouTube Data API v3 scraper."""
 
+import json
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-import time
+from googleapiclient.http import MAX_BATCH_LIMIT
 from config.settings import (
     YOUTUBE_API_KEYS, MAX_VIDEOS_PER_TERM,
     MIN_VIDEO_VIEWS, MIN_VIDEO_DURATION, MAX_VIDEO_DURATION,
-    DATE_FILTER_YEARS, MAX_WORKERS
+    DATE_FILTER_YEARS, API_BATCH_REQUESTS, API_BATCH_MAX_SIZE
 )
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.latency import get_latency_tracker
+from utils.http_cache import get_http_cache
+from utils.video_coalescer import VideoIdCoalescer
+from utils.api_fields import SEARCH_ID_FIELDS, VIDEO_DETAILS_FIELDS, field_mask
+from utils.quota_ledger import ApiKeyScheduler, QuotaExhausted
+from utils.api_discovery import build_clients
 
 logger = logging.getLogger(__name__)
 
@@ -20,91 +30,150 @@ class YouTubeAPIScraperFast:
     
     def __init__(self):
         self.api_keys = YOUTUBE_API_KEYS.copy() if YOUTUBE_API_KEYS else []
-        self.current_key_index = 0
         self.youtube_clients = []
-        self.quota_used = 0
+        self._clients = {}  # API key -> client
         self.videos_found = 0
         self.duplicates_skipped = 0
         
+        # API requests are paced at the source, shared with YouTubeAPIScraperFixed
+        self.rate_limiter = get_rate_limiter('youtube_api')
+        
+        # In-flight requests adapt to the observed error / 429 rate
+        self.concurrency = get_concurrency_controller('youtube_api')
+        
+        # Search latency, also used when this scraper hedges yt-dlp
+        self.latency = get_latency_tracker('youtube_api')
+        
+        # Raw responses shared with the requests-based scrapers; hits cost no quota
+        # (a cached search page saves 100 units)
+        self.http_cache = get_http_cache()
+        
+        # Pack searches into multipart batch requests instead of one round trip each
+        self.batch_requests = API_BATCH_REQUESTS
+        self.batch_size = min(API_BATCH_MAX_SIZE, MAX_BATCH_LIMIT)
+        
         if not self.api_keys:
             logger.warning("⚠️ No YouTube API keys configured!")
         else:
             self._initialize_clients()
+        
+        # Keys are chosen by remaining daily quota, tracked across runs and processes
+        self.keys = ApiKeyScheduler(list(self._clients))
+    
+    @property
+    def quota_used(self):
+        """Quota units this scraper has spent."""
+        return self.keys.units_spent
     
     def _initialize_clients(self):
-        """Initialize YouTube API clients for all keys."""
-        for api_key in self.api_keys:
+        """Initialize YouTube API clients for all keys from one shared discovery document."""
+        try:
+            self._clients = build_clients(self.api_keys)
+        except Exception as e:
+            logger.error(f"❌ Failed to load the YouTube API discovery document: {e}")
+            return
+        
+        self.youtube_clients = list(self._clients.values())
+        logger.info(f"✅ Initialized YouTube API clients ({len(self.youtube_clients)}/{len(self.api_keys)})")
+    
+    def _reserve(self, call_type, cost):
+        """Reserve quota on the key with the most headroom; returns (ticket, that key's client)."""
+        ticket = self.keys.reserve(call_type, cost)
+        return ticket, self._clients[ticket.api_key]
+    
+    def _call(self, call_type, cost, build_request):
+        """Build a request on the key with the most headroom and execute it."""
+        ticket, client = self._reserve(call_type, cost)
+        try:
+            request = build_request(client)
+        except Exception:
+            self.keys.settle(ticket, spent=False)
+            raise
+        return self._execute(request, ticket)
+    
+    def _settle(self, ticket, exception=None):
+        """Record a finished call's quota: HTTP errors are charged, transport errors are not."""
+        if exception is None:
+            self.keys.settle(ticket)
+        elif isinstance(exception, HttpError):
+            self.keys.settle(ticket, exhausted='quotaExceeded' in str(exception))
+        else:
+            self.keys.settle(ticket, spent=False)
+    
+    def _execute(self, request, ticket):
+        """Execute an API request under the rate limiters and adaptive concurrency limit.
+        
+        Fresh responses come from the HTTP cache without touching the network or
+        the quota; a stale one is revalidated with its ETag. The ticket's units
+        are charged to its key for every request that reaches the API.
+        """
+        lookup = self.http_cache.lookup(request.method, request.uri) if self.http_cache else None
+        if lookup and lookup.fresh:
+            self.keys.settle(ticket, spent=False)
+            return json.loads(self.http_cache.serve(lookup))
+        
+        if lookup:
+            request.headers.update(lookup.conditional_headers())
+        
+        with self.concurrency.slot():
+            self.rate_limiter.acquire()
+            self.keys.pace(ticket)
             try:
-                client = build('youtube', 'v3', developerKey=api_key)
-                self.youtube_clients.append(client)
-                logger.info(f"✅ Initialized YouTube API client ({len(self.youtube_clients)}/{len(self.api_keys)})")
+                response = request.execute()
+            except HttpError as e:
+                if e.resp.status == 304 and lookup and lookup.body is not None:
+                    self.concurrency.record()
+                    self._settle(ticket)
+                    return json.loads(self.http_cache.serve_revalidated(lookup))
+                self.concurrency.record(e)
+                self._settle(ticket, e)
+                raise
             except Exception as e:
-                logger.error(f"❌ Failed to initialize API client: {e}")
-    
-    def _get_client(self):
-        """Get next available YouTube API client (round-robin)."""
-        if not self.youtube_clients:
-            raise Exception("No YouTube API clients available")
-        
-        client = self.youtube_clients[self.current_key_index]
-        self.current_key_index = (self.current_key_index + 1) % len(self.youtube_clients)
-        return client
+                self.concurrency.record(e)
+                self._settle(ticket, e)
+                raise
+        
+        self.concurrency.record()
+        self._settle(ticket)
+        if lookup:
+            self.http_cache.store(lookup, request.uri, json.dumps(response).encode('utf-8'), response.get('etag'))
+        return response
     
     def _calculate_date_filter(self):
         """Calculate the publishedAfter date for filtering."""
         date_ago = datetime.now() - timedelta(days=365 * DATE_FILTER_YEARS)
-        return date_ago.strftime('%Y-%m-%dT%H:%M:%SZ')
+        # Day precision keeps the request (and its HTTP cache key) stable through the day
+        return date_ago.strftime('%Y-%m-%dT00:00:00Z')
     
     def search_videos(self, search_term, max_results=MAX_VIDEOS_PER_TERM):
-        """Search for videos using YouTube API."""
+        """Search for videos using YouTube API (pages are served from the HTTP cache when fresh)."""
+        return self._search_video_ids(search_term, max_results)
+    
+    def _search_video_ids(self, search_term, max_results):
+        """Search for video IDs with the API, following pagination."""
+        started = time.monotonic()
         try:
-            client = self._get_client()
             published_after = self._calculate_date_filter()
             
-            request = client.search().list(
-                part='id,snippet',
-                q=search_term,
-                type='video',
-                maxResults=min(max_results, 50),  # API max is 50 per request
-                order='relevance',
-                publishedAfter=published_after,
-                videoDuration='medium',  # 4-20 minutes
-                relevanceLanguage='en'
+            response = self._call(  # Search costs 100 units
+                'search', 100,
+                lambda client: self._search_request(client, search_term, max_results, published_after)
             )
-            
-            response = request.execute()
-            self.quota_used += 100  # Search costs 100 units
-            
-            video_ids = []
-            for item in response.get('items', []):
-                if item['id']['kind'] == 'youtube#video':
-                    video_ids.append(item['id']['videoId'])
+            video_ids = self._video_ids_from(response)
             
             # If we need more results, paginate
             next_page_token = response.get('nextPageToken')
             while next_page_token and len(video_ids) < max_results:
-                request = client.search().list(
-                    part='id,snippet',
-                    q=search_term,
-                    type='video',
-                    maxResults=min(max_results - len(video_ids), 50),
-                    order='relevance',
-                    publishedAfter=published_after,
-                    pageToken=next_page_token,
-                    videoDuration='medium',
-                    relevanceLanguage='en'
+                response = self._call(
+                    'search', 100,
+                    lambda client: self._search_request(client, search_term, max_results - len(video_ids),
+                                                        published_after, next_page_token)
                 )
-                
-                response = request.execute()
-                self.quota_used += 100
-                
-                for item in response.get('items', []):
-                    if item['id']['kind'] == 'youtube#video':
-                        video_ids.append(item['id']['videoId'])
-                
+                video_ids.extend(self._video_ids_from(response))
                 next_page_token = response.get('nextPageToken')
             
             logger.info(f"🔍 Found {len(video_ids)} video IDs for '{search_term}'")
+            self.latency.record(time.monotonic() - started)
             return video_ids
             
         except HttpError as e:
@@ -114,10 +183,148 @@ class YouTubeAPIScraperFast:
             else:
                 logger.error(f"❌ YouTube API error: {e}")
                 return []
+        except QuotaExhausted as e:
+            logger.warning(f"⚠️ {e}, skipping '{search_term}'")
+            return []
         except Exception as e:
             logger.error(f"❌ Search failed for '{search_term}': {e}")
             return []
     
+    def _search_request(self, client, search_term, max_results, published_after, page_token=None):
+        """Build one search().list page request."""
+        return client.search().list(
+            part='id,snippet',
+            q=search_term,
+            type='video',
+            maxResults=min(max_results, 50),  # API max is 50 per request
+            order='relevance',
+            publishedAfter=published_after,
+            pageToken=page_token,
+            videoDuration='medium',  # 4-20 minutes
+            relevanceLanguage='en',
+            fields=field_mask(SEARCH_ID_FIELDS)
+        )
+    
+    @staticmethod
+    def _video_ids_from(response):
+        return [item['id']['videoId'] for item in response.get('items', [])
+                if item['id']['kind'] == 'youtube#video']
+    
+    def search_videos_batched(self, search_terms, on_term, max_results=MAX_VIDEOS_PER_TERM):
+        """Search many terms with their pages packed into batch HTTP requests.
+        
+        Every term's first page goes out in one round of batches, then the
+        later pages of the terms that still need results, and so on.
+        on_term(term, video_ids) is called as soon as a term is complete; a
+        failed term gets the IDs collected before the failure.
+        """
+        collected = {term: [] for term in search_terms}
+        
+        published_after = self._calculate_date_filter()
+        lock = threading.Lock()
+        page_tokens = {term: None for term in collected}  # term -> token of its next page
+        
+        while page_tokens:
+            next_page_tokens = {}
+            requests = {}  # keyed by term, each term has one page in flight per round
+            
+            for term, token in page_tokens.items():
+                try:
+                    ticket, client = self._reserve('search', 100)
+                except QuotaExhausted as e:
+                    logger.warning(f"⚠️ {e}, stopping '{term}' at {len(collected[term])} video IDs")
+                    on_term(term, collected[term])
+                    continue
+                request = self._search_request(client, term, max_results - len(collected[term]), published_after, token)
+                requests[term] = (request, ticket)
+            
+            def handle_page(term, response, exception):
+                if exception is None:
+                    collected[term].extend(self._video_ids_from(response))
+                    next_page_token = response.get('nextPageToken')
+                    if next_page_token and len(collected[term]) < max_results:
+                        with lock:
+                            next_page_tokens[term] = next_page_token
+                        return
+                elif 'quotaExceeded' in str(exception):
+                    logger.error(f"❌ API quota exceeded!")
+                else:
+                    logger.error(f"❌ Search failed for '{term}': {exception}")
+                
+                logger.info(f"🔍 Found {len(collected[term])} video IDs for '{term}'")
+                on_term(term, collected[term])
+            
+            self._execute_batch(requests, handle_page)
+            page_tokens = next_page_tokens
+    
+    def _execute_batch(self, requests, callback):
+        """Execute requests as multipart batch HTTP requests.
+        
+        `requests` maps a request ID (a string) to its (request, quota ticket).
+        Requests are packed API_BATCH_MAX_SIZE to a batch and the batches run
+        concurrently. A batch takes one rate-limit token (backend and per key)
+        per request in it before it waits for its single concurrency slot.
+        callback(request_id, response, exception) is called once per request;
+        an error answers only its own request, and a failed batch answers each
+        of its requests with the batch's error. Fresh HTTP cache entries are
+        answered without being sent.
+        """
+        batches = []
+        for request_id, (request, ticket) in requests.items():
+            lookup = self.http_cache.lookup(request.method, request.uri) if self.http_cache else None
+            if lookup and lookup.fresh:
+                self.keys.settle(ticket, spent=False)
+                callback(request_id, json.loads(self.http_cache.serve(lookup)), None)
+                continue
+            if lookup:
+                request.headers.update(lookup.conditional_headers())
+            
+            if not batches or len(batches[-1]) >= self.batch_size:
+                batches.append({})
+            batches[-1][request_id] = (request, ticket, lookup)
+        
+        def run_batch(items):
+            # Each request carries its own key in its URI, so any client can send the batch
+            batch = self.youtube_clients[0].new_batch_http_request()
+            answered = set()
+            
+            def answer(request_id, response, exception):
+                request, ticket, lookup = items[request_id]
+                answered.add(request_id)
+                
+                if isinstance(exception, HttpError) and exception.resp.status == 304 and lookup and lookup.body is not None:
+                    response, exception = json.loads(self.http_cache.serve_revalidated(lookup)), None
+                elif exception is None and lookup:
+                    self.http_cache.store(lookup, request.uri, json.dumps(response).encode('utf-8'), response.get('etag'))
+                
+                self.concurrency.record(exception)
+                self._settle(ticket, exception)
+                callback(request_id, response, exception)
+            
+            for request_id, (request, ticket, lookup) in items.items():
+                batch.add(request, callback=answer, request_id=request_id)
+            
+            # Pace first, so a slot isn't held while waiting for tokens
+            for request, ticket, lookup in items.values():
+                self.rate_limiter.acquire()
+                self.keys.pace(ticket)
+            
+            with self.concurrency.slot():
+                try:
+                    batch.execute()
+                except Exception as e:
+                    self.concurrency.record(e)
+                    for request_id, (request, ticket, lookup) in items.items():
+                        if request_id not in answered:
+                            self.keys.settle(ticket, spent=False)
+                            callback(request_id, None, e)
+        
+        if len(batches) == 1:
+            run_batch(batches[0])
+        elif batches:
+            with ThreadPoolExecutor(max_workers=min(len(batches), self.concurrency.maximum)) as executor:
+                list(executor.map(run_batch, batches))
+    
     def get_video_details_batch(self, video_ids):
         """Get detailed information for multiple videos in batch (efficient)."""
         if not video_ids:
@@ -130,20 +337,8 @@ class YouTubeAPIScraperFast:
             batch_ids = video_ids[i:i+50]
             
             try:
-                client = self._get_client()
-                
-                request = client.videos().list(
-                    part='snippet,contentDetails,statistics',
-                    id=','.join(batch_ids)
-                )
-                
-                response = request.execute()
-                self.quota_used += 1  # Videos.list costs 1 unit per request
-                
-                for item in response.get('items', []):
-                    video_data = self._parse_video_data(item)
-                    if video_data and self._filter_video(video_data):
-                        videos_data.append(video_data)
+                details = self._fetch_video_details(batch_ids)
+                videos_data.extend(details[video_id] for video_id in batch_ids if video_id in details)
                 
                 logger.info(f"📹 Processed batch {i//50 + 1}: {len(videos_data)} videos passed filters")
                 
@@ -153,6 +348,24 @@ class YouTubeAPIScraperFast:
         
         return videos_data
     
+    def _fetch_video_details(self, video_ids):
+        """One videos.list call for up to 50 IDs; returns {video_id: video_data} of those passing filters."""
+        response = self._call(  # Videos.list costs 1 unit per request
+            'videos.list', 1,
+            lambda client: client.videos().list(
+                part='snippet,contentDetails,statistics',
+                id=','.join(video_ids),
+                fields=field_mask(VIDEO_DETAILS_FIELDS)
+            )
+        )
+        
+        details = {}
+        for item in response.get('items', []):
+            video_data = self._parse_video_data(item)
+            if video_data and self._filter_video(video_data):
+                details[video_data['video_id']] = video_data
+        return details
+    
     def _parse_video_data(self, item):
         """Parse video data from API response."""
         try:
@@ -227,62 +440,84 @@ class YouTubeAPIScraperFast:
         return True
     
     def scrape_parallel(self, search_terms, tool_name, progress_callback=None):
-        """Scrape multiple search terms in parallel for maximum speed."""
+        """Scrape multiple search terms in parallel for maximum speed.
+        
+        Video details are not fetched per term: the IDs of every finished search
+        are pooled and deduplicated, fetched in full 50-ID batches and fanned
+        back out to the terms that found them. With API_BATCH_REQUESTS the
+        searches themselves go out as batch HTTP requests.
+        """
         all_videos = []
         total_terms = len(search_terms)
+        results_lock = threading.Lock()
+        completed = 0
         
         logger.info(f"🚀 Starting parallel scraping for {total_terms} search terms ({tool_name})")
         
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            # Submit all search tasks
-            future_to_term = {
-                executor.submit(self.search_videos, term): term 
-                for term in search_terms
-            }
+        def handle_term(term, video_ids, videos):
+            nonlocal completed
+            
+            # Add search metadata
+            for video in videos:
+                video['search_query'] = term
+                video['tool'] = tool_name
             
-            completed = 0
-            for future in as_completed(future_to_term):
-                term = future_to_term[future]
+            with results_lock:
                 completed += 1
+                all_videos.extend(videos)
+                self.videos_found += len(videos)
                 
-                try:
-                    video_ids = future.result()
-                    
-                    if video_ids:
-                        # Get detailed info for all videos in batch
-                        videos = self.get_video_details_batch(video_ids)
-                        
-                        # Add search metadata
-                        for video in videos:
-                            video['search_query'] = term
-                            video['tool'] = tool_name
-                        
-                        all_videos.extend(videos)
-                        self.videos_found += len(videos)
-                    
-                    # Progress callback
-                    if progress_callback:
-                        progress_callback(completed, total_terms, term, len(video_ids))
-                    
-                    logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(video_ids)} videos found")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to process '{term}': {e}")
+                # Progress callback
+                if progress_callback:
+                    progress_callback(completed, total_terms, term, len(video_ids))
+                
+                logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(video_ids)} videos found")
+        
+        coalescer = VideoIdCoalescer(self._fetch_video_details, handle_term, max_workers=self.concurrency.maximum)
         
+        if self.batch_requests:
+            try:
+                self.search_videos_batched(search_terms, coalescer.add)
+            except Exception as e:
+                logger.error(f"❌ Batched search failed: {e}")
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency.maximum) as executor:
+                # Submit all search tasks
+                future_to_term = {
+                    executor.submit(self.search_videos, term): term 
+                    for term in search_terms
+                }
+                
+                for future in as_completed(future_to_term):
+                    term = future_to_term[future]
+                    try:
+                        video_ids = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Failed to process '{term}': {e}")
+                        video_ids = []
+                    coalescer.add(term, video_ids)
+        
+        coalescer.close()
+        
+        coalescing = coalescer.get_stats()
+        self.duplicates_skipped += coalescing['ids_deduplicated']
+        logger.info(f"📹 videos.list: {coalescing['ids_requested']} unique IDs in {coalescing['batches']} calls "
+                    f"({coalescing['ids_deduplicated']} duplicate IDs coalesced)")
         logger.info(f"🎉 Parallel scraping complete! Found {len(all_videos)} videos")
+        logger.info(f"📊 API quota used: {self.quota_used} units {dict(self.keys.spent)}, "
+                    f"{self.keys.headroom()} left on the best key today")
         return all_videos
     
     def get_stats(self):
         """Get scraping statistics."""
         return {
             'quota_used': self.quota_used,
+            'quota': self.keys.get_stats(),
             'videos_found': self.videos_found,
             'duplicates_skipped': self.duplicates_skipped,
-            'api_keys_used': len(self.youtube_clients)
+            'api_keys_used': len(self.youtube_clients),
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': self.concurrency.get_stats(),
+            'latency': self.latency.get_stats(),
+            'http_cache': self.http_cache.get_stats() if self.http_cache else None
         }
-
-
-
-
-
-
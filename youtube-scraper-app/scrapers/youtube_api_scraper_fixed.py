@@ -1,12 +1,18 @@
 """YouTube Data API v3 scraper for educational content."""
 
 import logging
-import requests
-import time
+from contextlib import contextmanager
+from functools import partial
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from config.settings import MAX_VIDEOS_PER_TERM, MIN_VIDEO_VIEWS, MAX_WORKERS
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.http_client import get_http_client
+from utils.api_fields import SEARCH_SNIPPET_FIELDS, VIDEO_STATS_FIELDS, field_mask
+from utils.quota_ledger import ApiKeyScheduler
 import os
+import requests
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,10 +29,58 @@ class YouTubeAPIScraperFixed:
         self.videos_found = 0
         self.duplicates_skipped = 0
         self.max_videos_per_term = MAX_VIDEOS_PER_TERM
-        self.quota_used = 0
+        
+        # API requests are paced at the source, shared with YouTubeAPIScraperFast
+        self.rate_limiter = get_rate_limiter('youtube_api')
+        
+        # In-flight requests adapt to the observed error / 429 rate
+        self.concurrency = get_concurrency_controller('youtube_api')
+        
+        # Pooled keep-alive connections instead of a new TCP+TLS handshake per call
+        self.http = get_http_client()
         
         if not self.api_key or self.api_key == 'your_youtube_api_key_here':
             logger.warning("⚠️ YouTube API key not set. Please add YOUTUBE_API_KEY_1 to .env file")
+            self.keys = ApiKeyScheduler([])
+        else:
+            # Spend is recorded in the same per-day ledger as YouTubeAPIScraperFast
+            self.keys = ApiKeyScheduler([self.api_key])
+    
+    @property
+    def quota_used(self):
+        """Quota units this scraper has spent."""
+        return self.keys.units_spent
+    
+    def _get(self, url, params, call_type, cost):
+        """GET an API endpoint on the shared client, charging its quota unless served from cache."""
+        ticket = self.keys.reserve(call_type, cost)
+        spent, exhausted = False, False
+        try:
+            response = self.http.get(url, params=dict(params, key=ticket.api_key),
+                                     gate=partial(self._network_gate, ticket))
+            spent = response.headers.get('X-Cache') != 'HIT'
+            return response
+        except requests.HTTPError as e:
+            # The API answered, so the call counts
+            spent = True
+            exhausted = e.response is not None and 'quotaExceeded' in e.response.text
+            raise
+        finally:
+            self.keys.settle(ticket, spent=spent, exhausted=exhausted)
+    
+    @contextmanager
+    def _network_gate(self, ticket):
+        """Hold a concurrency slot and rate-limit tokens (backend and key) around a network request."""
+        with self.concurrency.slot():
+            self.rate_limiter.acquire()
+            self.keys.pace(ticket)
+            try:
+                yield
+            except Exception as e:
+                self.concurrency.record(e)
+                raise
+        
+        self.concurrency.record()
     
     def search_videos(self, search_term, max_results=None):
         """Search for real YouTube videos using the Data API."""
@@ -48,17 +102,15 @@ class YouTubeAPIScraperFixed:
                 'type': 'video',
                 'maxResults': max_results,
                 'order': 'relevance',
-                'publishedAfter': (datetime.now() - timedelta(days=365)).isoformat() + 'Z',
+                # Day precision keeps the request (and its HTTP cache key) stable through the day
+                'publishedAfter': (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%dT00:00:00Z'),
                 'videoDuration': 'medium',  # 4-20 minutes
                 'relevanceLanguage': 'en',
-                'key': self.api_key
+                'fields': field_mask(SEARCH_SNIPPET_FIELDS)
             }
             
-            response = requests.get(search_url, params=params, timeout=30)
-            response.raise_for_status()
-            
+            response = self._get(search_url, params, 'search', 100)  # Search costs 100 quota
             data = response.json()
-            self.quota_used += 100  # Search costs 100 quota
             
             videos = []
             video_items = data.get('items', [])
@@ -109,14 +161,11 @@ class YouTubeAPIScraperFixed:
             params = {
                 'part': 'contentDetails,statistics',
                 'id': ','.join(video_ids),
-                'key': self.api_key
+                'fields': field_mask(VIDEO_STATS_FIELDS)
             }
             
-            response = requests.get(details_url, params=params, timeout=30)
-            response.raise_for_status()
-            
+            response = self._get(details_url, params, 'videos.list', 1)  # Each video detail costs 1 quota
             data = response.json()
-            self.quota_used += 1  # Each video detail costs 1 quota
             
             details = {}
             for item in data.get('items', []):
@@ -198,11 +247,8 @@ class YouTubeAPIScraperFixed:
                 
                 logger.info(f"✅ [{i + 1}/{total_terms}] '{term}': {len(videos)} REAL videos")
                 
-                # API quota management - longer delay
-                time.sleep(2)
-                
-                # Check quota limit (YouTube API has daily quota limits)
-                if self.quota_used > 8000:  # Conservative limit
+                # Stop before the key's daily quota runs out (a term costs a search and a videos.list)
+                if self.keys.headroom() < 101:
                     logger.warning("⚠️ Approaching API quota limit, stopping early")
                     break
                     
@@ -219,6 +265,11 @@ class YouTubeAPIScraperFixed:
             'videos_found': self.videos_found,
             'duplicates_skipped': self.duplicates_skipped,
             'quota_used': self.quota_used,
+            'quota': self.keys.get_stats(),
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': self.concurrency.get_stats(),
+            'http': self.http.get_stats(),
+            'http_cache': self.http.cache.get_stats() if self.http.cache else None,
             'method': 'YouTube Data API v3 (REAL videos for learners)'
         }
 
@@ -1,14 +1,71 @@
 """Real YouTube scraper using yt-dlp (no API key needed)."""
 
 import logging
-import yt_dlp
+import multiprocessing
+import queue
+import threading
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from config.settings import MAX_VIDEOS_PER_TERM, MAX_WORKERS
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from config.settings import (
+    MAX_VIDEOS_PER_TERM,
+    YTDLP_TWO_PHASE_SEARCH, YTDLP_METADATA_ONLY,
+    YTDLP_BACKEND, YTDLP_PROCESS_WORKERS, YTDLP_RATE_LIMIT,
+    HEDGE_BACKEND
+)
+from scrapers.prefilters import FlatEntryPrefilter, duration_rule, min_views_rule
+from utils.ytdlp_pool import YoutubeDLPool
+from utils.ytdlp_profiles import LEGACY_OPTS, metadata_only_opts, extract_metadata
+from utils.video_metadata_cache import VideoMetadataCache
+from utils.search_cache import SearchResultCache
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.latency import get_latency_tracker
+from utils.hedging import HedgedSearch
+from utils.cancellation import CancellationToken, ScrapeCancelled
 
 logger = logging.getLogger(__name__)
 
+# Counters shipped back from worker processes to the parent scraper
+WORKER_COUNTERS = ('flat_entries', 'full_extractions', 'skipped_known')
+
+# Scraper instance owned by each worker process of the process backend
+_process_scraper = None
+
+
+def _init_process_worker(max_videos_per_term, known_video_ids, workers, cancel_event):
+    """Create the worker process's own scraper (and its warm YoutubeDL instances)."""
+    global _process_scraper
+    _process_scraper = YtDlpRealScraper()
+    _process_scraper.max_videos_per_term = max_videos_per_term
+    
+    # Set by the parent on cancel, so running searches stop at their next request
+    _process_scraper.cancel_token = CancellationToken(event=cancel_event)
+    
+    # A snapshot: IDs other processes extract later in the run are not seen here,
+    # so the parent drops the duplicates in _search_result
+    _process_scraper.known_video_ids = set(known_video_ids)
+    
+    # Every process has its own bucket, so split the backend's budget between them
+    get_rate_limiter('ytdlp').set_rate(YTDLP_RATE_LIMIT / workers)
+
+
+def _search_videos_in_process(search_term):
+    """Run one search in a worker process and return its outcome plus stat deltas."""
+    videos, completed = _process_scraper.collect_videos(search_term)
+    return videos, completed, _process_scraper._drain_worker_stats()
+
+
+def _consume(generator, handle):
+    """Pass every item of a generator to handle() and return the generator's return value."""
+    while True:
+        try:
+            item = next(generator)
+        except StopIteration as stop:
+            return stop.value
+        handle(item)
+
 
 class YtDlpRealScraper:
     """Real YouTube video scraper using yt-dlp - NO API key required!"""
@@ -17,57 +74,451 @@ class YtDlpRealScraper:
         self.videos_found = 0
         self.duplicates_skipped = 0
         self.max_videos_per_term = MAX_VIDEOS_PER_TERM
+        self.two_phase = YTDLP_TWO_PHASE_SEARCH
+        self.backend = YTDLP_BACKEND
+        self.known_video_ids = set()  # Already stored in scraped_videos, never re-extracted
         
-        # yt-dlp options for REAL YouTube search
-        self.ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,  # Get full video info
-            'skip_download': True,
-            'format': 'best',
-            'socket_timeout': 30,
-            'retries': 3,
-            'fragment_retries': 3,
-            'ignoreerrors': True,
-            'no_color': True,
-        }
+        # Two-phase statistics
+        self.flat_entries = 0
+        self.full_extractions = 0
+        self.skipped_known = 0
+        self._stats_lock = threading.Lock()
+        
+        # Same bounds as _filter_video, applied to flat entries before any detail fetch
+        self.prefilter = FlatEntryPrefilter([
+            ('duration', duration_rule(180, 1800)),
+            ('min_views', min_views_rule(500)),
+        ])
+        
+        # yt-dlp options for REAL YouTube search (metadata only, we never download)
+        self.metadata_only = YTDLP_METADATA_ONLY
+        self.ydl_opts = metadata_only_opts() if self.metadata_only else dict(LEGACY_OPTS)
+        
+        # Flat search only returns IDs and basic fields (no watch-page fetch)
+        self.flat_ydl_opts = {**self.ydl_opts, 'extract_flat': 'in_playlist'}
+        
+        # One warm YoutubeDL per worker thread instead of one per search term
+        self._ydl_pool = YoutubeDLPool(self.ydl_opts)
+        self._flat_ydl_pool = YoutubeDLPool(self.flat_ydl_opts)
+        
+        # Trimmed info records persisted across runs, tools and difficulties
+        self.video_cache = VideoMetadataCache()
+        
+        # Flat search results, reused by every yt-dlp scraper until their TTL
+        self.search_cache = SearchResultCache()
+        
+        # Requests are paced at the source, shared with every yt-dlp scraper
+        self.rate_limiter = get_rate_limiter('ytdlp')
+        
+        # In-flight requests adapt to the observed error / 429 rate
+        self.concurrency = get_concurrency_controller('ytdlp')
+        
+        # Replaced per run; checked before every request so stop takes effect quickly
+        self.cancel_token = CancellationToken()
+        self._process_cancel = None  # shared with worker processes of the current run
+        
+        # Slow flat searches are re-issued on HEDGE_BACKEND, first answer wins
+        self.latency = get_latency_tracker('ytdlp')
+        self.hedge_backend = HEDGE_BACKEND
+        self.hedger = HedgedSearch(self.latency, self.concurrency.maximum * 2) if self.hedge_backend else None
+        self._hedge_scraper = None
+        self._hedge_lock = threading.Lock()
     
     def search_videos(self, search_term, max_results=None):
         """Search for REAL YouTube videos using yt-dlp."""
+        return list(self.iter_videos(search_term, max_results))
+    
+    def collect_videos(self, search_term, max_results=None):
+        """Search a term to the end; returns (videos, completed), see iter_videos."""
+        videos = []
+        completed = _consume(self.iter_videos(search_term, max_results), videos.append)
+        return videos, completed
+    
+    def iter_videos(self, search_term, max_results=None):
+        """Yield REAL YouTube videos for a term one at a time, as soon as each is extracted.
+        
+        Search errors are logged, not raised. The generator returns True if the
+        term was searched to the end and False if it failed or was cancelled.
+        """
         if max_results is None:
             max_results = min(10, self.max_videos_per_term)
             
+        if self.two_phase:
+            return (yield from self._iter_videos_two_phase(search_term, max_results))
+        
         try:
             logger.info(f"🔍 Searching for REAL videos: '{search_term}' (max {max_results})")
             
             # YouTube search URL
             search_url = f"ytsearch{max_results}:{search_term}"
             
-            videos = []
+            found = 0
+            
+            try:
+                # process=False leaves each video to be resolved on its own; the entries are
+                # a lazy generator whose page requests must run inside the request gate
+                entries = self._ydl_request(
+                    self._ydl_pool,
+                    lambda ydl: list(islice(
+                        (ydl.extract_info(search_url, download=False, process=False) or {}).get('entries') or [],
+                        max_results
+                    ))
+                )
+            except ScrapeCancelled:
+                raise
+            except Exception as e:
+                logger.error(f"❌ yt-dlp extraction error for '{search_term}': {e}")
+                return False
             
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            for entry in entries:
+                if not entry or not entry.get('id'):  # Skip None entries
+                    continue
+                
+                video_id = entry['id']
                 try:
-                    # Extract video information
-                    result = ydl.extract_info(search_url, download=False)
-                    
-                    if result and 'entries' in result:
-                        for entry in result['entries']:
-                            if entry:  # Skip None entries
-                                video_data = self._extract_video_data(entry, search_term)
-                                if video_data and self._filter_video(video_data):
-                                    videos.append(video_data)
-                                    logger.debug(f"   ✓ '{video_data['title'][:50]}...'")
-                    
+                    info = self.video_cache.get_or_extract(
+                        video_id,
+                        lambda: self._extract_full(video_id)
+                    )
+                except ScrapeCancelled:
+                    raise
                 except Exception as e:
-                    logger.error(f"❌ yt-dlp extraction error for '{search_term}': {e}")
-                    return []
+                    logger.debug(f"Extraction failed for {video_id}: {e}")
+                    continue
+                
+                if not info:
+                    continue
+                
+                video_data = self._extract_video_data(info, search_term)
+                if video_data and self._filter_video(video_data):
+                    found += 1
+                    logger.debug(f"   ✓ '{video_data['title'][:50]}...'")
+                    yield video_data
             
-            logger.info(f"✅ Found {len(videos)} REAL videos for '{search_term}'")
-            return videos
+            logger.info(f"✅ Found {found} REAL videos for '{search_term}'")
+            return True
             
+        except ScrapeCancelled:
+            logger.debug(f"Search cancelled for '{search_term}'")
         except Exception as e:
             logger.error(f"❌ Search failed for '{search_term}': {e}")
-            return []
+        return False
+    
+    def _iter_videos_two_phase(self, search_term, max_results):
+        """Flat search first, then full extraction only for new IDs that pass prefilters."""
+        try:
+            logger.info(f"🔍 Searching for REAL videos: '{search_term}' (max {max_results}, two-phase)")
+            
+            # Phase 1: flat search returns IDs and basic fields only
+            try:
+                entries = self.search_cache.get_or_search(
+                    'ytdlp', search_term, max_results,
+                    lambda: self._search_entries(search_term, max_results)
+                )
+            except ScrapeCancelled:
+                raise
+            except Exception as e:
+                logger.error(f"❌ yt-dlp flat search error for '{search_term}': {e}")
+                return False
+            
+            self._count('flat_entries', len(entries))
+            
+            # Phase 2: full extraction only for unseen IDs that pass cheap checks
+            found = 0
+            
+            for entry in entries:
+                video_id = entry['id']
+                
+                if video_id in self.known_video_ids:
+                    self._count('skipped_known')
+                    continue
+                
+                if not self.prefilter.passes(self._with_cached_duration(entry)):
+                    continue
+                
+                try:
+                    full_entry = self.video_cache.get_or_extract(
+                        video_id,
+                        lambda: self._extract_full(video_id)
+                    )
+                except ScrapeCancelled:
+                    raise
+                except Exception as e:
+                    logger.debug(f"Full extraction failed for {video_id}: {e}")
+                    continue
+                
+                # Don't extract the same video again for another term in this run
+                self.known_video_ids.add(video_id)
+                
+                if not full_entry:
+                    continue
+                
+                video_data = self._extract_video_data(full_entry, search_term)
+                if video_data and self._filter_video(video_data):
+                    found += 1
+                    logger.debug(f"   ✓ '{video_data['title'][:50]}...'")
+                    yield video_data
+            
+            logger.info(f"✅ Found {found} REAL videos for '{search_term}' ({len(entries)} hits, {len(entries) - found} skipped)")
+            return True
+            
+        except ScrapeCancelled:
+            logger.debug(f"Search cancelled for '{search_term}'")
+        except Exception as e:
+            logger.error(f"❌ Search failed for '{search_term}': {e}")
+        return False
+    
+    def _search_entries(self, search_term, max_results):
+        """Flat-search a term, hedged on the second backend when yt-dlp is slow."""
+        search_url = f"ytsearch{max_results}:{search_term}"
+        if not self.hedger:
+            return self._flat_search(search_url)
+        
+        return self.hedger.run(
+            lambda on_start: self._flat_search(search_url, on_start),
+            lambda: self._hedge_search(search_term, max_results)
+        )
+    
+    def _flat_search(self, search_url, on_start=None):
+        """Run a flat search and return its entries that have an ID.
+        
+        Latency is measured around the request itself, not the time spent
+        waiting for the rate limiter or a concurrency slot.
+        """
+        def search(ydl):
+            started = time.monotonic()
+            result = ydl.extract_info(search_url, download=False)
+            return result, time.monotonic() - started
+        
+        result, elapsed = self._ydl_request(self._flat_ydl_pool, search, on_start)
+        entries = [entry for entry in (result or {}).get('entries') or [] if entry and entry.get('id')]
+        
+        if entries:
+            self.latency.record(elapsed)
+        return entries
+    
+    def _hedge_search(self, search_term, max_results):
+        """Search the hedge backend and return flat entries shaped like yt-dlp's."""
+        with self._hedge_lock:
+            if self._hedge_scraper is None:
+                if self.hedge_backend == 'youtube_api':
+                    from scrapers.youtube_api_scraper import YouTubeAPIScraperFast
+                    self._hedge_scraper = YouTubeAPIScraperFast()
+                else:
+                    from scrapers.real_youtube_scraper import RealYouTubeScraper
+                    self._hedge_scraper = RealYouTubeScraper()
+        
+        self.cancel_token.raise_if_cancelled()
+        
+        if self.hedge_backend == 'youtube_api':
+            return [{'id': video_id} for video_id in self._hedge_scraper.search_videos(search_term, max_results)]
+        
+        # Zero means the search page didn't show it, let the full filters decide
+        return [
+            {
+                'id': video['video_id'],
+                'title': video['title'],
+                'duration': video['duration_seconds'] or None,
+                'view_count': video['view_count'] or None,
+            }
+            for video in self._hedge_scraper.search_videos(search_term, max_results)
+        ]
+    
+    def _extract_full(self, video_id):
+        """Fully extract one video (only called on a metadata cache miss)."""
+        self._count('full_extractions')
+        return self._ydl_request(
+            self._ydl_pool,
+            lambda ydl: extract_metadata(ydl, video_id, process=not self.metadata_only)
+        )
+    
+    def _ydl_request(self, pool, request, on_start=None):
+        """Run one yt-dlp request under the rate limiter and adaptive concurrency limit.
+        
+        on_start() is called once the request holds its slot and token, just
+        before it goes out.
+        """
+        self.cancel_token.raise_if_cancelled()
+        ydl = pool.get()
+        
+        with self.concurrency.slot():
+            self.rate_limiter.acquire()
+            self.cancel_token.raise_if_cancelled()
+            if on_start:
+                on_start()
+            try:
+                result = request(ydl)
+            except Exception as e:
+                self.concurrency.record(e)
+                raise
+        
+        # ignoreerrors hides failures from us, yt-dlp only reports them to its logger
+        self.concurrency.record(pool.pop_error())
+        return result
+    
+    def _count(self, counter, amount=1):
+        """Increment a statistics counter from a worker thread."""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+    
+    def _drain_worker_stats(self):
+        """Return and reset counters so a worker process can ship them to the parent."""
+        with self._stats_lock:
+            counters = {counter: getattr(self, counter) for counter in WORKER_COUNTERS}
+            for counter in WORKER_COUNTERS:
+                setattr(self, counter, 0)
+        
+        return {
+            'counters': counters,
+            'ydl_pool': self._ydl_pool.drain_counters(),
+            'flat_ydl_pool': self._flat_ydl_pool.drain_counters(),
+            'video_cache': self.video_cache.drain_counters(),
+            'search_cache': self.search_cache.drain_counters(),
+            'prefilter': self.prefilter.drain_counters(),
+            'latency': self.latency.drain_counters(),
+            'hedger': self.hedger.drain_counters() if self.hedger else None,
+        }
+    
+    def _create_executor(self):
+        """Create the worker pool for the configured backend."""
+        if self.backend == 'process':
+            # Each worker runs one search at a time, so the worker count is the backend's
+            # concurrency; cap it at the AIMD ceiling (per-process controllers can't adapt it)
+            workers = min(YTDLP_PROCESS_WORKERS, self.concurrency.maximum)
+            self._process_cancel = multiprocessing.Event()
+            
+            logger.info(f"⚙️ Using process backend with {workers} worker processes")
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_process_worker,
+                initargs=(self.max_videos_per_term, self.known_video_ids, workers, self._process_cancel)
+            )
+        
+        # Threads up to the controller's ceiling; its limit decides how many run at once
+        return ThreadPoolExecutor(max_workers=self.concurrency.maximum)
+    
+    def _submit_search(self, executor, search_term):
+        """Submit one search term to the configured backend."""
+        if self.backend == 'process':
+            return executor.submit(_search_videos_in_process, search_term)
+        return executor.submit(self.collect_videos, search_term)
+    
+    def _search_result(self, future):
+        """Get a finished search's (videos, completed), merging worker process statistics."""
+        if self.backend != 'process':
+            return future.result()
+        
+        videos, completed, worker_stats = future.result()
+        for counter, amount in worker_stats['counters'].items():
+            self._count(counter, amount)
+        self._ydl_pool.add_counters(*worker_stats['ydl_pool'])
+        self._flat_ydl_pool.add_counters(*worker_stats['flat_ydl_pool'])
+        self.video_cache.add_counters(*worker_stats['video_cache'])
+        self.search_cache.add_counters(*worker_stats['search_cache'])
+        self.prefilter.add_counters(*worker_stats['prefilter'])
+        self.latency.add_counters(*worker_stats['latency'])
+        if self.hedger and worker_stats['hedger']:
+            self.hedger.add_counters(*worker_stats['hedger'])
+        
+        # Workers only skip the IDs they were started with, so a video two processes
+        # both found was extracted twice; keep the first copy like the thread backend
+        unique = []
+        for video in videos:
+            if video['video_id'] in self.known_video_ids:
+                self.duplicates_skipped += 1
+                continue
+            self.known_video_ids.add(video['video_id'])
+            unique.append(video)
+        return unique, completed
+    
+    def _iter_term_results(self, executor, search_terms):
+        """Yield (term, videos, term_finished, completed) as results become available.
+        
+        Thread workers stream each video through a queue the moment it is
+        extracted, so the caller can insert it before the rest of its term is
+        done. Worker processes can't share the queue and return whole terms.
+        `completed` is only meaningful once the term is finished: True if it
+        was searched to the end, False if its search failed or was cancelled.
+        """
+        if self.backend == 'process':
+            future_to_term = {self._submit_search(executor, term): term for term in search_terms}
+            
+            for future in self._completed_futures(executor, future_to_term):
+                term = future_to_term[future]
+                try:
+                    videos, completed = self._search_result(future)
+                except Exception as e:
+                    logger.error(f"❌ Failed to process '{term}': {e}")
+                    videos, completed = [], False
+                yield term, videos, True, completed
+            return
+        
+        results = queue.Queue()
+        
+        def stream_term(term):
+            completed = False
+            try:
+                completed = _consume(self.iter_videos(term), lambda video: results.put((term, video, None)))
+            finally:
+                # Sentinel: every video of this term is already in the queue
+                results.put((term, None, completed))
+        
+        for term in search_terms:
+            executor.submit(stream_term, term)
+        
+        finished = 0
+        while finished < len(search_terms):
+            if self._cancel_pending(executor):
+                return
+            
+            try:
+                term, video, completed = results.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            if video is None:
+                finished += 1
+                yield term, [], True, completed
+            else:
+                yield term, [video], False, None
+    
+    def _completed_futures(self, executor, futures):
+        """Yield futures as they finish until the run is cancelled.
+        
+        Wakes up regularly instead of blocking until the next term is done, so
+        a cancel reaches worker processes while their searches are running.
+        """
+        pending = set(futures)
+        while pending:
+            if self._cancel_pending(executor):
+                return
+            
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                if self._cancel_pending(executor):
+                    return
+                yield future
+    
+    def _cancel_pending(self, executor):
+        """Drop queued searches once cancelled; running ones stop at their next request."""
+        if not self.cancel_token.cancelled:
+            return False
+        
+        if self._process_cancel is not None:
+            self._process_cancel.set()
+        
+        logger.warning("⏹️ Scraping cancelled, dropping queued search terms")
+        executor.shutdown(wait=False, cancel_futures=True)
+        return True
+    
+    def _with_cached_duration(self, entry):
+        """Fill in a flat entry's missing duration from any cached record."""
+        if entry.get('duration') is not None:
+            return entry
+        
+        # Duration never changes, so any cached record will do
+        duration = (self.video_cache.get_stable(entry['id']) or {}).get('duration')
+        return {**entry, 'duration': duration} if duration is not None else entry
     
     def _extract_video_data(self, entry, search_term):
         """Extract video data from yt-dlp entry."""
@@ -121,74 +572,77 @@ class YtDlpRealScraper:
         
         return True
     
-    def scrape_parallel_streaming(self, search_terms, tool_name, immediate_callback, progress_callback=None):
-        """Scrape multiple search terms with IMMEDIATE processing as videos are found."""
+    def scrape_parallel_streaming(self, search_terms, tool_name, immediate_callback, progress_callback=None, cancel_token=None,
+                                  term_callback=None):
+        """Scrape multiple search terms with IMMEDIATE processing as videos are found.
+        
+        term_callback(term, videos_found) is called for each term that was
+        searched to the end, never for a failed term or after cancellation.
+        """
         total_terms = len(search_terms)
+        self.cancel_token = cancel_token or CancellationToken()
         
         logger.info(f"🚀 Starting STREAMING YouTube scraping for {total_terms} search terms ({tool_name})")
         logger.info(f"🎓 Using yt-dlp to find REAL videos (NO API key needed!)")
         logger.info(f"💡 Videos will be processed and saved IMMEDIATELY as found!")
         
-        # Use ThreadPoolExecutor for parallel scraping
-        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, 3)) as executor:
-            # Submit all search tasks
-            future_to_term = {
-                executor.submit(self.search_videos, term): term 
-                for term in search_terms
-            }
-            
-            completed = 0
-            for future in as_completed(future_to_term):
-                term = future_to_term[future]
-                completed += 1
-                
-                try:
-                    videos = future.result()
+        term_videos = {term: 0 for term in search_terms}
+        completed = 0
+        
+        # Threads by default, worker processes to scale extraction past the GIL
+        with self._create_executor() as executor:
+            for term, videos, term_finished, term_completed in self._iter_term_results(executor, search_terms):
+                if videos:
                     self.videos_found += len(videos)
+                    term_videos[term] += len(videos)
                     
                     # IMMEDIATELY process and insert videos!
-                    if videos and immediate_callback:
-                        immediate_callback(videos, term)
+                    if immediate_callback:
+                        try:
+                            immediate_callback(videos, term)
+                        except Exception as e:
+                            logger.error(f"❌ Failed to process '{term}': {e}")
+                
+                if term_finished:
+                    completed += 1
+                    
+                    if term_callback and term_completed and not self.cancel_token.cancelled:
+                        term_callback(term, term_videos[term])
                     
                     # Progress callback
                     if progress_callback:
-                        progress_callback(completed, total_terms, term, len(videos))
+                        progress_callback(completed, total_terms, term, term_videos[term])
                     
-                    logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(videos)} REAL videos")
-                    
-                    # Delay to avoid rate limiting
-                    time.sleep(1.5)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to process '{term}': {e}")
-                    if progress_callback:
-                        progress_callback(completed, total_terms, term, 0)
+                    logger.info(f"✅ [{completed}/{total_terms}] '{term}': {term_videos[term]} REAL videos")
         
+        self._ydl_pool.close_all()
+        self._flat_ydl_pool.close_all()
         logger.info(f"🎉 STREAMING scraping complete! Videos inserted to DB in real-time!")
     
-    def scrape_parallel(self, search_terms, tool_name, progress_callback=None):
+    def scrape_parallel(self, search_terms, tool_name, progress_callback=None, cancel_token=None):
         """Scrape multiple search terms in parallel (legacy method)."""
         all_videos = []
         total_terms = len(search_terms)
+        self.cancel_token = cancel_token or CancellationToken()
         
         logger.info(f"🚀 Starting REAL YouTube scraping for {total_terms} search terms ({tool_name})")
         logger.info(f"🎓 Using yt-dlp to find REAL videos for learners (NO API key needed!)")
         
-        # Use ThreadPoolExecutor for parallel scraping
-        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, 3)) as executor:
+        # Threads by default, worker processes to scale extraction past the GIL
+        with self._create_executor() as executor:
             # Submit all search tasks
             future_to_term = {
-                executor.submit(self.search_videos, term): term 
+                self._submit_search(executor, term): term 
                 for term in search_terms
             }
             
             completed = 0
-            for future in as_completed(future_to_term):
+            for future in self._completed_futures(executor, future_to_term):
                 term = future_to_term[future]
                 completed += 1
                 
                 try:
-                    videos = future.result()
+                    videos, _ = self._search_result(future)
                     
                     # Add search metadata
                     for video in videos:
@@ -204,14 +658,13 @@ class YtDlpRealScraper:
                     
                     logger.info(f"✅ [{completed}/{total_terms}] '{term}': {len(videos)} REAL videos")
                     
-                    # Delay to avoid rate limiting
-                    time.sleep(1.5)
-                    
                 except Exception as e:
                     logger.error(f"❌ Failed to process '{term}': {e}")
                     if progress_callback:
                         progress_callback(completed, total_terms, term, 0)
         
+        self._ydl_pool.close_all()
+        self._flat_ydl_pool.close_all()
         logger.info(f"🎉 REAL YouTube scraping complete! Found {len(all_videos)} REAL videos")
         return all_videos
     
@@ -220,6 +673,18 @@ class YtDlpRealScraper:
         return {
             'videos_found': self.videos_found,
             'duplicates_skipped': self.duplicates_skipped,
+            'flat_entries': self.flat_entries,
+            'full_extractions': self.full_extractions,
+            'skipped_known': self.skipped_known,
+            'skipped_prefilter': self.prefilter.get_stats()['fetches_saved'],
+            'prefilter': self.prefilter.get_stats(),
+            'ydl_pool': self._ydl_pool.get_stats(),
+            'video_cache': self.video_cache.get_stats(),
+            'search_cache': self.search_cache.get_stats(),
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': self.concurrency.get_stats(),
+            'latency': self.latency.get_stats(),
+            'hedging': self.hedger.get_stats() if self.hedger else None,
             'method': 'yt-dlp (REAL YouTube videos, NO API key needed)'
         }
 
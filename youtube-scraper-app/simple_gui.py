@@ -12,6 +12,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 from config.database import db_manager
 from scrapers.scraper_orchestrator import ScraperOrchestrator
+from utils.cancellation import CancellationToken
 
 # Setup simple logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
@@ -28,6 +29,11 @@ class ScrapingWorker(QThread):
         self.tool_name = tool_name
         self.max_videos_per_term = max_videos_per_term
         self.orchestrator = ScraperOrchestrator()
+        self.cancel_token = CancellationToken()
+    
+    def stop(self):
+        """Ask the scrape to stop at its next request (the thread then finishes normally)."""
+        self.cancel_token.cancel()
     
     def run(self):
         """Run scraping in background thread."""
@@ -35,9 +41,13 @@ class ScrapingWorker(QThread):
             self.orchestrator.scrape_tool(
                 self.tool_name, 
                 max_videos_per_term=self.max_videos_per_term,
-                progress_callback=self.progress_update.emit
+                progress_callback=self.progress_update.emit,
+                cancel_token=self.cancel_token
             )
-            self.finished.emit(True, f"✅ Scraping completed for {self.tool_name}!")
+            if self.cancel_token.cancelled:
+                self.finished.emit(False, "⏹️ Scraping stopped by user")
+            else:
+                self.finished.emit(True, f"✅ Scraping completed for {self.tool_name}!")
         except Exception as e:
             self.finished.emit(False, f"❌ Scraping failed: {e}")
 
@@ -139,6 +149,28 @@ class SimpleScraperGUI(QMainWindow):
         """)
         button_layout.addWidget(self.scrape_btn)
         
+        self.stop_btn = QPushButton("⏹️ Stop Scraping")
+        self.stop_btn.clicked.connect(self.stop_scraping)
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #f44336;
+                color: white;
+                font-size: 14px;
+                font-weight: bold;
+                padding: 15px;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #da190b;
+            }
+            QPushButton:disabled {
+                background-color: #CCCCCC;
+                color: #666666;
+            }
+        """)
+        button_layout.addWidget(self.stop_btn)
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -353,11 +385,26 @@ class SimpleScraperGUI(QMainWindow):
         # Update UI
         self.scrape_btn.setEnabled(False)
         self.scrape_btn.setText("🔄 Scraping in progress...")
+        self.stop_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         
         self.scraping_worker.start()
     
+    def stop_scraping(self):
+        """Stop the current scraping operation."""
+        if self.scraping_worker and self.scraping_worker.isRunning():
+            self.scraping_worker.stop()
+            self.stop_btn.setEnabled(False)
+            self.add_log("⏹️ Stopping after in-flight requests finish...")
+    
+    def closeEvent(self, event):
+        """Stop a running scrape before the window (and its worker thread) goes away."""
+        if self.scraping_worker and self.scraping_worker.isRunning():
+            self.scraping_worker.stop()
+            self.scraping_worker.wait()
+        event.accept()
+    
     def update_progress(self, completed, total, term, videos_found):
         """Update progress bar and log."""
         progress = int((completed / total) * 100)
@@ -368,6 +415,7 @@ class SimpleScraperGUI(QMainWindow):
         """Handle scraping completion."""
         self.scrape_btn.setEnabled(True)
         self.scrape_btn.setText("🚀 Start Scraping (NO API NEEDED!)")
+        self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         
         self.add_log(message)
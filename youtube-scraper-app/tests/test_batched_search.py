@@ -0,0 +1,87 @@
+"""Tests for searching many terms through multipart batch requests."""
+
+from scrapers.youtube_api_scraper import YouTubeAPIScraperFast
+from utils.concurrency import AdaptiveConcurrencyController
+
+# term -> page token -> (video IDs, next page token)
+PAGES = {
+    'zapier basics': {None: (['a1', 'a2'], 'page-2'), 'page-2': (['a3'], None)},
+    'n8n webhooks': {None: (['b1'], None)},
+}
+
+
+class FakeRequest:
+    method = 'GET'
+    
+    def __init__(self, term, token):
+        self.term, self.token = term, token
+
+
+class FakeBatch:
+    """Answers its requests in reverse order, like a server free to reorder parts."""
+    
+    def __init__(self):
+        self.parts = []
+    
+    def add(self, request, callback, request_id):
+        self.parts.append((request, callback, request_id))
+    
+    def execute(self):
+        for request, callback, request_id in reversed(self.parts):
+            ids, next_token = PAGES[request.term][request.token]
+            response = {'items': [{'id': {'kind': 'youtube#video', 'videoId': video_id}} for video_id in ids]}
+            if next_token:
+                response['nextPageToken'] = next_token
+            callback(request_id, response, None)
+
+
+class FakeClient:
+    def new_batch_http_request(self):
+        return FakeBatch()
+
+
+class FakeKeys:
+    def settle(self, ticket, spent=True, exhausted=False):
+        pass
+    
+    def pace(self, ticket):
+        pass
+
+
+class RecordingLimiter:
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.in_flight_at_acquire = []
+    
+    def acquire(self):
+        self.in_flight_at_acquire.append(self.concurrency.get_stats()['in_flight'])
+
+
+def batched_scraper():
+    scraper = YouTubeAPIScraperFast()
+    scraper.http_cache = None
+    scraper.youtube_clients = [FakeClient()]
+    scraper.keys = FakeKeys()
+    scraper.concurrency = AdaptiveConcurrencyController('test', 1, 1, 1)
+    scraper.rate_limiter = RecordingLimiter(scraper.concurrency)
+    scraper._reserve = lambda call_type, cost: (object(), None)
+    scraper._search_request = lambda client, term, max_results, published_after, token=None: FakeRequest(term, token)
+    return scraper
+
+
+def test_pages_are_matched_to_their_terms_when_answered_out_of_order():
+    scraper = batched_scraper()
+    found = {}
+    
+    scraper.search_videos_batched(list(PAGES), lambda term, ids: found.setdefault(term, list(ids)))
+    
+    assert found == {'zapier basics': ['a1', 'a2', 'a3'], 'n8n webhooks': ['b1']}
+
+
+def test_rate_limit_tokens_are_taken_before_the_slot():
+    scraper = batched_scraper()
+    
+    scraper.search_videos_batched(list(PAGES), lambda term, ids: None)
+    
+    # Three pages in two rounds, none of them paced while holding the only slot
+    assert scraper.rate_limiter.in_flight_at_acquire == [0, 0, 0]
@@ -0,0 +1,48 @@
+"""Tests for cancellation tokens and how cancels reach running searches."""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from scrapers.ytdlp_real_scraper import YtDlpRealScraper
+from utils.cancellation import CancellationToken
+
+
+def test_child_token_follows_its_parent():
+    parent = CancellationToken()
+    child = CancellationToken(parent)
+    
+    parent.cancel()
+    
+    assert child.cancelled
+
+
+def test_token_sees_a_cancel_from_another_process():
+    event = multiprocessing.Event()
+    token = CancellationToken(event=event)
+    
+    process = multiprocessing.Process(target=event.set)
+    process.start()
+    process.join()
+    
+    assert token.cancelled
+
+
+def test_cancel_is_noticed_while_a_term_is_still_running():
+    scraper = YtDlpRealScraper()
+    scraper.cancel_token = CancellationToken()
+    scraper._process_cancel = multiprocessing.Event()
+    release = threading.Event()
+    
+    threading.Timer(0.1, scraper.cancel_token.cancel).start()
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = [executor.submit(release.wait, 5)]
+        finished = list(scraper._completed_futures(executor, futures))
+        elapsed = time.monotonic() - started
+        release.set()
+    
+    assert finished == []
+    assert elapsed < 2
+    assert scraper._process_cancel.is_set()
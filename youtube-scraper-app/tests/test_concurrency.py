@@ -0,0 +1,140 @@
+"""Tests for the adaptive (AIMD) concurrency controller."""
+
+import asyncio
+import threading
+
+import pytest
+
+from utils.concurrency import AdaptiveConcurrencyController, is_throttle_error
+
+
+def controller(minimum=1, initial=4, maximum=8, window=10, threshold=0.1):
+    return AdaptiveConcurrencyController('test', minimum, initial, maximum, window=window,
+                                         error_threshold=threshold, decrease_factor=0.5)
+
+
+def test_limit_grows_by_one_after_a_clean_window():
+    aimd = controller()
+    for _ in range(10):
+        aimd.record()
+    
+    assert aimd.limit == 5
+
+
+def test_limit_halves_after_an_error_heavy_window():
+    aimd = controller()
+    for i in range(10):
+        aimd.record(RuntimeError('boom') if i < 2 else None)
+    
+    assert aimd.limit == 2
+
+
+def test_throttling_cuts_the_limit_immediately():
+    aimd = controller()
+    aimd.record(RuntimeError('HTTP Error 429: Too Many Requests'))
+    
+    assert aimd.limit == 2
+    assert aimd.get_stats()['throttled'] == 1
+
+
+def test_limit_stays_within_bounds():
+    aimd = controller(minimum=2, initial=2, maximum=3)
+    for _ in range(5):
+        aimd.record('429')
+    assert aimd.limit == 2
+    
+    for _ in range(50):
+        aimd.record()
+    assert aimd.limit == 3
+
+
+@pytest.mark.parametrize('error, throttled', [
+    ('HTTP Error 429', True),
+    ('userRateLimitExceeded', True),
+    ('Too Many Requests', True),
+    ('HTTP Error 404: Not Found', False),
+])
+def test_throttle_error_detection(error, throttled):
+    assert is_throttle_error(error) is throttled
+
+
+def test_slot_blocks_at_the_limit():
+    aimd = controller(initial=1)
+    entered = threading.Event()
+    
+    def second_request():
+        with aimd.slot():
+            entered.set()
+    
+    with aimd.slot():
+        worker = threading.Thread(target=second_request)
+        worker.start()
+        assert not entered.wait(0.1)
+    
+    assert entered.wait(5)
+    worker.join()
+    assert aimd.get_stats()['in_flight'] == 0
+
+
+def test_async_slots_share_the_limit_with_threads():
+    aimd = controller(initial=2)
+    peak = 0
+    
+    async def request():
+        nonlocal peak
+        async with aimd.slot_async():
+            peak = max(peak, aimd.get_stats()['in_flight'])
+            await asyncio.sleep(0.01)
+    
+    async def run_all():
+        await asyncio.gather(*[request() for _ in range(6)])
+    
+    with aimd.slot():  # a thread holds one of the two slots throughout
+        asyncio.run(run_all())
+    
+    assert peak == 2
+    assert aimd.get_stats()['in_flight'] == 0
+
+
+def test_async_waiters_get_slots_in_arrival_order():
+    aimd = controller(initial=1)
+    order = []
+    
+    async def request(n):
+        async with aimd.slot_async():
+            order.append(n)
+            await asyncio.sleep(0)
+    
+    async def run_all():
+        async with aimd.slot_async():
+            tasks = [asyncio.create_task(request(n)) for n in range(5)]
+            await asyncio.sleep(0.01)  # every task is now queued behind the held slot
+        await asyncio.gather(*tasks)
+    
+    asyncio.run(run_all())
+    
+    assert order == [0, 1, 2, 3, 4]
+    assert aimd.get_stats()['in_flight'] == 0
+
+
+def test_cancelled_async_waiter_does_not_leak_a_slot():
+    aimd = controller(initial=1)
+    
+    async def run_all():
+        async with aimd.slot_async():
+            waiting = asyncio.create_task(_hold(aimd))
+            await asyncio.sleep(0.01)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+        async with aimd.slot_async():
+            pass
+    
+    asyncio.run(run_all())
+    
+    assert aimd.get_stats()['in_flight'] == 0
+
+
+async def _hold(aimd):
+    async with aimd.slot_async():
+        await asyncio.sleep(1)
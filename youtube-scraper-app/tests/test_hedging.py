@@ -0,0 +1,133 @@
+"""Tests for rolling latency percentiles and hedged searches."""
+
+import threading
+import time
+
+import pytest
+
+from utils.hedging import HedgedSearch
+from utils.latency import LatencyTracker, percentile
+
+
+def test_percentile_is_nearest_rank():
+    samples = sorted(range(1, 101))
+    
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 100) == 100
+    assert percentile([], 50) is None
+
+
+def test_tracker_keeps_only_the_window():
+    tracker = LatencyTracker('test', window=3)
+    for seconds in [10, 1, 2, 3]:
+        tracker.record(seconds)
+    
+    assert len(tracker) == 3
+    assert tracker.percentile(100) == 3
+    assert tracker.get_stats()['samples'] == 4
+
+
+def test_tracker_ships_new_samples_between_processes():
+    worker = LatencyTracker('test')
+    worker.record(1.0)
+    worker.record(2.0)
+    
+    parent = LatencyTracker('test')
+    parent.add_counters(*worker.drain_counters())
+    
+    assert worker.drain_counters() == ([],)
+    assert parent.get_stats()['samples'] == 2
+    assert parent.percentile(50) == 1.0
+
+
+def hedger(delay=0.05, samples=()):
+    latency = LatencyTracker('test')
+    for seconds in samples:
+        latency.record(seconds)
+    return HedgedSearch(latency, max_workers=4, percentile=95, min_samples=5, default_delay=delay)
+
+
+def test_delay_follows_recent_latency():
+    assert hedger(delay=2.0).delay() == 2.0
+    assert hedger(delay=2.0, samples=[0.1, 0.2, 0.3, 0.4, 0.5]).delay() == 0.5
+
+
+def test_fast_primary_is_not_hedged():
+    search = hedger(delay=5)
+    hedge_called = threading.Event()
+    
+    result = search.run(lambda on_start: on_start() or ['primary'], lambda: hedge_called.set() or ['hedge'])
+    
+    assert result == ['primary']
+    assert not hedge_called.is_set()
+    assert search.get_stats()['hedged'] == 0
+
+
+def test_slow_primary_is_hedged_and_the_hedge_wins():
+    search = hedger(delay=0.05)
+    release_primary = threading.Event()
+    
+    def primary(on_start):
+        on_start()
+        release_primary.wait(5)
+        return ['primary']
+    
+    result = search.run(primary, lambda: ['hedge'])
+    release_primary.set()
+    
+    assert result == ['hedge']
+    assert search.get_stats() == {'searches': 1, 'hedged': 1, 'hedge_wins': 1, 'hedge_rate': 1.0}
+
+
+def test_hedge_clock_starts_when_the_primary_starts():
+    search = hedger(delay=0.3)
+    
+    def primary(on_start):
+        time.sleep(0.5)  # queued on the limiter / slot, longer than the delay
+        on_start()
+        return ['primary']
+    
+    assert search.run(primary, lambda: ['hedge']) == ['primary']
+    assert search.get_stats()['hedged'] == 0
+
+
+def test_empty_primary_answer_waits_for_the_hedge():
+    search = hedger(delay=0.01)
+    
+    def primary(on_start):
+        on_start()
+        time.sleep(0.1)
+        return []
+    
+    def hedge():
+        time.sleep(0.2)
+        return ['hedge']
+    
+    assert search.run(primary, hedge) == ['hedge']
+
+
+def test_primary_error_before_the_deadline_is_raised():
+    search = hedger(delay=5)
+    
+    def primary(on_start):
+        raise RuntimeError('primary failed before starting')
+    
+    with pytest.raises(RuntimeError):
+        search.run(primary, lambda: ['hedge'])
+    assert search.get_stats()['hedged'] == 0
+
+
+def test_both_failing_raises():
+    search = hedger(delay=0.01)
+    
+    def primary(on_start):
+        on_start()
+        time.sleep(0.1)
+        raise RuntimeError('primary failed')
+    
+    def hedge():
+        raise RuntimeError('hedge failed')
+    
+    with pytest.raises(RuntimeError):
+        search.run(primary, hedge)
@@ -0,0 +1,51 @@
+"""Tests for the on-disk HTTP response cache."""
+
+import pytest
+
+import utils.http_cache as http_cache
+from utils.http_cache import HttpResponseCache
+
+SEARCH_URL = "https://www.youtube.com/results"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpResponseCache(str(tmp_path / 'http.sqlite3'))
+
+
+def test_stored_response_is_served_fresh(cache):
+    cache.store(cache.lookup('GET', SEARCH_URL, {'search_query': 'zapier'}), SEARCH_URL, b'page')
+    
+    lookup = cache.lookup('GET', SEARCH_URL, {'search_query': 'zapier'})
+    
+    assert lookup.fresh
+    assert cache.serve(lookup) == b'page'
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_key_ignores_api_key_and_parameter_order():
+    first = HttpResponseCache.request_key('GET', SEARCH_URL, {'a': 1, 'b': 2, 'key': 'one'})
+    second = HttpResponseCache.request_key('GET', SEARCH_URL + '?key=two', {'b': 2, 'a': 1})
+    
+    assert first == second
+
+
+def test_continuations_and_unknown_endpoints_are_not_cached(cache):
+    continuation = {'context': {}, 'continuation': 'single-use-token'}
+    
+    assert cache.lookup('POST', "https://www.youtube.com/youtubei/v1/search", json_body=continuation) is None
+    assert cache.lookup('POST', SEARCH_URL) is None
+    assert cache.lookup('GET', "https://www.youtube.com/watch") is None
+
+
+def test_stale_entry_is_revalidated_with_its_etag(cache, monkeypatch):
+    cache.store(cache.lookup('GET', SEARCH_URL), SEARCH_URL, b'page', etag='"v1"')
+    now = http_cache.time.time()
+    monkeypatch.setattr(http_cache.time, 'time', lambda: now + 48 * 3600)
+    
+    lookup = cache.lookup('GET', SEARCH_URL)
+    
+    assert not lookup.fresh
+    assert lookup.conditional_headers() == {'If-None-Match': '"v1"'}
+    assert cache.serve_revalidated(lookup) == b'page'
+    assert cache.lookup('GET', SEARCH_URL).fresh
@@ -0,0 +1,44 @@
+"""Tests for the flat-entry prefilter rules."""
+
+from scrapers.prefilters import (
+    FlatEntryPrefilter, duration_rule, min_views_rule, spam_title_rule, short_title_rule
+)
+
+
+def prefilter():
+    return FlatEntryPrefilter([
+        ('duration', duration_rule(180, 1800)),
+        ('min_views', min_views_rule(500)),
+        ('spam_title', spam_title_rule()),
+        ('short_title', short_title_rule()),
+    ])
+
+
+def test_entry_within_every_rule_passes():
+    assert prefilter().passes({'id': 'a', 'title': 'Zapier basics tutorial', 'duration': 600, 'view_count': 1000})
+
+
+def test_missing_fields_are_left_to_the_full_filters():
+    assert prefilter().passes({'id': 'a'})
+
+
+def test_first_rejecting_rule_gets_the_credit():
+    rules = prefilter()
+    
+    assert not rules.passes({'id': 'a', 'duration': 60, 'view_count': 10})
+    assert not rules.passes({'id': 'b', 'title': 'Free money with n8n', 'duration': 600})
+    assert not rules.passes({'id': 'c', 'title': 'n8n', 'view_count': 10_000})
+    
+    assert rules.get_stats() == {
+        'checked': 3,
+        'fetches_saved': 3,
+        'fetches_saved_by_rule': {'duration': 1, 'min_views': 0, 'spam_title': 1, 'short_title': 1},
+    }
+
+
+def test_added_rules_run_after_the_existing_ones():
+    rules = FlatEntryPrefilter([('duration', duration_rule(180, 1800))])
+    rules.add_rule('min_views', min_views_rule(500))
+    
+    assert not rules.passes({'id': 'a', 'duration': 600, 'view_count': 10})
+    assert rules.get_stats()['fetches_saved_by_rule'] == {'duration': 0, 'min_views': 1}
@@ -0,0 +1,128 @@
+"""Tests for the persistent quota ledger and the key scheduler built on it."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+import utils.quota_ledger as quota_ledger
+from utils.quota_ledger import ApiKeyScheduler, QuotaExhausted, QuotaLedger, key_id, pacific_day
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return QuotaLedger(str(tmp_path / 'quota.sqlite3'))
+
+
+def scheduler(ledger, keys=('key-a', 'key-b'), limit=1000):
+    # A rate of 0 disables per-key pacing
+    return ApiKeyScheduler(list(keys), ledger=ledger, limit=limit, key_rate=0)
+
+
+def test_ledger_sums_units_per_key_and_day(ledger):
+    ledger.spend('key-a', 'search', 100)
+    ledger.spend('key-a', 'search', 100)
+    ledger.spend('key-a', 'videos', 1, day='2026-01-01')
+    ledger.spend('key-b', 'videos', 1)
+    
+    assert ledger.used() == {key_id('key-a'): 200, key_id('key-b'): 1}
+    assert ledger.used('2026-01-01') == {key_id('key-a'): 1}
+    assert ledger.breakdown()[key_id('key-a')]['search'] == {'units': 200, 'calls': 2}
+
+
+def test_ledger_never_stores_the_key_itself(ledger):
+    ledger.spend('secret-key', 'search', 100)
+    
+    with open(ledger.path, 'rb') as f:
+        assert b'secret-key' not in f.read()
+
+
+def test_ledger_is_shared_between_instances(ledger):
+    ledger.spend('key-a', 'search', 100)
+    
+    assert QuotaLedger(ledger.path).used() == {key_id('key-a'): 100}
+
+
+def test_reserve_picks_key_with_most_headroom(ledger):
+    ledger.spend('key-a', 'search', 300)
+    keys = scheduler(ledger)
+    
+    assert keys.reserve('search', 100).api_key == 'key-b'
+
+
+def test_reservations_in_flight_count_against_headroom(ledger):
+    keys = scheduler(ledger, limit=150)
+    
+    first = keys.reserve('search', 100)
+    second = keys.reserve('search', 100)
+    
+    assert {first.api_key, second.api_key} == {'key-a', 'key-b'}
+    with pytest.raises(QuotaExhausted):
+        keys.reserve('search', 100)
+
+
+def test_settle_records_spent_units(ledger):
+    keys = scheduler(ledger)
+    
+    ticket = keys.reserve('search', 100)
+    keys.settle(ticket)
+    
+    assert ledger.used() == {key_id(ticket.api_key): 100}
+    assert keys.units_spent == 100
+    assert keys.headroom() == 1000  # the other key is untouched
+
+
+def test_settle_without_spending_releases_the_reservation(ledger):
+    keys = scheduler(ledger, keys=['key-a'], limit=100)
+    
+    keys.settle(keys.reserve('search', 100), spent=False)
+    
+    assert ledger.used() == {}
+    assert keys.units_spent == 0
+    assert keys.reserve('search', 100).api_key == 'key-a'
+
+
+def test_exhausted_key_is_skipped_for_the_rest_of_the_day(ledger):
+    keys = scheduler(ledger)
+    ledger.spend('key-a', 'search', 100)
+    
+    ticket = keys.reserve('search', 100)
+    assert ticket.api_key == 'key-b'
+    keys.settle(ticket, exhausted=True)
+    
+    assert ledger.used()[key_id('key-b')] == 1000
+    assert keys.units_spent == 0
+    
+    # A new scheduler (a later run) reads the same ledger and avoids the key
+    assert scheduler(ledger).reserve('search', 100).api_key == 'key-a'
+
+
+def test_reserve_raises_when_every_key_is_spent(ledger):
+    keys = scheduler(ledger, limit=100)
+    ledger.spend('key-a', 'search', 100)
+    ledger.spend('key-b', 'search', 1)
+    
+    with pytest.raises(QuotaExhausted):
+        keys.reserve('search', 100)
+    assert keys.reserve('videos', 1).api_key == 'key-b'
+
+
+def test_yesterdays_spend_does_not_count_today(ledger):
+    keys = scheduler(ledger, keys=['key-a'], limit=100)
+    ledger.spend('key-a', 'search', 100, day='2000-01-01')
+    
+    assert keys.headroom() == 100
+
+
+@pytest.mark.parametrize('utc_time, day', [
+    (datetime(2026, 1, 15, 7, 59, tzinfo=timezone.utc), '2026-01-14'),
+    (datetime(2026, 1, 15, 8, 0, tzinfo=timezone.utc), '2026-01-15'),
+])
+def test_quota_day_rolls_over_at_midnight_pacific(monkeypatch, utc_time, day):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return utc_time.astimezone(tz)
+    
+    monkeypatch.setattr(quota_ledger, 'datetime', FrozenDatetime)
+    
+    assert pacific_day() == day
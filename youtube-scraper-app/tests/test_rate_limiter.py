@@ -0,0 +1,84 @@
+"""Tests for the shared token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+import utils.rate_limiter as rate_limiter
+from utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping just moves the clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', clock)
+    return clock
+
+
+def test_burst_is_available_immediately(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert clock.now == 1000.0
+
+
+def test_acquire_waits_for_the_next_token(clock):
+    bucket = TokenBucket(rate=2, burst=1)
+    bucket.acquire()
+    
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1000.5)
+    assert bucket.get_stats()['requests'] == 2
+    assert bucket.get_stats()['waited_seconds'] == 0.5
+
+
+def test_tokens_refill_up_to_the_burst(clock):
+    bucket = TokenBucket(rate=1, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    
+    clock.now += 60
+    
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_set_rate_changes_the_refill(clock):
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.acquire()
+    bucket.set_rate(4)
+    
+    assert bucket.acquire() == pytest.approx(0.25)
+
+
+def test_zero_rate_disables_limiting(clock):
+    bucket = TokenBucket(rate=0, burst=1)
+    
+    assert [bucket.acquire() for _ in range(100)] == [0] * 100
+
+
+def test_acquire_async_sleeps_on_the_loop(clock, monkeypatch):
+    async def fake_sleep(seconds):
+        clock.now += seconds
+    
+    monkeypatch.setattr(rate_limiter.asyncio, 'sleep', fake_sleep)
+    bucket = TokenBucket(rate=2, burst=1)
+    
+    async def acquire_twice():
+        await bucket.acquire_async()
+        return await bucket.acquire_async()
+    
+    assert asyncio.run(acquire_twice()) == pytest.approx(0.5)
@@ -0,0 +1,156 @@
+"""Tests for the run journal and which terms a scrape journals (resume and cancel)."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import scrapers.ytdlp_real_scraper as ytdlp_real_scraper
+import utils.run_journal as run_journal
+from scrapers.ytdlp_real_scraper import YtDlpRealScraper
+from utils.cancellation import CancellationToken, ScrapeCancelled
+from utils.run_journal import RunJournal
+from utils.search_cache import SearchResultCache
+from utils.video_metadata_cache import VideoMetadataCache
+
+
+@pytest.fixture(autouse=True)
+def journal_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_journal, 'RUN_JOURNAL_DIR', str(tmp_path / 'runs'))
+    return tmp_path / 'runs'
+
+
+def test_resume_skips_journaled_terms():
+    journal = RunJournal.open('zapier')
+    journal.record_term('zapier basics', found=10, inserted=4)
+    
+    resumed = RunJournal.open('zapier', resume=True)
+    
+    assert resumed.path == journal.path
+    assert resumed.remaining(['zapier basics', 'zapier webhooks']) == ['zapier webhooks']
+    assert resumed.completed['zapier basics']['inserted'] == 4
+
+
+def test_finished_run_is_not_resumed():
+    journal = RunJournal.open('zapier')
+    journal.record_term('zapier basics', found=10, inserted=4)
+    journal.finish()
+    
+    resumed = RunJournal.open('zapier', resume=True)
+    
+    assert resumed.path != journal.path
+    assert resumed.completed == {}
+
+
+def test_without_resume_a_new_run_starts():
+    RunJournal.open('zapier').record_term('zapier basics', 1, 1)
+    
+    assert RunJournal.open('zapier').completed == {}
+
+
+def test_torn_last_line_reruns_that_term():
+    journal = RunJournal.open('zapier')
+    journal.record_term('zapier basics', 1, 1)
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "term", "term": "zapier web')
+    
+    resumed = RunJournal.open('zapier', resume=True)
+    
+    assert list(resumed.completed) == ['zapier basics']
+
+
+def test_append_after_a_torn_line_is_readable():
+    journal = RunJournal.open('zapier')
+    journal.record_term('zapier basics', 1, 1)
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "term", "term": "zapier web')
+    
+    RunJournal.open('zapier', resume=True).record_term('zapier webhooks', 2, 2)
+    resumed = RunJournal.open('zapier', resume=True)
+    
+    assert list(resumed.completed) == ['zapier basics', 'zapier webhooks']
+
+
+def test_journals_are_per_tool():
+    RunJournal.open('zapier').record_term('zapier basics', 1, 1)
+    
+    assert RunJournal.open('n8n', resume=True).completed == {}
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """A thread-backend scraper whose searches are stubbed: 'bad' fails, 'slow' is cancelled."""
+    scraper = YtDlpRealScraper()
+    scraper.backend = 'thread'
+    scraper.two_phase = True
+    scraper.hedger = None
+    scraper.prefilter.rules = []
+    scraper.search_cache = SearchResultCache(str(tmp_path / 'search.sqlite3'))
+    scraper.video_cache = VideoMetadataCache(str(tmp_path / 'videos.sqlite3'))
+    
+    def search_entries(term, max_results):
+        if term == 'bad':
+            raise RuntimeError('search failed')
+        if term == 'slow':
+            raise ScrapeCancelled()
+        return [{'id': f'{term}-{i}'} for i in range(2)]
+    
+    scraper._search_entries = search_entries
+    scraper._extract_full = lambda video_id: {'id': video_id}
+    scraper._extract_video_data = lambda info, term: {'video_id': info['id'], 'title': info['id']}
+    scraper._filter_video = lambda video: True
+    return scraper
+
+
+def journaled_terms(scraper, terms, cancel_token=None):
+    """Run a streaming scrape and return the terms it would journal."""
+    journal = RunJournal.open('zapier')
+    progress = []
+    scraper.scrape_parallel_streaming(
+        terms, 'zapier', lambda videos, term: None,
+        lambda completed, total, term, found: progress.append(term),
+        cancel_token,
+        term_callback=lambda term, found: journal.record_term(term, found, 0)
+    )
+    return set(RunJournal.open('zapier', resume=True).completed), set(progress)
+
+
+def test_failed_and_cancelled_terms_are_not_journaled(scraper):
+    journaled, progressed = journaled_terms(scraper, ['good', 'bad', 'slow'])
+    
+    # Every term reports progress, only the clean one is journaled
+    assert progressed == {'good', 'bad', 'slow'}
+    assert journaled == {'good'}
+
+
+def test_nothing_is_journaled_once_cancelled(scraper):
+    token = CancellationToken()
+    token.cancel()
+    
+    journaled, _ = journaled_terms(scraper, ['good', 'other'], token)
+    
+    assert journaled == set()
+
+
+def test_collect_videos_reports_completion(scraper):
+    assert scraper.collect_videos('good') == ([{'video_id': 'good-0', 'title': 'good-0'},
+                                               {'video_id': 'good-1', 'title': 'good-1'}], True)
+    assert scraper.collect_videos('bad') == ([], False)
+
+
+def test_process_backend_journals_only_completed_terms(scraper, monkeypatch):
+    worker_stats = scraper._drain_worker_stats()
+    
+    def search_in_process(term):
+        if term == 'crashed':
+            raise RuntimeError('worker died')
+        return [{'video_id': f'{term}-0', 'title': term}], term != 'failed', worker_stats
+    
+    monkeypatch.setattr(ytdlp_real_scraper, '_search_videos_in_process', search_in_process)
+    scraper.backend = 'process'
+    scraper.cancel_token = CancellationToken()
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = {term: completed for term, _, finished, completed
+                   in scraper._iter_term_results(executor, ['good', 'failed', 'crashed'])}
+    
+    assert results == {'good': True, 'failed': False, 'crashed': False}
@@ -0,0 +1,50 @@
+"""Tests for the persistent search-result cache."""
+
+import pytest
+
+import utils.search_cache as search_cache
+from utils.search_cache import SearchResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SearchResultCache(str(tmp_path / 'search.sqlite3'), ttl_hours=1)
+
+
+def test_query_spelling_variants_share_an_entry(cache):
+    cache.put('ytdlp', 'Zapier  Basics', 2, [{'id': 'a'}, {'id': 'b'}])
+    
+    assert cache.get('ytdlp', 'zapier basics', 2) == [{'id': 'a'}, {'id': 'b'}]
+    assert cache.get('youtube_web', 'zapier basics', 2) is None
+
+
+def test_only_flat_fields_are_stored(cache):
+    cache.put('ytdlp', 'zapier', 1, [{'id': 'a', 'title': 'Zapier', 'formats': ['huge'], 'duration': None}])
+    
+    assert cache.get('ytdlp', 'zapier', 1) == [{'id': 'a', 'title': 'Zapier'}]
+
+
+def test_shorter_requests_are_served_longer_ones_are_not(cache):
+    cache.put('ytdlp', 'zapier', 2, [{'id': 'a'}, {'id': 'b'}])
+    
+    assert cache.get('ytdlp', 'zapier', 1) == [{'id': 'a'}]
+    assert cache.get('ytdlp', 'zapier', 3) is None
+
+
+def test_expired_and_empty_results_are_searched_again(cache, monkeypatch):
+    searches = []
+    
+    def search():
+        searches.append(1)
+        return [{'id': 'a'}]
+    
+    cache.put('ytdlp', 'n8n', 1, [])
+    cache.get_or_search('ytdlp', 'n8n', 1, search)
+    cache.get_or_search('ytdlp', 'n8n', 1, search)
+    
+    now = search_cache.time.time()
+    monkeypatch.setattr(search_cache.time, 'time', lambda: now + 2 * 3600)
+    cache.get_or_search('ytdlp', 'n8n', 1, search)
+    
+    assert len(searches) == 2
+    assert cache.get_stats()['expired'] == 1
@@ -0,0 +1,63 @@
+"""Tests for the bounded streaming top-k selection."""
+
+from utils.top_k import TopKVideos
+
+
+def video(video_id, score):
+    return {'video_id': video_id, 'quality_score': score}
+
+
+def test_keeps_the_k_best_best_first():
+    top = TopKVideos(3)
+    for video_id, score in [('a', 10), ('b', 50), ('c', 30), ('d', 40), ('e', 20)]:
+        top.offer(video(video_id, score))
+    
+    assert [v['video_id'] for v in top.videos()] == ['b', 'd', 'c']
+    assert top.min_score == 30
+    assert top.offered == 5
+
+
+def test_offer_reports_whether_the_candidate_got_in():
+    top = TopKVideos(1)
+    
+    assert top.offer(video('a', 10)) is True
+    assert top.offer(video('b', 5)) is False
+    assert top.offer(video('c', 10)) is False  # a tie doesn't displace
+    assert top.offer(video('d', 11)) is True
+
+
+def test_same_video_counts_once():
+    top = TopKVideos(3)
+    top.offer(video('a', 10))
+    
+    assert top.offer(video('a', 99)) is False
+    assert len(top) == 1
+
+
+def test_evicted_video_can_enter_again():
+    top = TopKVideos(1)
+    top.offer(video('a', 10))
+    top.offer(video('b', 20))
+    
+    assert top.offer(video('a', 30)) is True
+    assert [v['video_id'] for v in top.videos()] == ['a']
+
+
+def test_ties_keep_arrival_order():
+    top = TopKVideos(3)
+    for video_id in 'xyz':
+        top.offer(video(video_id, 5))
+    
+    assert [v['video_id'] for v in top.videos()] == ['x', 'y', 'z']
+
+
+def test_fill_state():
+    top = TopKVideos(2, score_key='score')
+    assert top.min_score == 0
+    assert not top.is_full
+    
+    top.offer({'video_id': 'a', 'score': 3})
+    top.offer({'video_id': 'b', 'score': 7})
+    
+    assert top.is_full
+    assert top.min_score == 3
@@ -0,0 +1,114 @@
+"""Tests for coalescing video IDs from many searches into shared videos.list batches."""
+
+import threading
+
+from utils.video_coalescer import VideoIdCoalescer
+
+
+class Recorder:
+    """fetch_batch and on_term doubles that remember every call."""
+    
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.batches = []
+        self.delivered = {}
+        self.lock = threading.Lock()
+        self.delivered_event = threading.Event()
+    
+    def fetch_batch(self, video_ids):
+        with self.lock:
+            self.batches.append(list(video_ids))
+        if self.fail_ids & set(video_ids):
+            raise RuntimeError('batch failed')
+        return {video_id: {'video_id': video_id} for video_id in video_ids}
+    
+    def on_term(self, term, video_ids, videos):
+        with self.lock:
+            self.delivered[term] = (video_ids, [video['video_id'] for video in videos])
+        self.delivered_event.set()
+
+
+def coalescer(recorder, batch_size=50, flush_delay=60):
+    return VideoIdCoalescer(recorder.fetch_batch, recorder.on_term, max_workers=2,
+                            batch_size=batch_size, flush_delay=flush_delay)
+
+
+def test_ids_found_by_several_terms_are_fetched_once():
+    recorder = Recorder()
+    videos = coalescer(recorder)
+    
+    videos.add('a', ['v1', 'v2'])
+    videos.add('b', ['v2', 'v3', 'v2'])
+    videos.close()
+    
+    assert sorted(sum(recorder.batches, [])) == ['v1', 'v2', 'v3']
+    assert recorder.delivered == {
+        'a': (['v1', 'v2'], ['v1', 'v2']),
+        'b': (['v2', 'v3'], ['v2', 'v3']),
+    }
+    assert videos.get_stats()['ids_requested'] == 3
+    assert videos.get_stats()['ids_deduplicated'] == 1
+
+
+def test_full_batches_go_out_before_close():
+    recorder = Recorder()
+    videos = coalescer(recorder, batch_size=3)
+    
+    videos.add('a', ['v1', 'v2', 'v3', 'v4'])
+    
+    # 'a' still waits on v4, which only goes out on close
+    assert not recorder.delivered_event.wait(0.1)
+    videos.close()
+    
+    assert recorder.batches == [['v1', 'v2', 'v3'], ['v4']]
+    assert videos.get_stats()['batches'] == 2
+    assert videos.get_stats()['partial_batches'] == 1
+
+
+def test_partial_batch_is_flushed_after_the_delay():
+    recorder = Recorder()
+    videos = coalescer(recorder, batch_size=50, flush_delay=0.05)
+    
+    videos.add('a', ['v1'])
+    
+    # Delivered by the flush deadline alone, without close()
+    assert recorder.delivered_event.wait(5)
+    assert recorder.delivered['a'] == (['v1'], ['v1'])
+    videos.close()
+
+
+def test_ids_already_fetched_complete_a_term_immediately():
+    recorder = Recorder()
+    videos = coalescer(recorder, flush_delay=0.05)
+    videos.add('a', ['v1'])
+    assert recorder.delivered_event.wait(5)
+    
+    # add() itself delivers 'b', nothing is fetched again
+    videos.add('b', ['v1'])
+    
+    assert recorder.delivered['b'] == (['v1'], ['v1'])
+    videos.close()
+    assert recorder.batches == [['v1']]
+
+
+def test_failed_batch_only_empties_its_own_ids():
+    recorder = Recorder(fail_ids={'bad'})
+    videos = coalescer(recorder, batch_size=2)
+    
+    videos.add('a', ['v1', 'bad'])
+    videos.add('b', ['v2', 'v3'])
+    videos.close()
+    
+    assert recorder.delivered['a'] == (['v1', 'bad'], [])
+    assert recorder.delivered['b'] == (['v2', 'v3'], ['v2', 'v3'])
+
+
+def test_term_with_no_ids_is_delivered_empty():
+    recorder = Recorder()
+    videos = coalescer(recorder)
+    
+    videos.add('a', [])
+    videos.close()
+    
+    assert recorder.delivered == {'a': ([], [])}
+    assert recorder.batches == []
@@ -0,0 +1,68 @@
+"""Tests for the persistent per-video metadata cache and its use by the yt-dlp scraper."""
+
+import pytest
+
+import utils.video_metadata_cache as video_metadata_cache
+from scrapers.ytdlp_real_scraper import YtDlpRealScraper
+from utils.search_cache import SearchResultCache
+from utils.video_metadata_cache import VideoMetadataCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return VideoMetadataCache(str(tmp_path / 'videos.sqlite3'), stats_ttl_hours=1)
+
+
+def test_put_then_get(cache):
+    cache.put('abc', {'id': 'abc', 'title': 'Zapier basics', 'view_count': 10})
+    
+    assert cache.get('abc') == {'id': 'abc', 'title': 'Zapier basics', 'view_count': 10}
+    assert cache.get('missing') is None
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['misses'] == 1
+
+
+def test_stale_stats_are_a_miss_but_stable_fields_remain(cache, monkeypatch):
+    cache.put('abc', {'id': 'abc', 'title': 'Zapier basics', 'view_count': 10})
+    now = video_metadata_cache.time.time()
+    monkeypatch.setattr(video_metadata_cache.time, 'time', lambda: now + 2 * 3600)
+    
+    assert cache.get('abc') is None
+    assert cache.get_stats()['expired'] == 1
+    assert cache.get_stable('abc') == {'id': 'abc', 'title': 'Zapier basics'}
+
+
+def test_get_or_extract_only_extracts_on_a_miss(cache):
+    calls = []
+    
+    def extract():
+        calls.append(1)
+        return {'id': 'abc'}
+    
+    assert cache.get_or_extract('abc', extract) == {'id': 'abc'}
+    assert cache.get_or_extract('abc', extract) == {'id': 'abc'}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('two_phase', [False, True])
+def test_scraper_serves_repeat_videos_from_the_cache(tmp_path, two_phase):
+    scraper = YtDlpRealScraper()
+    scraper.two_phase = two_phase
+    scraper.hedger = None
+    scraper.prefilter.rules = []
+    scraper.search_cache = SearchResultCache(str(tmp_path / 'search.sqlite3'))
+    scraper.video_cache = VideoMetadataCache(str(tmp_path / 'videos.sqlite3'))
+    
+    entries = [{'id': 'a'}, {'id': 'b'}]
+    extracted = []
+    scraper._search_entries = lambda term, max_results: entries
+    scraper._ydl_request = lambda pool, request, on_start=None: entries
+    scraper._extract_full = lambda video_id: extracted.append(video_id) or {'id': video_id}
+    scraper._extract_video_data = lambda info, term: {'video_id': info['id'], 'title': info['id']}
+    scraper._filter_video = lambda video: True
+    
+    scraper.collect_videos('zapier basics')
+    scraper.known_video_ids.clear()
+    scraper.collect_videos('zapier basics')
+    
+    assert extracted == ['a', 'b']
@@ -0,0 +1,63 @@
+"""Tests for pulling ytInitialData and the INNERTUBE config out of raw YouTube pages."""
+
+import json
+
+import pytest
+
+from utils.yt_initial_data import extract_initial_data, extract_innertube_config
+
+DATA = {'contents': {'text': 'a "quoted" };</script-like string'}, 'n': [1, 2, 3]}
+
+
+def page(assignment, data=DATA, tail=';</script><script>var other = {"x": 1};</script>'):
+    return f'<html><script>{assignment}{json.dumps(data)}{tail}</html>'
+
+
+@pytest.mark.parametrize('assignment', [
+    'var ytInitialData = ',
+    'window["ytInitialData"] = ',
+    'ytInitialData = ',
+])
+def test_initial_data_for_each_assignment(assignment):
+    assert extract_initial_data(page(assignment).encode('utf-8')) == DATA
+
+
+def test_initial_data_from_str_and_unicode():
+    data = {'title': 'Zapier für Anfänger 🚀'}
+    
+    assert extract_initial_data(page('var ytInitialData = ', data)) == data
+
+
+def test_initial_data_without_closing_script_tag():
+    assert extract_initial_data(b'var ytInitialData = {"a": 1}') == {'a': 1}
+
+
+@pytest.mark.parametrize('content', [
+    b'<html>no data here</html>',
+    b'<script>var ytInitialData = {"a": </script>',
+    b'<script>var ytInitialData = [1, 2];</script>',
+])
+def test_initial_data_missing_or_invalid(content):
+    assert extract_initial_data(content) is None
+
+
+CONFIG_PAGE = (
+    b'<script>ytcfg.set({"INNERTUBE_API_KEY":"AIzaTest","INNERTUBE_CONTEXT":'
+    b'{"client":{"hl":"en","clientName":"WEB"}},"OTHER":1});</script>'
+)
+
+
+def test_innertube_config():
+    assert extract_innertube_config(CONFIG_PAGE) == ('AIzaTest', {'client': {'hl': 'en', 'clientName': 'WEB'}})
+    assert extract_innertube_config(CONFIG_PAGE.decode('utf-8'))[0] == 'AIzaTest'
+
+
+@pytest.mark.parametrize('content', [
+    b'"INNERTUBE_CONTEXT":{"client":{}}',
+    b'"INNERTUBE_API_KEY":"AIzaTest"',
+    b'"INNERTUBE_API_KEY":"","INNERTUBE_CONTEXT":{"client":{}}',
+    b'"INNERTUBE_API_KEY":"AIzaTest","INNERTUBE_CONTEXT":"not an object"',
+    b'"INNERTUBE_API_KEY":"AIzaTest","INNERTUBE_CONTEXT":{"client":',
+])
+def test_innertube_config_missing_or_invalid(content):
+    assert extract_innertube_config(content) is None
@@ -13,6 +13,7 @@ import logging
 from datetime import datetime
 
 from scrapers.scraper_orchestrator import ScraperOrchestrator
+from utils.cancellation import CancellationToken
 from config.database import db_manager
 from config.tools_config import AUTOMATION_TOOLS
 
@@ -32,6 +33,11 @@ class ScraperThread(QThread):
         self.categories = categories
         self.scrape_both = scrape_both
         self.orchestrator = ScraperOrchestrator()
+        self.cancel_token = CancellationToken()
+    
+    def stop(self):
+        """Ask the scrape to stop at its next request (the thread then finishes normally)."""
+        self.cancel_token.cancel()
     
     def run(self):
         """Run scraping in background thread."""
@@ -46,16 +52,21 @@ class ScraperThread(QThread):
                 )
             
             if self.scrape_both:
-                success = self.orchestrator.scrape_both_tools(progress_callback)
+                success = self.orchestrator.scrape_both_tools(progress_callback, self.cancel_token)
             else:
                 success = self.orchestrator.scrape_tool(
                     self.tool_name,
                     self.categories,
-                    progress_callback
+                    progress_callback,
+                    cancel_token=self.cancel_token
                 )
             
             stats = self.orchestrator.get_stats()
-            self.finished_signal.emit(success, stats)
+            if self.cancel_token.cancelled:
+                stats['cancelled'] = True
+                self.finished_signal.emit(False, stats)
+            else:
+                self.finished_signal.emit(success, stats)
             
         except Exception as e:
             logger.error(f"Scraping error: {e}")
@@ -377,9 +388,9 @@ class MainWindow(QMainWindow):
     def stop_scraping(self):
         """Stop the scraping process."""
         if self.scraper_thread and self.scraper_thread.isRunning():
-            self.scraper_thread.terminate()
-            self.add_log("⏹️ Scraping stopped by user", "WARNING")
-            self.on_scraping_finished(False, {})
+            self.scraper_thread.stop()
+            self.stop_btn.setEnabled(False)
+            self.add_log("⏹️ Stopping after in-flight requests finish...", "WARNING")
     
     def on_progress_update(self, completed, total, term, found):
         """Handle progress updates."""
@@ -427,6 +438,8 @@ class MainWindow(QMainWindow):
                 "Scraping Complete",
                 f"Successfully scraped and inserted {stats.get('total_inserted', 0)} videos!"
             )
+        elif stats.get('cancelled'):
+            self.add_log(f"⏹️ Scraping stopped by user ({stats.get('total_inserted', 0)} videos inserted before stopping)", "WARNING")
         else:
             self.add_log("❌ Scraping failed or was stopped", "ERROR")
         
@@ -0,0 +1,63 @@
+"""Load the YouTube Data API discovery document once and build per-key clients from it."""
+
+import json
+import logging
+import os
+import threading
+import requests
+from googleapiclient.discovery import DISCOVERY_URI, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from config.settings import API_DISCOVERY_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_documents = {}
+_documents_lock = threading.Lock()
+
+
+def _read_document(service, version):
+    """Discovery document text: the disk cache, then the client's bundled copy, then the network."""
+    path = os.path.join(API_DISCOVERY_CACHE_DIR, f"{service}.{version}.json")
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    
+    document = get_static_doc(service, version)
+    if document:
+        return document
+    
+    logger.info(f"🌐 Fetching {service} {version} discovery document")
+    response = requests.get(DISCOVERY_URI.format(api=service, apiVersion=version), timeout=30)
+    response.raise_for_status()
+    document = response.text
+    
+    # Written atomically so a crash never leaves a truncated document behind
+    os.makedirs(API_DISCOVERY_CACHE_DIR, exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(document)
+    os.replace(path + '.tmp', path)
+    return document
+
+
+def get_discovery_document(service='youtube', version='v3'):
+    """Parsed discovery document, loaded once per process."""
+    with _documents_lock:
+        if (service, version) not in _documents:
+            _documents[(service, version)] = json.loads(_read_document(service, version))
+        return _documents[(service, version)]
+
+
+def build_clients(api_keys, service='youtube', version='v3'):
+    """One client per API key, all built from the same parsed discovery document.
+    
+    Returns {api_key: client}; a key whose client fails to build is logged and left out.
+    """
+    document = get_discovery_document(service, version)
+    
+    clients = {}
+    for api_key in api_keys:
+        try:
+            clients[api_key] = build_from_document(document, developerKey=api_key)
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize API client: {e}")
+    return clients
@@ -0,0 +1,34 @@
+"""Partial-response field masks for YouTube Data API calls.
+
+Each mask lists exactly what the calling parser reads, plus the top-level
+etag the HTTP cache revalidates with. Keep a mask in step with its parser:
+a field left out of the mask is simply missing from the response.
+"""
+
+from config.settings import API_FIELD_MASKS
+
+# search().list in YouTubeAPIScraperFast: video IDs and the next page only
+SEARCH_ID_FIELDS = 'etag,nextPageToken,items(id(kind,videoId))'
+
+# search().list in YouTubeAPIScraperFixed: IDs plus the snippet fields it stores
+SEARCH_SNIPPET_FIELDS = (
+    'etag,items(id/videoId,'
+    'snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/high/url))'
+)
+
+# videos().list in YouTubeAPIScraperFast (_parse_video_data)
+VIDEO_DETAILS_FIELDS = (
+    'etag,items(id,'
+    'snippet(title,description,channelTitle,channelId,publishedAt,'
+    'thumbnails(maxres/url,high/url,medium/url,default/url)),'
+    'contentDetails/duration,'
+    'statistics(viewCount,likeCount,commentCount))'
+)
+
+# videos().list in YouTubeAPIScraperFixed (_get_video_details)
+VIDEO_STATS_FIELDS = 'etag,items(id,contentDetails/duration,statistics(viewCount,likeCount,commentCount))'
+
+
+def field_mask(fields):
+    """The mask to send as `fields`, or None to request full responses."""
+    return fields if API_FIELD_MASKS else None
@@ -0,0 +1,125 @@
+"""asyncio engine that keeps many search-page fetches in flight at once."""
+
+import asyncio
+import logging
+import time
+import aiohttp
+from config.settings import WEB_ASYNC_MAX_IN_FLIGHT
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import get_concurrency_controller
+from utils.latency import get_latency_tracker
+from utils.http_cache import get_http_cache
+
+logger = logging.getLogger(__name__)
+
+
+class FollowUp:
+    """A parse result that needs one more request for the same term.
+    
+    The engine sends the request and passes its content to parse(content),
+    which returns the term's result or another FollowUp. If the request
+    fails, `partial` is the term's result.
+    """
+    
+    def __init__(self, partial, method, url, parse, params=None, json_body=None):
+        self.partial = partial
+        self.method = method
+        self.url = url
+        self.parse = parse
+        self.params = params
+        self.json_body = json_body
+
+
+class AsyncSearchEngine:
+    """Fetches one page per search term on a single event loop.
+    
+    Fetches hold a slot of the backend's adaptive concurrency controller, so
+    they follow its current limit; `max_in_flight` only caps the connection
+    pool. The backend's shared token bucket paces when each one is sent, so a
+    sweep takes about terms / rate seconds instead of terms x page latency / threads.
+    Pages are parsed, and the SQLite response cache is read and written, in
+    worker threads to keep the loop free for I/O.
+    """
+    
+    def __init__(self, backend, headers, max_in_flight=WEB_ASYNC_MAX_IN_FLIGHT, timeout=30):
+        self.headers = headers
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        
+        # Same pacing, error accounting and latency as the backend's blocking requests
+        self.rate_limiter = get_rate_limiter(backend)
+        self.concurrency = get_concurrency_controller(backend)
+        self.latency = get_latency_tracker(backend)
+        
+        # Same on-disk response cache as the blocking client
+        self.cache = get_http_cache()
+    
+    def run(self, search_terms, build_request, parse, on_result):
+        """Search every term; calls on_result(term, result) in this thread as each finishes.
+        
+        build_request(term) returns (url, params) and parse(term, content)
+        returns the term's result, or a FollowUp to fetch a further page on
+        this loop first. A failed fetch is logged and reported as [].
+        """
+        asyncio.run(self._run(search_terms, build_request, parse, on_result))
+    
+    async def _run(self, search_terms, build_request, parse, on_result):
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout) as session:
+            async def search(term):
+                url, params = build_request(term)
+                try:
+                    content = await self._fetch(session, semaphore, 'GET', url, params)
+                    result = await asyncio.to_thread(parse, term, content)
+                except Exception as e:
+                    logger.error(f"❌ Search failed for '{term}': {e}")
+                    return term, []
+                
+                while isinstance(result, FollowUp):
+                    follow_up = result
+                    try:
+                        content = await self._fetch(
+                            session, semaphore, follow_up.method, follow_up.url, follow_up.params, follow_up.json_body
+                        )
+                        result = await asyncio.to_thread(follow_up.parse, content)
+                    except Exception as e:
+                        logger.debug(f"Follow-up request failed for '{term}': {e}")
+                        result = follow_up.partial
+                return term, result
+            
+            for next_done in asyncio.as_completed([search(term) for term in search_terms]):
+                term, result = await next_done
+                on_result(term, result)
+    
+    async def _fetch(self, session, semaphore, method, url, params=None, json_body=None):
+        """Fetch one response from the cache, or under the concurrency limit and rate limit."""
+        lookup = await asyncio.to_thread(self.cache.lookup, method, url, params, json_body) if self.cache else None
+        if lookup and lookup.fresh:
+            return self.cache.serve(lookup)
+        
+        headers = lookup.conditional_headers() if lookup else {}
+        
+        async with semaphore, self.concurrency.slot_async():
+            await self.rate_limiter.acquire_async()
+            started = time.monotonic()
+            try:
+                async with session.request(method, url, params=params, json=json_body, headers=headers) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                    status, etag = response.status, response.headers.get('ETag')
+            except Exception as e:
+                self.concurrency.record(e)
+                raise
+        
+        self.concurrency.record()
+        self.latency.record(time.monotonic() - started)
+        
+        if lookup:
+            if status == 304 and lookup.body is not None:
+                return await asyncio.to_thread(self.cache.serve_revalidated, lookup)
+            if status == 200:
+                await asyncio.to_thread(self.cache.store, lookup, url, content, etag)
+        return content
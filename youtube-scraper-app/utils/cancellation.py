@@ -0,0 +1,38 @@
+"""Cooperative cancellation shared by GUI workers, orchestrators and scrapers."""
+
+import threading
+
+
+class ScrapeCancelled(Exception):
+    """Raised at a request boundary once a scrape has been cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe flag checked by scrapers before every outgoing request.
+    
+    The GUI calls cancel() on the worker's token; scrapers drop queued
+    searches and stop in-flight ones at their next request. A child token
+    (parent=...) is also cancelled by its parent but can be cancelled on its
+    own, e.g. to stop one difficulty's searches once enough videos are found.
+    A multiprocessing.Event can be passed as `event` to share the flag with
+    worker processes.
+    """
+    
+    def __init__(self, parent=None, event=None):
+        self.parent = parent
+        self._event = event if event is not None else threading.Event()
+    
+    def cancel(self):
+        """Request cancellation."""
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        if self._event.is_set():
+            return True
+        return self.parent is not None and self.parent.cancelled
+    
+    def raise_if_cancelled(self):
+        """Raise ScrapeCancelled if this token or a parent was cancelled."""
+        if self.cancelled:
+            raise ScrapeCancelled()
@@ -0,0 +1,200 @@
+"""Adaptive (AIMD) concurrency control for scraper worker pools."""
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from config.settings import (
+    YTDLP_MIN_CONCURRENCY, YTDLP_INITIAL_CONCURRENCY, YTDLP_MAX_CONCURRENCY,
+    YOUTUBE_WEB_MIN_CONCURRENCY, YOUTUBE_WEB_INITIAL_CONCURRENCY, YOUTUBE_WEB_MAX_CONCURRENCY,
+    YOUTUBE_API_MIN_CONCURRENCY, YOUTUBE_API_INITIAL_CONCURRENCY, YOUTUBE_API_MAX_CONCURRENCY,
+    AIMD_WINDOW, AIMD_ERROR_THRESHOLD, AIMD_DECREASE_FACTOR
+)
+
+# (minimum, initial, maximum) in-flight requests for each backend
+BACKEND_CONCURRENCY = {
+    'ytdlp': (YTDLP_MIN_CONCURRENCY, YTDLP_INITIAL_CONCURRENCY, YTDLP_MAX_CONCURRENCY),
+    'youtube_web': (YOUTUBE_WEB_MIN_CONCURRENCY, YOUTUBE_WEB_INITIAL_CONCURRENCY, YOUTUBE_WEB_MAX_CONCURRENCY),
+    'youtube_api': (YOUTUBE_API_MIN_CONCURRENCY, YOUTUBE_API_INITIAL_CONCURRENCY, YOUTUBE_API_MAX_CONCURRENCY),
+}
+
+# Markers of YouTube / Google API throttling in exception and yt-dlp error text
+THROTTLE_MARKERS = ('429', 'too many requests', 'ratelimitexceeded', 'userratelimitexceeded')
+
+
+def is_throttle_error(error):
+    """Check whether an exception or error message means we're being throttled."""
+    text = str(error).lower()
+    return any(marker in text for marker in THROTTLE_MARKERS)
+
+
+class AdaptiveConcurrencyController:
+    """Additive-increase / multiplicative-decrease limit on in-flight requests.
+    
+    Every `window` requests the limit grows by one if the error rate stayed
+    under the threshold and is cut by `decrease_factor` otherwise. A throttling
+    response (HTTP 429) cuts the limit immediately.
+    """
+    
+    def __init__(self, name, minimum, initial, maximum,
+                 window=AIMD_WINDOW, error_threshold=AIMD_ERROR_THRESHOLD,
+                 decrease_factor=AIMD_DECREASE_FACTOR):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.window = window
+        self.error_threshold = error_threshold
+        self.decrease_factor = decrease_factor
+        
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._async_waiters = deque()  # (loop, future) of coroutines waiting for a slot, oldest first
+        self._window_requests = 0
+        self._window_errors = 0
+        
+        # Controller statistics
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.increases = 0
+        self.decreases = 0
+    
+    @contextmanager
+    def slot(self):
+        """Hold one in-flight request slot, waiting while the pool is at its limit."""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        
+        try:
+            yield
+        finally:
+            self._release()
+    
+    @asynccontextmanager
+    async def slot_async(self):
+        """Like slot(), but waits on the event loop instead of blocking the thread.
+        
+        Shares the in-flight count with slot(), so threads and coroutines of a
+        backend stay under one limit together. Waiting coroutines sleep until
+        a release or limit increase hands them a slot, oldest first.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = None
+        with self._cond:
+            if self._in_flight < self.limit and not self._async_waiters:
+                self._in_flight += 1
+            else:
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+        
+        if waiter is not None:
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                        raise
+                # Already handed a slot; a cancelled future gives it back in _grant
+                if not waiter.cancelled():
+                    self._release()
+                raise
+        
+        try:
+            yield
+        finally:
+            self._release()
+    
+    def _hand_off(self):
+        """Give free slots to waiting coroutines (caller holds the lock)."""
+        while self._async_waiters and self._in_flight < self.limit:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._grant, waiter)
+            except RuntimeError:
+                continue  # its loop is closed; nobody is left to take the slot
+            self._in_flight += 1
+    
+    def _grant(self, waiter):
+        """Wake a coroutine with its slot, on its own loop."""
+        if waiter.done():
+            self._release()  # it was cancelled while the slot was on its way
+        else:
+            waiter.set_result(None)
+    
+    def _release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._hand_off()
+            self._cond.notify()
+    
+    def record(self, error=None):
+        """Record one finished request; pass the exception or error text if it failed."""
+        with self._cond:
+            self.requests += 1
+            self._window_requests += 1
+            
+            if error is not None:
+                self.errors += 1
+                self._window_errors += 1
+                
+                if is_throttle_error(error):
+                    self.throttled += 1
+                    self._decrease()
+                    return
+            
+            if self._window_requests >= self.window:
+                if self._window_errors / self._window_requests > self.error_threshold:
+                    self._decrease()
+                elif self.limit < self.maximum:
+                    self.limit += 1
+                    self.increases += 1
+                    self._reset_window()
+                    self._hand_off()
+                    self._cond.notify()
+                else:
+                    self._reset_window()
+    
+    def _decrease(self):
+        new_limit = max(self.minimum, int(self.limit * self.decrease_factor))
+        if new_limit < self.limit:
+            self.limit = new_limit
+            self.decreases += 1
+        self._reset_window()
+    
+    def _reset_window(self):
+        self._window_requests = 0
+        self._window_errors = 0
+    
+    def get_stats(self):
+        """Get current concurrency and error rates."""
+        with self._cond:
+            return {
+                'backend': self.name,
+                'concurrency': self.limit,
+                'in_flight': self._in_flight,
+                'min_concurrency': self.minimum,
+                'max_concurrency': self.maximum,
+                'requests': self.requests,
+                'errors': self.errors,
+                'throttled': self.throttled,
+                'error_rate': round(self.errors / self.requests, 3) if self.requests else 0.0,
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
+
+
+_controllers = {}
+_controllers_lock = threading.Lock()
+
+
+def get_concurrency_controller(backend):
+    """Get the concurrency controller shared by every scraper of a backend in this process."""
+    with _controllers_lock:
+        if backend not in _controllers:
+            minimum, initial, maximum = BACKEND_CONCURRENCY[backend]
+            _controllers[backend] = AdaptiveConcurrencyController(backend, minimum, initial, maximum)
+        return _controllers[backend]
@@ -0,0 +1,45 @@
+"""Statistics counters that can be shipped out of worker processes and merged back."""
+
+
+def _zero(value):
+    """Reset value of a counter: 0, 0.0, [] or a dict with the same keys at 0."""
+    if isinstance(value, dict):
+        return {key: 0 for key in value}
+    return type(value)()
+
+
+class CountersMixin:
+    """Lock-protected counters listed by name in COUNTERS.
+    
+    The class sets each counter's initial value and self._lock in __init__.
+    Counters are numbers, lists (concatenated when merged) or dicts of
+    numbers (merged per key). drain_counters() returns them in COUNTERS
+    order and resets them, add_counters() merges a drained tuple from
+    another process.
+    """
+    
+    COUNTERS = ()
+    
+    def _count(self, counter, amount=1):
+        """Increment a counter from any thread."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+    
+    def drain_counters(self):
+        """Return and reset the counters (ships stats out of worker processes)."""
+        with self._lock:
+            counters = tuple(getattr(self, counter) for counter in self.COUNTERS)
+            for counter, value in zip(self.COUNTERS, counters):
+                setattr(self, counter, _zero(value))
+        return counters
+    
+    def add_counters(self, *counters):
+        """Merge counters drained from the same kind of object in another process."""
+        with self._lock:
+            for counter, value in zip(self.COUNTERS, counters):
+                current = getattr(self, counter)
+                if isinstance(current, dict):
+                    for key, amount in value.items():
+                        current[key] = current.get(key, 0) + amount
+                else:
+                    setattr(self, counter, current + value)
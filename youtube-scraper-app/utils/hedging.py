@@ -0,0 +1,107 @@
+"""Hedged searches: re-issue a slow search on a second backend and keep the first answer."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, wait, FIRST_COMPLETED
+from config.settings import HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_DEFAULT_DELAY
+from utils.counters import CountersMixin
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedSearch(CountersMixin):
+    """Runs a search on the primary backend, hedging it once it outlives recent latency.
+    
+    The hedge fires when the primary has not answered within HEDGE_PERCENTILE
+    of the primary backend's recent latencies (HEDGE_DEFAULT_DELAY until
+    there are HEDGE_MIN_SAMPLES of them), counted from when the primary
+    request actually starts rather than while it still waits for the rate
+    limiter or a concurrency slot. The first non-empty answer wins;
+    the loser is cancelled if it hasn't started and otherwise left to finish
+    in the background with its result discarded, since neither yt-dlp nor
+    requests can abort a call already on the wire.
+    """
+    
+    COUNTERS = ('searches', 'hedged', 'hedge_wins')
+    
+    def __init__(self, latency, max_workers, percentile=HEDGE_PERCENTILE,
+                 min_samples=HEDGE_MIN_SAMPLES, default_delay=HEDGE_DEFAULT_DELAY):
+        self.latency = latency
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+        
+        # Hedging statistics
+        self.searches = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+    
+    def delay(self):
+        """Seconds to wait for the primary before hedging."""
+        if len(self.latency) < self.min_samples:
+            return self.default_delay
+        return self.latency.percentile(self.percentile)
+    
+    def run(self, primary, hedge):
+        """Return the first non-empty result of primary(on_start) or, once it is slow, hedge().
+        
+        primary calls on_start() when its request goes out, which starts the hedge clock.
+        """
+        self._count('searches')
+        started = threading.Event()
+        
+        def run_primary():
+            try:
+                return primary(started.set)
+            finally:
+                started.set()  # a primary that fails before starting must not block us
+        
+        primary_future = self._executor.submit(run_primary)
+        started.wait()
+        
+        try:
+            # Failures before the hedge deadline surface as usual
+            return primary_future.result(timeout=self.delay())
+        except FuturesTimeout:
+            pass
+        
+        self._count('hedged')
+        hedge_future = self._executor.submit(hedge)
+        logger.debug(f"Search slower than p{self.percentile:g} ({self.delay():.1f}s), hedging")
+        
+        pending = {primary_future, hedge_future}
+        result, error = [], None
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                
+                # An empty answer may just be a swallowed failure, give the other one its chance
+                if not result and pending:
+                    continue
+                
+                for loser in pending:
+                    loser.cancel()
+                if future is hedge_future and result:
+                    self._count('hedge_wins')
+                return result
+        
+        if error:
+            raise error
+        return result
+    
+    def get_stats(self):
+        """Get hedging statistics."""
+        return {
+            'searches': self.searches,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'hedge_rate': round(self.hedged / self.searches, 3) if self.searches else 0.0,
+        }
@@ -0,0 +1,193 @@
+"""Compressed on-disk cache of HTTP responses with ETag revalidation."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from config.settings import (
+    HTTP_CACHE_ENABLED, HTTP_CACHE_PATH, HTTP_CACHE_MAX_AGE_DAYS,
+    HTTP_CACHE_SEARCH_TTL_HOURS, HTTP_CACHE_VIDEOS_TTL_HOURS
+)
+from utils.counters import CountersMixin
+from utils.sqlite_cache import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+# Cache lifetime per endpoint path; responses of any other endpoint are never cached.
+# Search continuations (POST /youtubei/v1/search) carry a single-use token, so they never repeat
+ENDPOINT_TTL_HOURS = {
+    '/results': HTTP_CACHE_SEARCH_TTL_HOURS,
+    '/youtube/v3/search': HTTP_CACHE_SEARCH_TTL_HOURS,
+    '/youtube/v3/videos': HTTP_CACHE_VIDEOS_TTL_HOURS,
+}
+
+# Query parameters that don't change the response (the API key differs per rotation)
+IGNORED_PARAMS = {'key'}
+
+
+class CacheLookup:
+    """Result of looking up one request: its key, TTL and any stored entry."""
+    
+    def __init__(self, key, ttl, body=None, etag=None, stored_at=None):
+        self.key = key
+        self.ttl = ttl
+        self.body = body
+        self.etag = etag
+        self.stored_at = stored_at
+    
+    @property
+    def fresh(self):
+        return self.body is not None and time.time() - self.stored_at <= self.ttl
+    
+    def conditional_headers(self):
+        """If-None-Match for a stale entry that has an ETag, so a 304 can revalidate it."""
+        if self.body is not None and self.etag and not self.fresh:
+            return {'If-None-Match': self.etag}
+        return {}
+
+
+class HttpResponseCache(CountersMixin, SQLiteStore):
+    """SQLite store of zlib-compressed response bodies keyed by request.
+    
+    The key is the method, the URL without its query string and the sorted
+    query parameters minus IGNORED_PARAMS, plus the JSON body if any. Only
+    GET requests to endpoints in ENDPOINT_TTL_HOURS are cached. A stale entry with an ETag is
+    revalidated rather than refetched; a 304 serves the stored body again.
+    Entries not refreshed for HTTP_CACHE_MAX_AGE_DAYS are purged.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS http_responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            etag TEXT,
+            body BLOB NOT NULL,
+            stored_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS http_responses_stored_at ON http_responses (stored_at);
+    """
+    COUNTERS = ('hits', 'misses', 'revalidated', 'bytes_saved')
+    
+    def __init__(self, path=HTTP_CACHE_PATH):
+        super().__init__(path)
+        self._lock = threading.Lock()
+        
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.bytes_saved = 0
+    
+    @staticmethod
+    def request_key(method, url, params=None, json_body=None):
+        """Cache key of a request, identical for any API key or parameter order."""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query) + list((params or {}).items())
+        normalized = urlencode(sorted((k, str(v)) for k, v in query if k not in IGNORED_PARAMS and v is not None))
+        body = json.dumps(json_body, sort_keys=True) if json_body is not None else ''
+        
+        raw = f"{method.upper()} {parts.netloc}{parts.path}?{normalized} {body}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def lookup(self, method, url, params=None, json_body=None):
+        """Look a request up; returns None for requests that are never cached."""
+        ttl_hours = ENDPOINT_TTL_HOURS.get(urlsplit(url).path)
+        if ttl_hours is None or method.upper() != 'GET':
+            return None
+        
+        lookup = CacheLookup(self.request_key(method, url, params, json_body), ttl_hours * 3600)
+        try:
+            row = self._connection().execute(
+                "SELECT etag, body, stored_at FROM http_responses WHERE key = ?",
+                (lookup.key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache read failed for {url}: {e}")
+            row = None
+        
+        if row:
+            lookup.etag, lookup.stored_at = row[0], row[2]
+            lookup.body = zlib.decompress(row[1])
+        
+        if not lookup.fresh:
+            self._count('misses')
+        return lookup
+    
+    def serve(self, lookup):
+        """Body of a fresh entry (counts a hit)."""
+        self._count('hits')
+        self._count('bytes_saved', len(lookup.body))
+        return lookup.body
+    
+    def serve_revalidated(self, lookup):
+        """Body of a stale entry the server answered 304 for; it is fresh again."""
+        self._count('revalidated')
+        self._count('bytes_saved', len(lookup.body))
+        try:
+            conn = self._connection()
+            conn.execute("UPDATE http_responses SET stored_at = ? WHERE key = ?", (time.time(), lookup.key))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache refresh failed: {e}")
+        return lookup.body
+    
+    def store(self, lookup, url, body, etag=None):
+        """Store a successful response body."""
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_responses (key, url, etag, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (lookup.key, url.split('?')[0], etag, zlib.compress(body, 6), time.time())
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"HTTP cache write failed for {url}: {e}")
+    
+    def purge(self, max_age_days=HTTP_CACHE_MAX_AGE_DAYS):
+        """Delete entries not stored or revalidated within max_age_days; returns how many."""
+        try:
+            conn = self._connection()
+            deleted = conn.execute(
+                "DELETE FROM http_responses WHERE stored_at < ?",
+                (time.time() - max_age_days * 86400,)
+            ).rowcount
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ HTTP cache purge failed: {e}")
+            return 0
+        
+        if deleted:
+            logger.info(f"🧹 Purged {deleted} HTTP cache entries older than {max_age_days:g} days")
+        return deleted
+    
+    def get_stats(self):
+        """Get hit/miss counts and response bytes not downloaded."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidated': self.revalidated,
+                'bytes_saved': self.bytes_saved,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """Get the response cache shared by every scraper in this process, or None if disabled."""
+    global _cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpResponseCache()
+            _cache.purge()
+        return _cache
@@ -0,0 +1,205 @@
+"""Shared pooled HTTP client used by every requests-based scraper."""
+
+import logging
+import threading
+import time
+from contextlib import nullcontext
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from config.settings import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_HTTP2, HTTP_TIMEOUT
+from utils.http_cache import get_http_cache
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 is optional, requests covers everything else
+    httpx = None
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes 'br' when it is installed)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    """Keep-alive HTTP client safe to share between worker threads.
+    
+    Each thread gets its own requests.Session (sessions aren't thread-safe),
+    but they all mount one HTTPAdapter, so every thread draws on the same
+    per-host connection pools of HTTP_POOL_MAXSIZE sockets. When httpx with
+    HTTP/2 support is installed and HTTP_HTTP2 is on, requests go through
+    one multiplexed httpx client instead. Hooks registered with add_hook()
+    are called after every request with (method, url, status, seconds, bytes).
+    Cacheable endpoints are answered from the on-disk response cache.
+    """
+    
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 http2=HTTP_HTTP2, timeout=HTTP_TIMEOUT):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._hooks = []
+        self._lock = threading.Lock()
+        self.cache = get_http_cache()
+        
+        # Retries are left to the callers' error handling and AIMD controllers
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        
+        self._httpx = None
+        if http2 and httpx is None:
+            logger.warning("⚠️ HTTP_HTTP2 is on but httpx is not installed, staying on HTTP/1.1")
+        elif http2:
+            try:
+                self._httpx = httpx.Client(
+                    http2=True,
+                    timeout=timeout,
+                    headers={'Accept-Encoding': ACCEPT_ENCODING},
+                    limits=httpx.Limits(max_connections=pool_connections * pool_maxsize,
+                                        max_keepalive_connections=pool_connections * pool_maxsize)
+                )
+            except ImportError:
+                logger.warning("⚠️ HTTP_HTTP2 is on but httpx is installed without h2, staying on HTTP/1.1")
+        
+        # Client statistics
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.seconds = 0.0
+        self.http_versions = {}
+    
+    def _session(self):
+        """Get the calling thread's session."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            self._local.session = session
+        return session
+    
+    def add_hook(self, hook):
+        """Call hook(method, url, status, seconds, bytes) after every request."""
+        self._hooks.append(hook)
+    
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, gate=None):
+        """Send a request and return the response (requests or httpx, same interface).
+        
+        Statuses of 400 and up raise requests.HTTPError on either transport, and
+        httpx transport errors surface as their requests equivalents. `gate` is a context manager factory entered only
+        when the request actually goes to the network (not on a cache hit),
+        so callers can hold rate limits and concurrency slots around it.
+        """
+        lookup = self.cache.lookup(method, url, params, json) if self.cache else None
+        if lookup and lookup.fresh:
+            return self._cached_response(url, self.cache.serve(lookup))
+        
+        if lookup and lookup.conditional_headers():
+            headers = {**(headers or {}), **lookup.conditional_headers()}
+        
+        with gate() if gate else nullcontext():
+            response = self._send(method, url, params, json, headers, timeout)
+            if response.status_code >= 400:
+                # httpx's raise_for_status() would also reject the 304 of a revalidation
+                raise requests.HTTPError(f"{response.status_code} Error for url: {url}", response=response)
+        
+        if lookup:
+            if response.status_code == 304 and lookup.body is not None:
+                return self._cached_response(url, self.cache.serve_revalidated(lookup), 'REVALIDATED')
+            if response.status_code == 200:
+                self.cache.store(lookup, url, response.content, response.headers.get('ETag'))
+        return response
+    
+    def _send(self, method, url, params, json, headers, timeout):
+        """Send a request over the network."""
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        status = None
+        size = 0
+        
+        try:
+            if self._httpx is not None:
+                response = self._send_httpx(method, url, params, json, headers, timeout)
+                version = response.http_version
+            else:
+                response = self._session().request(method, url, params=params, json=json, headers=headers, timeout=timeout)
+                version = 'HTTP/1.1'
+            
+            status = response.status_code
+            size = len(response.content)
+            return response
+        finally:
+            self._record(method, url, status, time.perf_counter() - started, size,
+                         version if status is not None else None)
+    
+    def _send_httpx(self, method, url, params, json, headers, timeout):
+        """Send over httpx, raising requests exceptions so callers handle one set of errors."""
+        try:
+            return self._httpx.request(method, url, params=params, json=json, headers=headers, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.RequestError as e:
+            raise requests.ConnectionError(str(e)) from e
+    
+    @staticmethod
+    def _cached_response(url, body, cache_status='HIT'):
+        """Wrap a cached body in a 200 response; X-Cache says whether the network was used."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = 'utf-8'
+        response.headers = CaseInsensitiveDict({'X-Cache': cache_status})
+        response._content = body
+        return response
+    
+    def get(self, url, params=None, headers=None, timeout=None, gate=None):
+        """Send a GET request."""
+        return self.request('GET', url, params=params, headers=headers, timeout=timeout, gate=gate)
+    
+    def post(self, url, params=None, json=None, headers=None, timeout=None, gate=None):
+        """Send a POST request with an optional JSON body."""
+        return self.request('POST', url, params=params, json=json, headers=headers, timeout=timeout, gate=gate)
+    
+    def _record(self, method, url, status, seconds, size, version):
+        """Update the totals and run the timing hooks for one finished request."""
+        with self._lock:
+            self.requests += 1
+            self.seconds += seconds
+            self.bytes_received += size
+            if status is None or status >= 400:
+                self.errors += 1
+            if version:
+                self.http_versions[version] = self.http_versions.get(version, 0) + 1
+        
+        for hook in self._hooks:
+            try:
+                hook(method, url, status, seconds, size)
+            except Exception as e:
+                logger.debug(f"HTTP timing hook failed: {e}")
+    
+    def get_stats(self):
+        """Get request, byte and timing totals."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'bytes_received': self.bytes_received,
+                'avg_ms': round(self.seconds / self.requests * 1000, 1) if self.requests else 0.0,
+                'http_versions': dict(self.http_versions),
+                'http2': self._httpx is not None,
+            }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """Get the HTTP client shared by every scraper in this process."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,83 @@
+"""Rolling per-backend search latency percentiles."""
+
+import threading
+from collections import deque
+from config.settings import LATENCY_WINDOW
+from utils.counters import CountersMixin
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return None
+    rank = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+class LatencyTracker(CountersMixin):
+    """Keeps the latest `window` successful search latencies of one backend.
+    
+    Percentiles come from recent samples only, so a hedge threshold follows
+    the backend as it speeds up or slows down during a run.
+    """
+    
+    # Only new samples are shipped; merging them feeds the window, see add_counters
+    COUNTERS = ('_pending',)
+    
+    def __init__(self, name, window=LATENCY_WINDOW):
+        self.name = name
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._pending = []  # Samples not yet shipped out of a worker process
+        self.count = 0
+    
+    def record(self, seconds):
+        """Record one successful search's latency."""
+        with self._lock:
+            self._samples.append(seconds)
+            self._pending.append(seconds)
+            self.count += 1
+    
+    def percentile(self, pct):
+        """Latency at `pct` over the window, or None before any sample."""
+        with self._lock:
+            samples = sorted(self._samples)
+        return percentile(samples, pct)
+    
+    def __len__(self):
+        return len(self._samples)
+    
+    def add_counters(self, samples):
+        """Merge samples drained from a tracker in another process."""
+        with self._lock:
+            self._samples.extend(samples)
+            self.count += len(samples)
+    
+    def get_stats(self):
+        """Get p50/p95/p99 over the window, in seconds."""
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+        
+        def rounded(value):
+            return round(value, 3) if value is not None else None
+        
+        return {
+            'backend': self.name,
+            'samples': count,
+            'p50': rounded(percentile(samples, 50)),
+            'p95': rounded(percentile(samples, 95)),
+            'p99': rounded(percentile(samples, 99)),
+        }
+
+
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(backend):
+    """Get the latency tracker shared by every scraper of a backend in this process."""
+    with _trackers_lock:
+        if backend not in _trackers:
+            _trackers[backend] = LatencyTracker(backend)
+        return _trackers[backend]
@@ -0,0 +1,203 @@
+"""Persistent YouTube Data API quota ledger and the key scheduler built on it."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from config.settings import (
+    YOUTUBE_API_QUOTA_LIMIT, YOUTUBE_API_QUOTA_LEDGER_PATH,
+    YOUTUBE_API_KEY_RATE_LIMIT, YOUTUBE_API_KEY_RATE_BURST
+)
+from utils.rate_limiter import TokenBucket
+from utils.sqlite_cache import SQLiteStore
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC = ZoneInfo('America/Los_Angeles')
+except Exception:  # no tz database (e.g. Windows without tzdata): standard time is close enough
+    PACIFIC = timezone(timedelta(hours=-8))
+
+logger = logging.getLogger(__name__)
+
+
+def pacific_day():
+    """The quota day: YouTube resets every key's quota at midnight Pacific time."""
+    return datetime.now(PACIFIC).date().isoformat()
+
+
+def key_id(api_key):
+    """Short stable label for an API key, so the ledger never stores the key itself."""
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:12]
+
+
+class QuotaExhausted(Exception):
+    """No API key has enough quota left today for the requested call."""
+
+
+class QuotaLedger(SQLiteStore):
+    """SQLite record of units spent per API key, Pacific-time day and call type.
+    
+    Updates are single UPSERT statements, so scraper threads and worker
+    processes can share one ledger file without losing increments.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS api_quota (
+            day TEXT NOT NULL,
+            key_id TEXT NOT NULL,
+            call_type TEXT NOT NULL,
+            units INTEGER NOT NULL,
+            calls INTEGER NOT NULL,
+            PRIMARY KEY (day, key_id, call_type)
+        )
+    """
+    
+    def __init__(self, path=YOUTUBE_API_QUOTA_LEDGER_PATH):
+        super().__init__(path)
+    
+    def spend(self, api_key, call_type, units, calls=1, day=None):
+        """Add units spent by one or more calls of a type."""
+        try:
+            conn = self._connection()
+            conn.execute("""
+                INSERT INTO api_quota (day, key_id, call_type, units, calls) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (day, key_id, call_type)
+                DO UPDATE SET units = units + excluded.units, calls = calls + excluded.calls
+            """, (day or pacific_day(), key_id(api_key), call_type, units, calls))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Quota ledger write failed: {e}")
+    
+    def used(self, day=None):
+        """Units spent today per key ID."""
+        try:
+            rows = self._connection().execute(
+                "SELECT key_id, SUM(units) FROM api_quota WHERE day = ? GROUP BY key_id",
+                (day or pacific_day(),)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Quota ledger read failed: {e}")
+            return {}
+        return dict(rows)
+    
+    def breakdown(self, day=None):
+        """Units and calls per key ID and call type for a day."""
+        try:
+            rows = self._connection().execute(
+                "SELECT key_id, call_type, units, calls FROM api_quota WHERE day = ?",
+                (day or pacific_day(),)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Quota ledger read failed: {e}")
+            return {}
+        
+        result = defaultdict(dict)
+        for key, call_type, units, calls in rows:
+            result[key][call_type] = {'units': units, 'calls': calls}
+        return dict(result)
+
+
+class QuotaTicket:
+    """One API call's reservation: the key it must use and the units held for it."""
+    
+    def __init__(self, api_key, call_type, cost):
+        self.api_key = api_key
+        self.call_type = call_type
+        self.cost = cost
+
+
+class ApiKeyScheduler:
+    """Hands out API keys by remaining daily quota.
+    
+    reserve() picks the key with the most headroom (limit minus units in the
+    ledger minus units reserved by calls in flight) and refuses, with
+    QuotaExhausted, any call that would take every key past the limit.
+    settle() records the units actually spent: nothing for a cache hit or a
+    call that never reached the API, and the rest of the day's quota for a
+    quotaExceeded answer, so later runs skip that key too.
+    """
+    
+    def __init__(self, api_keys, ledger=None, limit=YOUTUBE_API_QUOTA_LIMIT,
+                 key_rate=YOUTUBE_API_KEY_RATE_LIMIT, key_burst=YOUTUBE_API_KEY_RATE_BURST):
+        self.api_keys = list(api_keys)
+        self.ledger = ledger or get_quota_ledger()
+        self.limit = limit
+        self._limiters = {api_key: TokenBucket(key_rate, key_burst) for api_key in self.api_keys}
+        self._reserved = defaultdict(int)
+        self._lock = threading.Lock()
+        
+        # Units this scheduler spent, by call type
+        self.spent = defaultdict(int)
+    
+    def _headroom(self, used):
+        return {
+            api_key: self.limit - used.get(key_id(api_key), 0) - self._reserved[api_key]
+            for api_key in self.api_keys
+        }
+    
+    def headroom(self):
+        """Units still available today on the key with the most left."""
+        with self._lock:
+            return max(self._headroom(self.ledger.used()).values(), default=0)
+    
+    def reserve(self, call_type, cost):
+        """Reserve `cost` units on the key with the most headroom."""
+        with self._lock:
+            headroom = self._headroom(self.ledger.used())
+            api_key = max(headroom, key=headroom.get, default=None)
+            if api_key is None or headroom[api_key] < cost:
+                raise QuotaExhausted(f"No API key has {cost} quota units left today")
+            self._reserved[api_key] += cost
+        return QuotaTicket(api_key, call_type, cost)
+    
+    def pace(self, ticket):
+        """Wait for the ticket's key to be within its own QPS limit."""
+        return self._limiters[ticket.api_key].acquire()
+    
+    def settle(self, ticket, spent=True, exhausted=False):
+        """Release a reservation, recording what the call actually cost."""
+        if exhausted:
+            remaining = self.limit - self.ledger.used().get(key_id(ticket.api_key), 0)
+            self.ledger.spend(ticket.api_key, 'quota_exceeded', max(0, remaining))
+            logger.warning(f"⚠️ API key {key_id(ticket.api_key)} is out of quota until midnight Pacific time")
+        elif spent:
+            self.ledger.spend(ticket.api_key, ticket.call_type, ticket.cost)
+        
+        with self._lock:
+            self._reserved[ticket.api_key] -= ticket.cost
+            if spent and not exhausted:
+                self.spent[ticket.call_type] += ticket.cost
+    
+    @property
+    def units_spent(self):
+        with self._lock:
+            return sum(self.spent.values())
+    
+    def get_stats(self):
+        """Get today's usage per key and this scheduler's spend by call type."""
+        used = self.ledger.used()
+        with self._lock:
+            return {
+                'day': pacific_day(),
+                'limit': self.limit,
+                'keys': {
+                    key_id(api_key): {'used': used.get(key_id(api_key), 0), 'headroom': headroom}
+                    for api_key, headroom in self._headroom(used).items()
+                },
+                'spent_by_call_type': dict(self.spent),
+            }
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_quota_ledger():
+    """Get the quota ledger shared by every API scraper in this process."""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = QuotaLedger()
+        return _ledger
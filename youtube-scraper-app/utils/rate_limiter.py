@@ -0,0 +1,106 @@
+"""Thread-safe token-bucket rate limiting shared by scraper workers."""
+
+import asyncio
+import threading
+import time
+from config.settings import (
+    YTDLP_RATE_LIMIT, YTDLP_RATE_BURST,
+    YOUTUBE_WEB_RATE_LIMIT, YOUTUBE_WEB_RATE_BURST,
+    YOUTUBE_API_RATE_LIMIT, YOUTUBE_API_RATE_BURST
+)
+
+# Requests per second and burst size for each backend
+BACKEND_RATE_LIMITS = {
+    'ytdlp': (YTDLP_RATE_LIMIT, YTDLP_RATE_BURST),
+    'youtube_web': (YOUTUBE_WEB_RATE_LIMIT, YOUTUBE_WEB_RATE_BURST),
+    'youtube_api': (YOUTUBE_API_RATE_LIMIT, YOUTUBE_API_RATE_BURST),
+}
+
+
+class TokenBucket:
+    """Token bucket that paces callers to `rate` requests per second.
+    
+    Workers call acquire() right before each outgoing request, so pacing
+    happens at the source and result handling never has to sleep.
+    """
+    
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+        # Limiter statistics
+        self.acquired = 0
+        self.waited_seconds = 0.0
+    
+    def set_rate(self, rate):
+        """Change the refill rate (e.g. to split a budget across processes)."""
+        with self._lock:
+            self._refill()
+            self.rate = rate
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _take(self, waited):
+        """Take a token if one is available; returns 0, or the seconds until the next one."""
+        with self._lock:
+            # A rate of 0 disables limiting
+            if self.rate <= 0:
+                self.acquired += 1
+                return 0
+            
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.acquired += 1
+                self.waited_seconds += waited
+                return 0
+            
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a request may be sent; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            wait = self._take(waited)
+            if not wait:
+                return waited
+            time.sleep(wait)
+            waited += wait
+    
+    async def acquire_async(self):
+        """Like acquire(), but sleeps on the event loop instead of blocking the thread."""
+        waited = 0.0
+        while True:
+            wait = self._take(waited)
+            if not wait:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+    
+    def get_stats(self):
+        """Get limiter statistics."""
+        return {
+            'rate_per_second': self.rate,
+            'burst': self.burst,
+            'requests': self.acquired,
+            'waited_seconds': round(self.waited_seconds, 2),
+        }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(backend):
+    """Get the token bucket shared by every scraper of a backend in this process."""
+    with _limiters_lock:
+        if backend not in _limiters:
+            rate, burst = BACKEND_RATE_LIMITS[backend]
+            _limiters[backend] = TokenBucket(rate, burst)
+        return _limiters[backend]
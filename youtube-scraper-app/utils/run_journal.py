@@ -0,0 +1,93 @@
+"""Append-only journal of scrape runs, so a crashed run can resume where it stopped."""
+
+import glob
+import json
+import logging
+import os
+from datetime import datetime
+from config.settings import RUN_JOURNAL_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """JSONL journal of one tool's run: a start line, one line per finished term, a finish line.
+    
+    Every line is flushed and fsynced as it is written, so after a crash the
+    journal lists exactly the terms whose videos are already in the
+    database, and a resumed run loses at most the terms that were in flight.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.completed = {}  # term -> its journal record
+        self.finished = False
+        
+        if os.path.exists(path):
+            self._drop_torn_line()
+            self._load()
+    
+    @classmethod
+    def open(cls, tool_name, resume=False):
+        """Open the latest unfinished journal for a tool when resuming, else start a new one."""
+        if resume:
+            journals = sorted(glob.glob(os.path.join(RUN_JOURNAL_DIR, f"{tool_name}_*.jsonl")))
+            if journals:
+                journal = cls(journals[-1])
+                if not journal.finished:
+                    return journal
+                logger.info(f"📒 Last {tool_name} run finished, starting a new one")
+        
+        os.makedirs(RUN_JOURNAL_DIR, exist_ok=True)
+        run_id = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        journal = cls(os.path.join(RUN_JOURNAL_DIR, f"{tool_name}_{run_id}.jsonl"))
+        journal._append({'event': 'start', 'tool': tool_name, 'run_id': run_id})
+        return journal
+    
+    def _drop_torn_line(self):
+        """Truncate a half-written last line left by a crash, so the next append starts clean."""
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if not data or data.endswith(b'\n'):
+                return
+            
+            f.truncate(data.rfind(b'\n') + 1)
+            f.flush()
+            os.fsync(f.fileno())
+        logger.warning(f"📒 Dropped a torn last line from {self.path}")
+    
+    def _load(self):
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn lines are truncated on open; skip anything else unreadable
+                    continue
+                
+                if record.get('event') == 'term':
+                    self.completed[record['term']] = record
+                elif record.get('event') == 'finish':
+                    self.finished = True
+    
+    def _append(self, record):
+        record['at'] = datetime.now().isoformat()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def record_term(self, term, found, inserted):
+        """Record a finished term with its counts."""
+        record = {'event': 'term', 'term': term, 'found': found, 'inserted': inserted}
+        self._append(record)
+        self.completed[term] = record
+    
+    def finish(self):
+        """Mark the run complete so the next --resume starts fresh."""
+        self._append({'event': 'finish', 'terms': len(self.completed)})
+        self.finished = True
+    
+    def remaining(self, search_terms):
+        """Search terms that this run hasn't finished yet, in their original order."""
+        return [term for term in search_terms if term not in self.completed]
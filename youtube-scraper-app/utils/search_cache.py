@@ -0,0 +1,89 @@
+"""Persistent cache of search results shared across tools, difficulties and runs."""
+
+import json
+import logging
+import sqlite3
+import time
+from config.settings import SEARCH_CACHE_PATH, SEARCH_CACHE_TTL_HOURS
+from utils.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+# Flat-entry fields kept with each ID so prefilters still work on a cache hit
+FLAT_FIELDS = ('id', 'title', 'duration', 'view_count')
+
+
+def normalize_query(query):
+    """Normalize a search query so trivially different spellings share a cache entry."""
+    return ' '.join(query.lower().split())
+
+
+class SearchResultCache(SQLiteCache):
+    """SQLite-backed map of (backend, normalized query) to an ordered result list.
+    
+    A cached list serves any request for at most as many results as it was
+    fetched with, until it is older than the TTL. Only the small flat fields
+    are stored; details come from the video metadata cache or a fresh fetch.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS search_results (
+            backend TEXT NOT NULL,
+            query TEXT NOT NULL,
+            max_results INTEGER NOT NULL,
+            entries TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (backend, query)
+        )
+    """
+    
+    def __init__(self, path=SEARCH_CACHE_PATH, ttl_hours=SEARCH_CACHE_TTL_HOURS):
+        super().__init__(path)
+        self.ttl = ttl_hours * 3600
+    
+    def get(self, backend, query, max_results):
+        """Get a fresh cached result list (entries with at least an 'id'), or None."""
+        try:
+            row = self._connection().execute(
+                "SELECT max_results, entries, fetched_at FROM search_results WHERE backend = ? AND query = ?",
+                (backend, normalize_query(query))
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Search cache read failed for '{query}': {e}")
+            row = None
+        
+        # A shorter cached search can't answer a longer one
+        if not row or row[0] < max_results:
+            self._count('misses')
+            return None
+        
+        if time.time() - row[2] > self.ttl:
+            self._count('expired')
+            return None
+        
+        self._count('hits')
+        return json.loads(row[1])[:max_results]
+    
+    def put(self, backend, query, max_results, entries):
+        """Store a search's ordered results, keeping only FLAT_FIELDS of each entry."""
+        if not entries:
+            return  # Never cache an empty (possibly failed) search
+        
+        compact = [
+            {field: entry[field] for field in FLAT_FIELDS if entry.get(field) is not None}
+            for entry in entries
+        ]
+        
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO search_results (backend, query, max_results, entries, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (backend, normalize_query(query), max_results, json.dumps(compact), time.time())
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Search cache write failed for '{query}': {e}")
+    
+    def get_or_search(self, backend, query, max_results, search):
+        """Serve a search from the cache, calling search() only when missing or stale."""
+        return self._get_or_fetch(search, backend, query, max_results)
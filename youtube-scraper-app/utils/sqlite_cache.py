@@ -0,0 +1,70 @@
+"""Base classes for the on-disk SQLite stores shared by threads and worker processes."""
+
+import os
+import sqlite3
+import threading
+from utils.counters import CountersMixin
+
+
+class SQLiteStore:
+    """One SQLite file in WAL mode, with a connection per calling thread.
+    
+    SCHEMA holds the CREATE statements run when a thread first connects.
+    """
+    
+    SCHEMA = ''
+    
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+    
+    def _connection(self):
+        """Get the calling thread's SQLite connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._local.conn = conn
+        return conn
+
+
+class SQLiteCache(CountersMixin, SQLiteStore):
+    """SQLiteStore with hit/miss/expired counters and a get-or-fetch helper.
+    
+    Subclasses implement get(*key), which returns None on a miss, and
+    put(*key, value).
+    """
+    
+    COUNTERS = ('hits', 'misses', 'expired')
+    
+    def __init__(self, path):
+        super().__init__(path)
+        self._lock = threading.Lock()
+        
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+    
+    def _get_or_fetch(self, fetch, *key):
+        """Serve a value from the cache, calling fetch() only when missing or stale."""
+        value = self.get(*key)
+        if value is not None:
+            return value
+        
+        value = fetch()
+        self.put(*key, value)
+        return value
+    
+    def get_stats(self):
+        """Get cache hit/miss statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.expired
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
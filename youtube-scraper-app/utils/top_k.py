@@ -0,0 +1,58 @@
+"""Streaming bounded top-k selection of scraped videos."""
+
+import heapq
+import itertools
+
+
+class TopKVideos:
+    """Keeps the k highest-scoring videos seen so far in a min-heap.
+    
+    Memory stays O(k) however many candidates stream in, and offer() says
+    whether a candidate made it in, so callers can tell when new search
+    terms have stopped improving the selection.
+    """
+    
+    def __init__(self, k, score_key='quality_score'):
+        self.k = k
+        self.score_key = score_key
+        self._heap = []  # (score, tiebreak, video_id, video)
+        self._ids = set()  # video_ids currently in the heap
+        self._tiebreak = itertools.count()
+        self.offered = 0
+    
+    def offer(self, video):
+        """Add a candidate; returns True if it entered the top-k."""
+        self.offered += 1
+        video_id = video.get('video_id')
+        score = video.get(self.score_key, 0)
+        
+        # The same video found by another term only counts once
+        if video_id in self._ids:
+            return False
+        
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (score, next(self._tiebreak), video_id, video))
+        elif score > self._heap[0][0]:
+            _, _, evicted_id, _ = heapq.heapreplace(self._heap, (score, next(self._tiebreak), video_id, video))
+            self._ids.discard(evicted_id)
+        else:
+            return False
+        
+        self._ids.add(video_id)
+        return True
+    
+    @property
+    def is_full(self):
+        return len(self._heap) >= self.k
+    
+    @property
+    def min_score(self):
+        """Lowest score in the selection (the bar a new candidate must beat)."""
+        return self._heap[0][0] if self._heap else 0
+    
+    def __len__(self):
+        return len(self._heap)
+    
+    def videos(self):
+        """The selected videos, best first."""
+        return [entry[3] for entry in sorted(self._heap, key=lambda entry: (-entry[0], entry[1]))]
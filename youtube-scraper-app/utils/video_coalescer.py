@@ -0,0 +1,173 @@
+"""Coalesce video IDs from many searches into full videos.list batches."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import API_VIDEOS_BATCH_SIZE, API_VIDEOS_FLUSH_DELAY
+
+logger = logging.getLogger(__name__)
+
+
+class VideoIdCoalescer:
+    """Collects the IDs of completed searches and fetches their details in shared batches.
+    
+    IDs are deduplicated across every term of the run: an ID found by five
+    terms is fetched once. Batches go out as soon as API_VIDEOS_BATCH_SIZE
+    new IDs are pending, or once the oldest pending ID has waited
+    API_VIDEOS_FLUSH_DELAY seconds. When all of a term's IDs are resolved,
+    on_term(term, video_ids, videos) is called with that term's videos in
+    search order; a failed batch resolves its IDs to nothing rather than
+    holding their terms back.
+    """
+    
+    def __init__(self, fetch_batch, on_term, max_workers, batch_size=API_VIDEOS_BATCH_SIZE,
+                 flush_delay=API_VIDEOS_FLUSH_DELAY):
+        self.fetch_batch = fetch_batch  # list of IDs -> {video_id: video_data}
+        self.on_term = on_term
+        self.batch_size = batch_size
+        self.flush_delay = flush_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='videos-batch')
+        self._cond = threading.Condition()
+        self._closed = False
+        
+        self._pending = []  # new IDs not yet in a batch, oldest first
+        self._oldest_pending = None
+        self._results = {}  # video ID -> video data, or None once resolved without one
+        self._waiters = {}  # unresolved video ID -> terms waiting for it
+        self._term_ids = {}  # term -> its IDs in search order
+        self._unresolved = {}  # term -> IDs still outstanding
+        self._in_flight = 0
+        
+        # Coalescing statistics
+        self.ids_requested = 0
+        self.ids_deduplicated = 0
+        self.batches = 0
+        self.partial_batches = 0
+        
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name='videos-coalescer', daemon=True)
+        self._dispatcher.start()
+    
+    def add(self, term, video_ids):
+        """Queue a finished search's IDs; its videos arrive via on_term."""
+        with self._cond:
+            video_ids = list(dict.fromkeys(video_ids))
+            self._term_ids[term] = video_ids
+            outstanding = set()
+            
+            for video_id in video_ids:
+                if video_id in self._results:
+                    self.ids_deduplicated += 1
+                    continue
+                
+                outstanding.add(video_id)
+                if video_id in self._waiters:
+                    self.ids_deduplicated += 1
+                else:
+                    self._waiters[video_id] = set()
+                    self._pending.append(video_id)
+                    self.ids_requested += 1
+                    if self._oldest_pending is None:
+                        self._oldest_pending = time.monotonic()
+                self._waiters[video_id].add(term)
+            
+            self._unresolved[term] = outstanding
+            completed = self._pop_completed([term])
+            self._cond.notify_all()
+        
+        self._deliver(completed)
+    
+    def close(self):
+        """Flush what is pending and block until every added term has been delivered."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                self._cond.wait()
+        
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+    
+    def _dispatch_loop(self):
+        """Cut batches when one is full, the flush deadline passes or the run closes."""
+        with self._cond:
+            while True:
+                if len(self._pending) >= self.batch_size:
+                    self._submit(self._take_batch())
+                    continue
+                
+                if self._pending:
+                    waited = time.monotonic() - self._oldest_pending
+                    if self._closed or waited >= self.flush_delay:
+                        self.partial_batches += 1
+                        self._submit(self._take_batch())
+                        continue
+                    self._cond.wait(self.flush_delay - waited)
+                elif self._closed:
+                    return
+                else:
+                    self._cond.wait()
+    
+    def _take_batch(self):
+        batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+        self._oldest_pending = time.monotonic() if self._pending else None
+        return batch
+    
+    def _submit(self, batch):
+        self.batches += 1
+        self._in_flight += 1
+        self._executor.submit(self._fetch, batch)
+    
+    def _fetch(self, batch):
+        """Fetch one batch and hand every term it completes to on_term."""
+        try:
+            found = self.fetch_batch(batch)
+        except Exception as e:
+            logger.error(f"❌ Failed to get video details for batch: {e}")
+            found = {}
+        
+        with self._cond:
+            affected = set()
+            for video_id in batch:
+                self._results[video_id] = found.get(video_id)
+                for term in self._waiters.pop(video_id, ()):
+                    self._unresolved[term].discard(video_id)
+                    affected.add(term)
+            completed = self._pop_completed(affected)
+        
+        try:
+            self._deliver(completed)
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+    
+    def _pop_completed(self, terms):
+        """Terms with nothing outstanding, with their videos (caller holds the lock)."""
+        completed = []
+        for term in terms:
+            if self._unresolved.get(term):
+                continue
+            self._unresolved.pop(term, None)
+            video_ids = self._term_ids.pop(term)
+            videos = [dict(self._results[video_id]) for video_id in video_ids if self._results.get(video_id)]
+            completed.append((term, video_ids, videos))
+        return completed
+    
+    def _deliver(self, completed):
+        for term, video_ids, videos in completed:
+            try:
+                self.on_term(term, video_ids, videos)
+            except Exception as e:
+                logger.error(f"❌ Failed to process '{term}': {e}")
+    
+    def get_stats(self):
+        """Get ID deduplication and batch fill statistics."""
+        with self._cond:
+            return {
+                'ids_requested': self.ids_requested,
+                'ids_deduplicated': self.ids_deduplicated,
+                'batches': self.batches,
+                'partial_batches': self.partial_batches,
+                'avg_batch_fill': round(self.ids_requested / self.batches, 1) if self.batches else 0.0,
+            }
@@ -0,0 +1,95 @@
+"""Persistent on-disk cache of trimmed yt-dlp video metadata."""
+
+import json
+import logging
+import sqlite3
+import time
+from config.settings import VIDEO_CACHE_PATH, VIDEO_CACHE_STATS_TTL_HOURS
+from utils.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+# Fields that don't change once a video is published (view/like/comment counts do)
+STABLE_FIELDS = (
+    'id', 'title', 'description', 'thumbnail', 'uploader', 'channel_id',
+    'upload_date', 'duration', 'tags', 'subtitles', 'chapters',
+)
+
+
+class VideoMetadataCache(SQLiteCache):
+    """SQLite-backed cache keyed by video_id, shared by threads and worker processes.
+    
+    Stable fields are served from the cache indefinitely; a record whose
+    volatile stats are older than the TTL counts as a miss and is refetched.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS video_metadata (
+            video_id TEXT PRIMARY KEY,
+            info TEXT NOT NULL,
+            stats_fetched_at REAL NOT NULL
+        )
+    """
+    
+    def __init__(self, path=VIDEO_CACHE_PATH, stats_ttl_hours=VIDEO_CACHE_STATS_TTL_HOURS):
+        super().__init__(path)
+        self.stats_ttl = stats_ttl_hours * 3600
+    
+    def _load(self, video_id):
+        """Load a cached record as (info, stats_fetched_at)."""
+        try:
+            row = self._connection().execute(
+                "SELECT info, stats_fetched_at FROM video_metadata WHERE video_id = ?",
+                (video_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Video cache read failed for {video_id}: {e}")
+            return None
+        
+        if not row:
+            return None
+        return json.loads(row[0]), row[1]
+    
+    def get(self, video_id):
+        """Get a cached info record if its stats are still fresh."""
+        record = self._load(video_id)
+        
+        if record is None:
+            self._count('misses')
+            return None
+        
+        info, stats_fetched_at = record
+        if time.time() - stats_fetched_at > self.stats_ttl:
+            self._count('expired')
+            return None
+        
+        self._count('hits')
+        return info
+    
+    def get_stable(self, video_id):
+        """Get only the stable fields of a cached record, regardless of age."""
+        record = self._load(video_id)
+        if record is None:
+            return None
+        
+        info = record[0]
+        return {field: info[field] for field in STABLE_FIELDS if field in info}
+    
+    def put(self, video_id, info):
+        """Store a trimmed info record, marking its stats as fetched now."""
+        if not info:
+            return
+        
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO video_metadata (video_id, info, stats_fetched_at) VALUES (?, ?, ?)",
+                (video_id, json.dumps(info), time.time())
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Video cache write failed for {video_id}: {e}")
+    
+    def get_or_extract(self, video_id, extract):
+        """Serve a video from the cache, calling extract() only when missing or stale."""
+        return self._get_or_fetch(extract, video_id)
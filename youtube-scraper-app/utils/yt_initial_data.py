@@ -0,0 +1,73 @@
+"""Fast extraction of the ytInitialData JSON embedded in YouTube pages."""
+
+import json
+
+# Assignments YouTube has used for the initial data, most common first
+INITIAL_DATA_MARKERS = (
+    b'var ytInitialData = ',
+    b'window["ytInitialData"] = ',
+    b'ytInitialData = ',
+)
+
+# ytcfg values needed to call the youtubei API the page itself uses
+INNERTUBE_KEY_MARKER = b'"INNERTUBE_API_KEY":"'
+INNERTUBE_CONTEXT_MARKER = b'"INNERTUBE_CONTEXT":'
+
+# The context object is a few KB; never decode more than this after its marker
+INNERTUBE_CONTEXT_MAX_BYTES = 65536
+
+_decoder = json.JSONDecoder()
+
+
+def extract_initial_data(content):
+    """Decode ytInitialData from a raw page (bytes or str), or return None.
+    
+    Scans the bytes for the assignment and decodes only the span up to the
+    end of its <script> tag; raw_decode stops at the end of the JSON value,
+    so the trailing ';' and anything after it are never parsed.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    for marker in INITIAL_DATA_MARKERS:
+        start = content.find(marker)
+        if start != -1:
+            start += len(marker)
+            break
+    else:
+        return None
+    
+    end = content.find(b'</script>', start)
+    span = content[start:end if end != -1 else len(content)]
+    
+    try:
+        data, _ = _decoder.raw_decode(span.decode('utf-8', errors='replace'))
+    except ValueError:
+        return None
+    
+    return data if isinstance(data, dict) else None
+
+
+def extract_innertube_config(content):
+    """Get (api_key, context) from a page's ytcfg, or None if either is missing."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    key_start = content.find(INNERTUBE_KEY_MARKER)
+    context_start = content.find(INNERTUBE_CONTEXT_MARKER)
+    if key_start == -1 or context_start == -1:
+        return None
+    
+    key_start += len(INNERTUBE_KEY_MARKER)
+    api_key = content[key_start:content.find(b'"', key_start)].decode('ascii', errors='ignore')
+    
+    context_start += len(INNERTUBE_CONTEXT_MARKER)
+    span = content[context_start:context_start + INNERTUBE_CONTEXT_MAX_BYTES]
+    try:
+        context, _ = _decoder.raw_decode(span.decode('utf-8', errors='replace'))
+    except ValueError:
+        return None
+    
+    if not api_key or not isinstance(context, dict):
+        return None
+    return api_key, context
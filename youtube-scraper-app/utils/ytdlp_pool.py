@@ -0,0 +1,116 @@
+"""Thread-local pool of long-lived yt-dlp instances."""
+
+import logging
+import threading
+import time
+import yt_dlp
+from utils.counters import CountersMixin
+
+logger = logging.getLogger(__name__)
+
+
+class _ErrorCapturingLogger:
+    """yt-dlp logger that remembers each thread's last error.
+
+    With 'ignoreerrors' yt-dlp reports failures (including HTTP 429) only
+    through its logger, so this is how callers learn a request failed.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        self._local.last_error = msg
+        logger.debug(msg)
+
+    def pop(self):
+        error = getattr(self._local, 'last_error', None)
+        self._local.last_error = None
+        return error
+
+
+class YoutubeDLPool(CountersMixin):
+    """Keeps one warm YoutubeDL instance per worker thread.
+
+    Building a YoutubeDL re-initializes every extractor, the cookie jar and
+    the HTTP opener, so ThreadPoolExecutor workers reuse their own instance
+    for every search term instead of constructing one per call.
+    """
+
+    COUNTERS = ('instances_created', 'instances_reused', 'setup_seconds')
+
+    def __init__(self, ydl_opts):
+        self.ydl_opts = ydl_opts
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instances = []
+        self._error_logger = _ErrorCapturingLogger()
+
+        # Setup timing statistics
+        self.instances_created = 0
+        self.instances_reused = 0
+        self.setup_seconds = 0.0
+
+    def get(self):
+        """Get the calling thread's YoutubeDL instance, creating it on first use."""
+        ydl = getattr(self._local, 'ydl', None)
+
+        if ydl is not None:
+            with self._lock:
+                self.instances_reused += 1
+            return ydl
+
+        start = time.perf_counter()
+        ydl = yt_dlp.YoutubeDL({**self.ydl_opts, 'logger': self._error_logger})
+        elapsed = time.perf_counter() - start
+
+        self._local.ydl = ydl
+        with self._lock:
+            self._instances.append(ydl)
+            self.instances_created += 1
+            self.setup_seconds += elapsed
+
+        logger.debug(f"Created YoutubeDL instance for {threading.current_thread().name} in {elapsed * 1000:.1f}ms")
+        return ydl
+
+    def pop_error(self):
+        """Get (and clear) the last error yt-dlp reported on the calling thread."""
+        return self._error_logger.pop()
+
+    def close_all(self):
+        """Close every instance handed out by this pool."""
+        with self._lock:
+            instances = self._instances
+            self._instances = []
+
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception as e:
+                logger.debug(f"Failed to close YoutubeDL instance: {e}")
+
+        # Threads that outlive this call must build a fresh instance next time
+        self._local = threading.local()
+
+    def get_stats(self):
+        """Get instance reuse statistics."""
+        avg_setup = self.setup_seconds / self.instances_created if self.instances_created else 0.0
+        uses = self.instances_created + self.instances_reused
+        saved = avg_setup * self.instances_reused
+
+        return {
+            'instances_created': self.instances_created,
+            'instances_reused': self.instances_reused,
+            'avg_setup_ms': round(avg_setup * 1000, 2),
+            'setup_ms_saved': round(saved * 1000, 2),
+            'setup_ms_saved_per_term': round(saved * 1000 / uses, 2) if uses else 0.0,
+        }
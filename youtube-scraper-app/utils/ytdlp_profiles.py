@@ -0,0 +1,87 @@
+"""Shared yt-dlp option profiles and info-dict trimming."""
+
+from config.settings import YTDLP_CACHE_DIR
+
+# Fields read by _extract_video_data, _extract_enhanced_metadata and the scorers
+METADATA_FIELDS = (
+    'id', 'title', 'description', 'thumbnail', 'uploader', 'channel_id',
+    'channel_follower_count', 'upload_date', 'duration', 'view_count',
+    'like_count', 'comment_count', 'tags', 'subtitles', 'chapters',
+)
+
+# Options used before the metadata-only profile existed (kept for benchmarks)
+LEGACY_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'skip_download': True,
+    'format': 'best',
+    'socket_timeout': 30,
+    'retries': 3,
+    'fragment_retries': 3,
+    'ignoreerrors': True,
+    'no_color': True,
+}
+
+
+def metadata_only_opts(**overrides):
+    """Build yt-dlp options that never resolve formats or fetch manifests."""
+    opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': False,
+        'skip_download': True,
+        'socket_timeout': 30,
+        'retries': 3,
+        'ignoreerrors': True,
+        'no_color': True,
+        # We never download, so a missing/unselectable format is not an error
+        'ignore_no_formats_error': True,
+        'check_formats': False,
+        'writesubtitles': False,
+        'writeautomaticsub': False,
+        'writeinfojson': False,
+        'getcomments': False,
+        # Skip DASH/HLS manifests and player JS (only needed to build stream URLs)
+        'extractor_args': {
+            'youtube': {
+                'skip': ['dash', 'hls', 'translated_subs'],
+                'player_skip': ['js'],
+            }
+        },
+        # One persistent cache shared by every worker
+        'cachedir': YTDLP_CACHE_DIR,
+    }
+    opts.update(overrides)
+    return opts
+
+
+def trim_info(info):
+    """Reduce a yt-dlp info dict to the fields our records actually use."""
+    if not info:
+        return None
+
+    trimmed = {field: info.get(field) for field in METADATA_FIELDS if info.get(field) is not None}
+
+    # Unprocessed results only carry the thumbnails list
+    if 'thumbnail' not in trimmed and info.get('thumbnails'):
+        trimmed['thumbnail'] = info['thumbnails'][-1].get('url', '')
+
+    # Scorers only check whether subtitles exist, keep the language codes
+    if 'subtitles' in trimmed:
+        trimmed['subtitles'] = sorted(trimmed['subtitles'])
+
+    if 'chapters' in trimmed:
+        trimmed['chapters'] = [
+            {'title': chapter.get('title'), 'start_time': chapter.get('start_time')}
+            for chapter in trimmed['chapters']
+        ]
+
+    return trimmed
+
+
+def extract_metadata(ydl, video_id, process=False):
+    """Extract a single video's trimmed metadata, by default without format processing."""
+    # process=False returns the raw extractor result: no format sorting or selection
+    info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False, process=process)
+    return trim_info(info)